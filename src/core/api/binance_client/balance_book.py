@@ -0,0 +1,84 @@
+# src/core/api/binance_client/balance_book.py
+import threading
+import time
+import weakref
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+from binance import Client
+from src.core.settings.config import BALANCE_CACHE_TTL, USER_STREAM_BALANCE_TTL
+
+
+class BalanceBook:
+  """Кэш балансов аккаунта, проиндексированных по активу.
+  В режиме live балансы обновляются событиями user data stream,
+  а REST-снимок запрашивается как страховка раз в live_ttl: события приходят
+  только при изменении баланса, поэтому зависший поток по ним не обнаружить."""
+
+  def __init__(self, client: Client, ttl: float = BALANCE_CACHE_TTL, live_ttl: float = USER_STREAM_BALANCE_TTL):
+    self.client = client
+    self.ttl = ttl
+    self.live_ttl = live_ttl
+    self._live = False
+    self._balances: Dict[str, Dict[str, Decimal]] = {}
+    self._stamp = float('-inf')
+    self._lock = threading.Lock()
+
+  def _refresh(self) -> None:
+    account = self.client.get_account()
+    self._balances = {
+      item['asset']: {
+        'free': Decimal(item['free']),
+        'locked': Decimal(item.get('locked', '0'))
+      }
+      for item in account['balances']
+    }
+    self._stamp = time.monotonic()
+
+  def get(self, asset: str) -> Optional[Dict[str, Decimal]]:
+    """Баланс актива ({'free', 'locked'}) из кэша; при устаревании кэш обновляется.
+    Исключения API пробрасываются вызывающему коду."""
+    with self._lock:
+      ttl = self.live_ttl if self._live else self.ttl
+      if time.monotonic() - self._stamp > ttl:
+        self._refresh()
+      return self._balances.get(asset)
+
+  def is_fresh(self) -> bool:
+    """Будет ли get() обслужен из кэша без запроса /api/v3/account"""
+    ttl = self.live_ttl if self._live else self.ttl
+    return time.monotonic() - self._stamp <= ttl
+
+  def invalidate(self) -> None:
+    """Сброс кэша (например, после исполнения ордера)"""
+    with self._lock:
+      self._stamp = float('-inf')
+
+  def apply_updates(self, balances: Iterable[Dict[str, str]]) -> None:
+    """Применение балансов из события outboundAccountPosition ({'a', 'f', 'l'})"""
+    with self._lock:
+      for item in balances:
+        self._balances[item['a']] = {
+          'free': Decimal(item['f']),
+          'locked': Decimal(item['l'])
+        }
+
+  def set_live(self, live: bool) -> None:
+    """Включение/выключение режима обновления через user data stream"""
+    with self._lock:
+      self._live = live
+      if not live:
+        self._stamp = float('-inf')  # Поток прерван - следующее чтение берёт свежий снимок
+
+
+# Один кэш балансов на клиента: его видят и fetcher, и executor, и user data stream
+_BOOKS: 'weakref.WeakKeyDictionary[Client, BalanceBook]' = weakref.WeakKeyDictionary()
+_BOOKS_LOCK = threading.Lock()
+
+
+def get_balance_book(client: Client) -> BalanceBook:
+  with _BOOKS_LOCK:
+    book = _BOOKS.get(client)
+    if book is None:
+      book = _BOOKS[client] = BalanceBook(client)
+    return book
@@ -1,33 +1,79 @@
 # src/core/api/binance_client/info_fetcher.py
+import functools
 import json
+import threading
+import time
 from binance import Client, exceptions
 from decimal import Decimal
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
+from src.core.api.binance_client.balance_book import get_balance_book
+from src.core.api.binance_client.price_book import get_price_book
+from src.core.api.binance_client.rest_client import get_rest_client
+from src.core.api.binance_client.symbol_spec import SymbolSpec, build_symbol_spec
+from src.core.paths import EXCHANGE_CACHE
+from src.core.settings.config import (
+  BINANCE_API_KEY,
+  BINANCE_SECRET_KEY,
+  TESTNET,
+  EXCHANGE_INFO_CACHE_TTL,
+  SYMBOLS_INFO_DISK_TTL
+)
+
+# Общий для процесса кэш обработанных symbols_info: testnet -> (время загрузки, данные)
+_EXCHANGE_INFO_CACHE: Dict[bool, Tuple[float, Dict[str, Dict]]] = {}
+_EXCHANGE_INFO_LOCK = threading.Lock()
+# Каталог дискового кэша symbols_info, переживающего перезапуск процесса
+_SYMBOLS_CACHE_DIR = EXCHANGE_CACHE
+# Поля фильтров, которые хранятся в JSON строками и восстанавливаются в Decimal
+_DECIMAL_FILTER_FIELDS = (
+  ('LOT_SIZE', 'minQty'),
+  ('LOT_SIZE', 'stepSize'),
+  ('PRICE_FILTER', 'tickSize'),
+  ('NOTIONAL', 'minNotional')
+)
 
 
 class BinanceInfoFetcher:
-  def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
-    self.client = Client(
-      api_key=api_key,
-      api_secret=api_secret,
-      testnet=testnet
-    )
+  def __init__(self, api_key: str, api_secret: str, testnet: bool = True, client: Optional[Client] = None):
+    self.client = client if client is not None else get_rest_client(api_key, api_secret, testnet)
+    self.testnet = testnet
     self.symbols_info = {}
+    self._symbol_specs: Dict[str, SymbolSpec] = {}
+    self._price_book = get_price_book(self.client)
+    self._balance_book = get_balance_book(self.client)
     self.logger = logging.getLogger(self.__class__.__name__)
     self._load_symbols_info()
 
   def _load_symbols_info(self) -> None:
-    """Загрузка и обработка информации о торговых парах"""
+    """Загрузка и обработка информации о торговых парах (с общим TTL-кэшем)"""
     try:
-      exchange_info = self.client.get_exchange_info()
-      self.symbols_info = {}
+      with _EXCHANGE_INFO_LOCK:
+        cached = _EXCHANGE_INFO_CACHE.get(self.testnet)
+        if cached and time.monotonic() - cached[0] < EXCHANGE_INFO_CACHE_TTL:
+          self.symbols_info = cached[1]
+          self._symbol_specs = {}
+          return
+
+        symbols_info = self._read_disk_cache()
+        if symbols_info is None:
+          exchange_info = self.client.get_exchange_info()
+          symbols_info = {}
+
+          for symbol_info in exchange_info['symbols']:
+            processed = self._process_symbol(symbol_info)
+            if processed:
+              symbols_info[symbol_info['symbol']] = processed
 
-      for symbol_info in exchange_info['symbols']:
-        processed = self._process_symbol(symbol_info)
-        if processed:
-          self.symbols_info[symbol_info['symbol']] = processed
+          # Пустой ответ не кэшируем, чтобы следующая попытка снова сходила в API
+          if symbols_info:
+            self._write_disk_cache(symbols_info)
+
+        self.symbols_info = symbols_info
+        self._symbol_specs = {}
+        if symbols_info:
+          _EXCHANGE_INFO_CACHE[self.testnet] = (time.monotonic(), symbols_info)
 
       self.logger.info(f"Loaded info for {len(self.symbols_info)} symbols")
 
@@ -38,9 +84,71 @@ class BinanceInfoFetcher:
       self.logger.critical(f"Symbols load failed: {str(e)}")
       raise
 
+  def _disk_cache_path(self) -> Path:
+    """Путь к файлу дискового кэша (отдельный для testnet и основной сети)"""
+    network = 'testnet' if self.testnet else 'mainnet'
+    return _SYMBOLS_CACHE_DIR / f"symbols_info_{network}.json"
+
+  def _read_disk_cache(self) -> Optional[Dict[str, Dict]]:
+    """Чтение symbols_info с диска, если файл не старше SYMBOLS_INFO_DISK_TTL"""
+    path = self._disk_cache_path()
+    try:
+      if time.time() - path.stat().st_mtime >= SYMBOLS_INFO_DISK_TTL:
+        return None
+      symbols_info = json.loads(path.read_bytes())
+      if not isinstance(symbols_info, dict) or not symbols_info:
+        return None
+      # JSON не сохраняет Decimal: значения фильтров записаны строками
+      for info in symbols_info.values():
+        filters = info['filters']
+        for filter_type, field in _DECIMAL_FILTER_FIELDS:
+          filters[filter_type][field] = Decimal(filters[filter_type][field])
+    except FileNotFoundError:
+      return None
+    except Exception as e:
+      self.logger.warning(f"Symbols disk cache unreadable, ignoring: {str(e)}")
+      return None
+    self.logger.debug(f"Symbols info loaded from disk cache {path}")
+    return symbols_info
+
+  def _write_disk_cache(self, symbols_info: Dict[str, Dict]) -> None:
+    """Атомарная запись symbols_info на диск (ошибки записи не критичны)"""
+    path = self._disk_cache_path()
+    tmp_path = path.with_suffix('.tmp')
+    try:
+      # Decimal пишется строкой без потери точности
+      tmp_path.write_text(json.dumps(symbols_info, default=str))
+      tmp_path.replace(path)
+    except OSError as e:
+      self.logger.warning(f"Failed to write symbols disk cache: {str(e)}")
+
   def _process_symbol(self, raw_info: Dict) -> Optional[Dict]:
     try:
-      filters = {f['filterType']: f for f in raw_info['filters']}
+      # Один проход по фильтрам: берём только используемые типы и выходим, как только нашли все три.
+      # MIN_NOTIONAL (старый API) используется, только если у символа нет NOTIONAL
+      lot_size = price_filter = notional = min_notional = None
+      for f in raw_info['filters']:
+        filter_type = f['filterType']
+        if filter_type == 'LOT_SIZE':
+          lot_size = f
+        elif filter_type == 'PRICE_FILTER':
+          price_filter = f
+        elif filter_type == 'NOTIONAL':
+          notional = f
+        elif filter_type == 'MIN_NOTIONAL':
+          min_notional = f
+          continue
+        else:
+          continue
+        if lot_size and price_filter and notional:
+          break
+      lot_size = lot_size or {}
+      price_filter = price_filter or {}
+      if notional is not None:
+        apply_to_market = notional.get('applyToMarket', False)
+      else:
+        notional = min_notional or {}
+        apply_to_market = notional.get('applyMinToMarket', False)  # Старое имя поля
 
       processed = {
         'symbol': raw_info['symbol'],
@@ -48,15 +156,15 @@ class BinanceInfoFetcher:
         'quote_asset': raw_info['quoteAsset'],
         'filters': {
           'LOT_SIZE': {
-            'minQty': Decimal(filters.get('LOT_SIZE', {}).get('minQty', '0.001')),
-            'stepSize': Decimal(filters.get('LOT_SIZE', {}).get('stepSize', '0.001'))
+            'minQty': Decimal(lot_size.get('minQty', '0.001')),
+            'stepSize': Decimal(lot_size.get('stepSize', '0.001'))
           },
           'PRICE_FILTER': {
-            'tickSize': Decimal(filters.get('PRICE_FILTER', {}).get('tickSize', '0.01'))
+            'tickSize': Decimal(price_filter.get('tickSize', '0.01'))
           },
           'NOTIONAL': {
-            'minNotional': Decimal(filters.get('NOTIONAL', {}).get('minNotional', '5.0')),
-            'applyToMarket': filters.get('NOTIONAL', {}).get('applyToMarket', False)
+            'minNotional': Decimal(notional.get('minNotional', '5.0')),
+            'applyToMarket': apply_to_market
           }
         }
       }
@@ -65,31 +173,39 @@ class BinanceInfoFetcher:
       self.logger.error(f"Critical symbol processing error: {str(e)}")
       return None
 
-  def _get_min_notional(self, filters: Dict, symbol: str) -> Decimal:
-    """Получение минимальной суммы ордера с фолбэком"""
-    try:
-      if 'MIN_NOTIONAL' in filters:
-        return Decimal(filters['MIN_NOTIONAL']['minNotional'])
-      if 'NOTIONAL' in filters:  # Для новых версий API
-        return Decimal(filters['NOTIONAL']['minNotional'])
-
-      # Фолбэк значение
-      self.logger.info(f"Using default MIN_NOTIONAL=5 for {symbol}")
-      return Decimal('5')
-
-    except Exception as e:
-      self.logger.warning(f"MinNotional error for {symbol}: {str(e)}")
-      return Decimal('5')
+  def refresh(self) -> None:
+    """Сброс кэша и повторная загрузка информации о торговых парах"""
+    with _EXCHANGE_INFO_LOCK:
+      _EXCHANGE_INFO_CACHE.pop(self.testnet, None)
+      self._disk_cache_path().unlink(missing_ok=True)
+      # Общий клиент кэширует сырой exchangeInfo - его тоже нужно сбросить
+      invalidate = getattr(self.client, 'invalidate_exchange_info', None)
+      if invalidate is not None:
+        invalidate()
+    self._load_symbols_info()
 
   def get_symbol_info(self, symbol: str) -> Optional[Dict]:
     """Получение информации о символе"""
     return self.symbols_info.get(symbol)
 
+  def get_symbol_spec(self, symbol: str) -> Optional[SymbolSpec]:
+    """Плоское неизменяемое описание правил символа (строится один раз на символ)"""
+    spec = self._symbol_specs.get(symbol)
+    if spec is None:
+      info = self.symbols_info.get(symbol)
+      if not info:
+        return None
+      spec = build_symbol_spec(symbol, info['base_asset'], info['quote_asset'], info['filters'])
+      self._symbol_specs[symbol] = spec
+    return spec
+
   def get_current_price(self, symbol: str) -> Optional[Decimal]:
     """Получение текущей цены"""
     try:
-      ticker = self.client.get_symbol_ticker(symbol=symbol)
-      return Decimal(ticker['price'])
+      price = self._price_book.get(symbol)
+      if price is None:
+        self.logger.error(f"Price not found for {symbol}")
+      return price
     except exceptions.BinanceAPIException as e:
       self.logger.error(f"Price error: {e.status_code} {e.message}")
       return None
@@ -100,14 +216,7 @@ class BinanceInfoFetcher:
   def get_asset_balance(self, asset: str) -> Optional[Dict[str, Decimal]]:
     """Получение баланса актива"""
     try:
-      account = self.client.get_account()
-      for balance in account['balances']:
-        if balance['asset'] == asset:
-          return {
-            'free': Decimal(balance['free']),
-            'locked': Decimal(balance['locked'])
-          }
-      return None
+      return self._balance_book.get(asset)
     except exceptions.BinanceAPIException as e:
       self.logger.error(f"Balance error: {e.status_code} {e.message}")
       return None
@@ -115,6 +224,28 @@ class BinanceInfoFetcher:
       self.logger.error(f"Balance check failed: {str(e)}")
       return None
 
+  def get_price_and_balance(self, symbol: str, asset: str) -> Dict[str, Optional[Decimal]]:
+    """
+    Цена символа и свободный баланс актива одним вызовом: {'price', 'free'}.
+    Оба значения читаются из общих кэшей клиента (PriceBook/BalanceBook), а при
+    работающих потоках - прямо из памяти. Недоступное значение возвращается как None.
+    """
+    balance = self.get_asset_balance(asset)
+    return {
+      'price': self.get_current_price(symbol),
+      'free': balance['free'] if balance else None
+    }
+
   def get_exchange_info(self) -> Dict[str, Any]:
     """Получение полной информации о бирже (для дебага)"""
-    return self.client.get_exchange_info()
\ No newline at end of file
+    return self.client.get_exchange_info()
+
+
+@functools.lru_cache(maxsize=None)
+def get_info_fetcher(
+  api_key: str = BINANCE_API_KEY,
+  api_secret: str = BINANCE_SECRET_KEY,
+  testnet: bool = TESTNET
+) -> BinanceInfoFetcher:
+  """Общий для процесса BinanceInfoFetcher: один клиент, пул соединений и кэши на набор ключей"""
+  return BinanceInfoFetcher(api_key=api_key, api_secret=api_secret, testnet=testnet)
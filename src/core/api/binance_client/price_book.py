@@ -0,0 +1,72 @@
+# src/core/api/binance_client/price_book.py
+import threading
+import time
+import weakref
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+
+from binance import Client
+from src.core.settings.config import PRICE_CACHE_TTL, LIVE_PRICE_MAX_AGE
+
+
+class PriceBook:
+  """Кэш цен всех символов, загружаемых одним запросом /api/v3/ticker/price.
+  Цены из websocket-потока (apply_quote) имеют приоритет, пока не старше live_max_age."""
+
+  def __init__(self, client: Client, ttl: float = PRICE_CACHE_TTL, live_max_age: float = LIVE_PRICE_MAX_AGE):
+    self.client = client
+    self.ttl = ttl
+    self.live_max_age = live_max_age
+    self._prices: Dict[str, Decimal] = {}
+    self._live_prices: Dict[str, Tuple[float, Decimal]] = {}
+    self._stamp = float('-inf')
+    self._lock = threading.Lock()
+
+  def _refresh(self) -> None:
+    tickers = self.client.get_symbol_ticker()
+    self._prices = {item['symbol']: Decimal(item['price']) for item in tickers}
+    self._stamp = time.monotonic()
+
+  def get(self, symbol: str) -> Optional[Decimal]:
+    """Цена символа из кэша; при устаревании кэш обновляется целиком.
+    Исключения API пробрасываются вызывающему коду."""
+    live = self._live_prices.get(symbol)
+    if live is not None and time.monotonic() - live[0] <= self.live_max_age:
+      return live[1]
+    with self._lock:
+      if time.monotonic() - self._stamp > self.ttl:
+        self._refresh()
+      return self._prices.get(symbol)
+
+  def is_fresh(self, symbol: str) -> bool:
+    """Будет ли get(symbol) обслужен из памяти без запроса к API"""
+    now = time.monotonic()
+    live = self._live_prices.get(symbol)
+    if live is not None and now - live[0] <= self.live_max_age:
+      return True
+    return now - self._stamp <= self.ttl
+
+  def invalidate(self) -> None:
+    with self._lock:
+      self._stamp = float('-inf')
+
+  def apply_quote(self, symbol: str, price: Decimal) -> None:
+    """Цена из websocket-потока (например, середина спреда bookTicker)"""
+    self._live_prices[symbol] = (time.monotonic(), price)
+
+  def clear_live(self) -> None:
+    """Сброс потоковых цен (поток остановлен или прерван)"""
+    self._live_prices = {}
+
+
+# Один кэш цен на клиента: его видят и fetcher, и executor, и ценовой поток
+_BOOKS: 'weakref.WeakKeyDictionary[Client, PriceBook]' = weakref.WeakKeyDictionary()
+_BOOKS_LOCK = threading.Lock()
+
+
+def get_price_book(client: Client) -> PriceBook:
+  with _BOOKS_LOCK:
+    book = _BOOKS.get(client)
+    if book is None:
+      book = _BOOKS[client] = PriceBook(client)
+    return book
@@ -0,0 +1,54 @@
+# src/core/api/binance_client/price_stream.py
+import logging
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+from binance import Client, ThreadedWebsocketManager
+from src.core.api.binance_client.price_book import PriceBook, get_price_book
+
+
+class PriceStream:
+  """
+  Поток bookTicker по отслеживаемым символам: середина спреда сразу
+  попадает в общий PriceBook клиента, поэтому цена для проверок ордера
+  читается из памяти без запроса /api/v3/ticker/price.
+  """
+
+  def __init__(self, client: Client, symbols: Iterable[str], price_book: Optional[PriceBook] = None):
+    self.client = client
+    self.symbols = list(symbols)
+    self.price_book = price_book if price_book is not None else get_price_book(client)
+    self._manager: Optional[ThreadedWebsocketManager] = None
+    self.logger = logging.getLogger(self.__class__.__name__)
+
+  def start(self) -> None:
+    if self._manager is not None:
+      return
+    manager = ThreadedWebsocketManager(testnet=self.client.testnet)
+    self._manager = manager
+    manager.start()
+    manager.start_multiplex_socket(
+      callback=self._handle_message,
+      streams=[f"{symbol.lower()}@bookTicker" for symbol in self.symbols]
+    )
+    self.logger.info(f"Price stream started for {len(self.symbols)} symbols")
+
+  def stop(self) -> None:
+    self.price_book.clear_live()
+    if self._manager is not None:
+      self._manager.stop()
+      self._manager = None
+      self.logger.info("Price stream stopped")
+
+  def _handle_message(self, msg: Dict) -> None:
+    data = msg.get('data', msg)
+    if data.get('e') == 'error':
+      # Без потока цены снова читаются через REST
+      self.logger.warning(f"Price stream error, falling back to REST prices: {data.get('m')}")
+      self.price_book.clear_live()
+      return
+    try:
+      mid_price = (Decimal(data['b']) + Decimal(data['a'])) / 2
+      self.price_book.apply_quote(data['s'], mid_price)
+    except (KeyError, ArithmeticError) as e:
+      self.logger.debug("Skipping malformed bookTicker message %s: %s", msg, e)
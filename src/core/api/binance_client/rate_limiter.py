@@ -0,0 +1,53 @@
+# src/core/api/binance_client/rate_limiter.py
+import threading
+import time
+
+from src.core.settings.config import REQUEST_WEIGHT_LIMIT, REQUEST_WEIGHT_WINDOW
+
+
+class RequestWeightLimiter:
+  """
+  Token bucket по весу запросов Binance (лимит REQUEST_WEIGHT на IP).
+  Токены восполняются равномерно; перед запросом вызывающий поток ждёт
+  ровно столько, сколько нужно, вместо получения 429/418 и бана на минуты.
+  С весом 1 на запрос служит и обычным ограничителем темпа (запросы к TradingView).
+  """
+
+  def __init__(self, limit: int = REQUEST_WEIGHT_LIMIT, window: float = REQUEST_WEIGHT_WINDOW):
+    self.limit = limit
+    self.rate = limit / window
+    self._tokens = float(limit)
+    self._updated = time.monotonic()
+    self._blocked_until = 0.0
+    self._lock = threading.Lock()
+
+  def _refill(self, now: float) -> None:
+    self._tokens = min(self.limit, self._tokens + (now - self._updated) * self.rate)
+    self._updated = now
+
+  def acquire(self, weight: int = 1) -> None:
+    """Блокирует поток, пока в корзине не наберётся weight токенов"""
+    weight = min(weight, self.limit)
+    while True:
+      with self._lock:
+        now = time.monotonic()
+        self._refill(now)
+        wait = self._blocked_until - now
+        if wait <= 0:
+          if self._tokens >= weight:
+            self._tokens -= weight
+            return
+          wait = (weight - self._tokens) / self.rate
+      time.sleep(wait)
+
+  def update_used_weight(self, used_weight: int) -> None:
+    """Синхронизация с фактическим весом из заголовка X-MBX-USED-WEIGHT-1M
+    (учитывает запросы других процессов с того же IP)"""
+    with self._lock:
+      self._refill(time.monotonic())
+      self._tokens = min(self._tokens, float(self.limit - used_weight))
+
+  def block_for(self, seconds: float) -> None:
+    """Приостановка всех запросов (Retry-After при ответах 429/418)"""
+    with self._lock:
+      self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
@@ -0,0 +1,113 @@
+# src/core/api/binance_client/rest_client.py
+import functools
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from binance import Client
+import orjson
+from requests.adapters import HTTPAdapter
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from src.core.api.binance_client.rate_limiter import RequestWeightLimiter
+from src.core.settings.config import (
+  BINANCE_API_KEY,
+  BINANCE_SECRET_KEY,
+  TESTNET,
+  RATE_LIMIT_BACKOFF,
+  HTTP_POOL_MAXSIZE,
+  EXCHANGE_INFO_CACHE_TTL
+)
+
+
+# Вес эндпоинтов, которые вызывает бот (остальные считаются с весом 1)
+ENDPOINT_WEIGHTS = {
+  '/api/v3/exchangeInfo': 20,
+  '/api/v3/myTrades': 20,
+  '/api/v3/account': 20,
+  '/api/v3/ticker/price': 4,
+  '/api/v3/order': 1,
+}
+
+# Лимит веса считается Binance на IP, поэтому корзина общая для всех клиентов процесса
+_WEIGHT_LIMITER = RequestWeightLimiter()
+
+
+def endpoint_weight(uri: str) -> int:
+  return ENDPOINT_WEIGHTS.get(urlsplit(uri).path, 1)
+
+
+class BinanceRestClient(Client):
+  """Клиент Binance с разбором JSON-ответов через orjson
+  и учётом веса запросов через общий token bucket"""
+
+  weight_limiter: RequestWeightLimiter = _WEIGHT_LIMITER
+
+  def __init__(self, *args, **kwargs):
+    self._exchange_info: Optional[Tuple[float, Dict]] = None
+    self._exchange_info_lock = threading.Lock()
+    super().__init__(*args, **kwargs)
+
+  def get_exchange_info(self) -> Dict:
+    """exchangeInfo (вес 20, больше 1 МБ) кэшируется на EXCHANGE_INFO_CACHE_TTL:
+    BinanceInfoFetcher, TransactionsExecutor и get_symbol_info используют одну загрузку"""
+    with self._exchange_info_lock:
+      cached = self._exchange_info
+      if cached is not None and time.monotonic() - cached[0] < EXCHANGE_INFO_CACHE_TTL:
+        return cached[1]
+      exchange_info = super().get_exchange_info()
+      if exchange_info.get('symbols'):
+        self._exchange_info = (time.monotonic(), exchange_info)
+      return exchange_info
+
+  def invalidate_exchange_info(self) -> None:
+    """Сброс кэша exchangeInfo (следующий запрос снова сходит в API)"""
+    with self._exchange_info_lock:
+      self._exchange_info = None
+
+  def _init_session(self):
+    session = super()._init_session()
+    # Пул рассчитан на параллельные запросы из нескольких потоков через один общий клиент
+    adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.hooks['response'].append(self._track_weight)
+    return session
+
+  def _request(self, method, uri: str, signed: bool, force_params: bool = False, **kwargs):
+    self.weight_limiter.acquire(endpoint_weight(uri))
+    return super()._request(method, uri, signed, force_params, **kwargs)
+
+  def _track_weight(self, response, *args, **kwargs) -> None:
+    """Хук requests: синхронизирует корзину с X-MBX-USED-WEIGHT-1M и Retry-After"""
+    headers = response.headers
+    used_weight = headers.get('x-mbx-used-weight-1m')
+    if used_weight:
+      self.weight_limiter.update_used_weight(int(used_weight))
+    if response.status_code in (418, 429):
+      retry_after = headers.get('Retry-After')
+      self.weight_limiter.block_for(float(retry_after) if retry_after else RATE_LIMIT_BACKOFF)
+
+  @staticmethod
+  def _handle_response(response):
+    if not (200 <= response.status_code < 300):
+      raise BinanceAPIException(response, response.status_code, response.text)
+
+    content = response.content
+    if not content:
+      return {}
+
+    try:
+      return orjson.loads(content)
+    except ValueError:
+      raise BinanceRequestException(f"Invalid Response: {response.text}")
+
+
+@functools.lru_cache(maxsize=None)
+def get_rest_client(
+  api_key: str = BINANCE_API_KEY,
+  api_secret: str = BINANCE_SECRET_KEY,
+  testnet: bool = TESTNET
+) -> BinanceRestClient:
+  """Общий для процесса клиент: один requests.Session и пул keep-alive соединений на набор ключей"""
+  return BinanceRestClient(api_key=api_key, api_secret=api_secret, testnet=testnet)
@@ -0,0 +1,109 @@
+# src/core/api/binance_client/symbol_spec.py
+import functools
+import math
+from decimal import Decimal
+from typing import Dict, NamedTuple, Tuple
+
+
+class SymbolSpec(NamedTuple):
+  """Плоское неизменяемое описание торговых правил символа"""
+  symbol: str
+  base_asset: str
+  quote_asset: str
+  min_qty: Decimal
+  step_size: Decimal      # Нормализованный stepSize из LOT_SIZE
+  tick_size: Decimal      # Нормализованный tickSize из PRICE_FILTER
+  min_notional: Decimal
+  apply_to_market: bool
+  qty_scale: int          # 10**(знаков после запятой в step_size)
+  step_units: int         # step_size в единицах 1/qty_scale
+  price_scale: int        # 10**(знаков после запятой в tick_size)
+  tick_units: int         # tick_size в единицах 1/price_scale
+  min_qty_float: float       # min_qty для проверок на горячем пути без Decimal -> float
+  min_notional_float: float  # min_notional для проверок на горячем пути без Decimal -> float
+
+
+def _scaled_units(step: Decimal) -> Tuple[int, int]:
+  """Представление шага целыми числами: (масштаб, шаг в единицах 1/масштаб)"""
+  exponent = step.as_tuple().exponent
+  if exponent >= 0:
+    return 1, int(step)
+  return 10 ** -exponent, int(step.scaleb(-exponent))
+
+
+def _as_decimal(value) -> Decimal:
+  """Значения фильтров из BinanceInfoFetcher уже Decimal - пересоздаём только строки и числа"""
+  return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_step(raw) -> Tuple[Decimal, int, int]:
+  """Разбор stepSize/tickSize: (нормализованный шаг, масштаб, шаг в единицах).
+  Различных значений шагов на бирже немного, поэтому разбор кэшируется по строке."""
+  step = _as_decimal(raw).normalize()
+  return (step,) + _scaled_units(step)
+
+
+def floor_to_step(value: float, scale: int, step_units: int) -> float:
+  """
+  Округление вниз до кратного шагу в целочисленной арифметике.
+  Эквивалентно Decimal(str(value)).quantize(step, ROUND_DOWN) для шагов вида 10**k:
+  погрешность представления float (несколько ulp) не приводит к потере шага.
+  """
+  scaled = value * scale
+  units = round(scaled)
+  if abs(scaled - units) > 4 * math.ulp(scaled):
+    units = math.floor(scaled)
+  units -= units % step_units
+  return units / scale
+
+
+def is_step_multiple(value: float, scale: int, step_units: int) -> bool:
+  """
+  Проверка кратности шагу в целочисленной арифметике.
+  Эквивалентно Decimal(str(value)) % step == 0 с тем же допуском, что и floor_to_step.
+  """
+  scaled = value * scale
+  units = round(scaled)
+  if abs(scaled - units) > 4 * math.ulp(scaled):
+    return False
+  return units % step_units == 0
+
+
+def build_symbol_spec(symbol: str, base_asset: str, quote_asset: str, filters: Dict[str, Dict]) -> SymbolSpec:
+  """
+  Построение SymbolSpec из фильтров, сгруппированных по filterType.
+  Значения фильтров могут быть строками (сырой ответ API) или Decimal.
+  Для NOTIONAL/MIN_NOTIONAL учитываются оба варианта API.
+  """
+  lot_size = filters.get('LOT_SIZE', {})
+  price_filter = filters.get('PRICE_FILTER', {})
+
+  if 'NOTIONAL' in filters:
+    notional = filters['NOTIONAL']
+    apply_to_market = notional.get('applyToMarket', True)
+  else:
+    notional = filters.get('MIN_NOTIONAL', {})
+    apply_to_market = notional.get('applyMinToMarket', True)  # Старое имя поля
+
+  step_size, qty_scale, step_units = _parse_step(lot_size.get('stepSize', '0.001'))
+  tick_size, price_scale, tick_units = _parse_step(price_filter.get('tickSize', '0.01'))
+  min_qty = _as_decimal(lot_size.get('minQty', '0.001'))
+  min_notional = _as_decimal(notional.get('minNotional', '5.0'))
+
+  return SymbolSpec(
+    symbol=symbol,
+    base_asset=base_asset,
+    quote_asset=quote_asset,
+    min_qty=min_qty,
+    step_size=step_size,
+    tick_size=tick_size,
+    min_notional=min_notional,
+    apply_to_market=bool(apply_to_market),
+    qty_scale=qty_scale,
+    step_units=step_units,
+    price_scale=price_scale,
+    tick_units=tick_units,
+    min_qty_float=float(min_qty),
+    min_notional_float=float(min_notional)
+  )
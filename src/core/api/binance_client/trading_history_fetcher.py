@@ -1,29 +1,113 @@
 # src/core/api/binance_client/trading_history_fetcher.py
-from binance import Client, exceptions
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+import aiohttp
+from binance import AsyncClient, Client, exceptions
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from heapq import nlargest
+from operator import itemgetter
+from typing import List, Dict, Optional, FrozenSet
 from src.core.settings.config import (
   BINANCE_API_KEY,
   BINANCE_SECRET_KEY,
   TESTNET,
   SYMBOLS,
-  MAX_HISTORY_LIMIT
+  MAX_HISTORY_LIMIT,
+  HISTORY_FETCH_WORKERS,
+  ASYNC_HTTP_POOL_LIMIT
 )
+from src.core.api.binance_client.rest_client import get_rest_client
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Поля сырой сделки Binance в порядке распаковки в _process_trades
+_TRADE_FIELDS = itemgetter(
+  'id', 'symbol', 'price', 'qty', 'quoteQty', 'time', 'isBuyer', 'commission', 'commissionAsset'
+)
+_BY_TIME = itemgetter('time')
+
 
-class BinanceTradingHistoryFetcher:
+class _TradeHistoryBase(ABC):
+  """Общие для синхронного и асинхронного загрузчиков валидация параметров и разбор сделок"""
   MAX_LIMIT = 1000  # Максимальное значение по Binance API
 
   def __init__(self):
-    self._client = Client(
-      api_key=BINANCE_API_KEY,
-      api_secret=BINANCE_SECRET_KEY,
-      testnet=TESTNET
-    )
     self.logger = logging.getLogger(self.__class__.__name__)
+    self._known_symbols: Optional[FrozenSet[str]] = None
+
+  @abstractmethod
+  def _get_known_symbols(self) -> FrozenSet[str]:
+    """Символы, торгуемые на бирже (для проверки параметров запроса)"""
+
+  def _build_params(
+    self,
+    symbol: str,
+    start_time: Optional[datetime],
+    end_time: Optional[datetime],
+    limit: int
+  ) -> Dict:
+    """Валидация и формирование параметров запроса get_my_trades"""
+    self._validate_params(symbol, limit)
+
+    params = {
+      'symbol': symbol,
+      'limit': min(limit, self.MAX_LIMIT)
+    }
+
+    if start_time:
+      params['startTime'] = int(start_time.timestamp() * 1000)
+    if end_time:
+      params['endTime'] = int(end_time.timestamp() * 1000)
+    return params
+
+  def _validate_params(self, symbol: str, limit: int):
+    """Валидация входных параметров"""
+    if symbol not in SYMBOLS:
+      raise ValueError(f"Symbol {symbol} not in configured SYMBOLS")
+
+    if limit < 1 or limit > self.MAX_LIMIT:
+      raise ValueError(f"Limit must be between 1 and {self.MAX_LIMIT}")
+
+    # Дополнительная проверка существования символа на бирже
+    if symbol not in self._get_known_symbols():
+      raise ValueError(f"Invalid symbol: {symbol}")
+
+  def _process_trades(self, raw_trades: List[Dict]) -> List[Dict]:
+    """Преобразование сырых данных в удобный формат"""
+    processed = []
+    append = processed.append
+    fromtimestamp = datetime.fromtimestamp
+    utc = timezone.utc
+    for trade in raw_trades:
+      try:
+        (trade_id, symbol, price, qty, quote_qty, trade_time,
+         is_buyer, commission, commission_asset) = _TRADE_FIELDS(trade)
+        append({
+          'id': trade_id,
+          'symbol': symbol,
+          'price': float(price),
+          'qty': float(qty),
+          'quote_qty': float(quote_qty),
+          'time': fromtimestamp(trade_time * 0.001, utc),  # UTC (aware)
+          'is_buyer': is_buyer,
+          'commission': float(commission),
+          'commission_asset': commission_asset
+        })
+      except KeyError as e:
+        self.logger.warning(f"Missing key in trade data: {e}")
+      except Exception as e:
+        self.logger.error(f"Error processing trade: {str(e)}")
+    return processed
+
+
+class BinanceTradingHistoryFetcher(_TradeHistoryBase):
+  def __init__(self, client: Optional[Client] = None):
+    super().__init__()
+    self._client = client if client is not None else get_rest_client()
+    self._known_symbols_lock = threading.Lock()
 
   def get_trade_history(
     self,
@@ -36,18 +120,7 @@ class BinanceTradingHistoryFetcher:
     Возвращает историю сделок для конкретного символа
     """
     try:
-      self._validate_params(symbol, limit)
-
-      params = {
-        'symbol': symbol,
-        'limit': min(limit, self.MAX_LIMIT)
-      }
-
-      if start_time:
-        params['startTime'] = int(start_time.timestamp() * 1000)
-      if end_time:
-        params['endTime'] = int(end_time.timestamp() * 1000)
-
+      params = self._build_params(symbol, start_time, end_time, limit)
       raw_trades = self._client.get_my_trades(**params)
       return self._process_trades(raw_trades)
 
@@ -63,55 +136,140 @@ class BinanceTradingHistoryFetcher:
 
     all_trades = []
 
-    for symbol in SYMBOLS:
-      try:
-        trades = self.get_trade_history(symbol=symbol, limit=limit)
-        all_trades.extend(trades)
-      except Exception as e:
-        self.logger.error(
-          f"Error getting history for {symbol}",
-          exc_info=True,
-          stack_info=False
-        )
+    # Запросы по символам упираются в сеть, поэтому выполняем их параллельно
+    with ThreadPoolExecutor(max_workers=min(HISTORY_FETCH_WORKERS, len(SYMBOLS))) as executor:
+      futures = {
+        executor.submit(self.get_trade_history, symbol=symbol, limit=limit): symbol
+        for symbol in SYMBOLS
+      }
+      for future in as_completed(futures):
+        try:
+          all_trades.extend(future.result())
+        except Exception as e:
+          self.logger.error(
+            f"Error getting history for {futures[future]}",
+            exc_info=True,
+            stack_info=False
+          )
 
     # Сортировка по времени (новые сначала)
-    all_trades.sort(key=lambda x: x['time'], reverse=True)
-    return all_trades[:limit]
+    # Частичная выборка вместо полной сортировки: O(n log limit)
+    return nlargest(limit, all_trades, key=_BY_TIME)
 
-  def _validate_params(self, symbol: str, limit: int):
-    """Валидация входных параметров"""
-    if symbol not in SYMBOLS:
-      raise ValueError(f"Symbol {symbol} not in configured SYMBOLS")
+  def _get_known_symbols(self) -> FrozenSet[str]:
+    """Символы биржи, загружаемые один раз при первом обращении"""
+    if self._known_symbols is None:
+      with self._known_symbols_lock:
+        if self._known_symbols is None:
+          exchange_info = self._client.get_exchange_info()
+          self._known_symbols = frozenset(s['symbol'] for s in exchange_info['symbols'])
+    return self._known_symbols
 
-    if limit < 1 or limit > self.MAX_LIMIT:
-      raise ValueError(f"Limit must be between 1 and {self.MAX_LIMIT}")
 
-    # Дополнительная проверка существования символа на бирже
-    if not self._client.get_symbol_info(symbol):
-      raise ValueError(f"Invalid symbol: {symbol}")
+class AsyncBinanceTradingHistoryFetcher(_TradeHistoryBase):
+  """
+  История сделок через AsyncClient: запросы по всем символам выполняются
+  конкурентно в одном event loop через общий пул соединений aiohttp.
+  Внутри event loop используйте fetch_* и close(); синхронные методы
+  запускают собственный loop и закрывают соединение по завершении.
+  Клиент создается один раз и переиспользуется между вызовами fetch_*.
+  """
 
-  def _process_trades(self, raw_trades: List[Dict]) -> List[Dict]:
-    """Преобразование сырых данных в удобный формат"""
-    processed = []
-    for trade in raw_trades:
-      try:
-        processed_trade = {
-          'id': trade['id'],
-          'symbol': trade['symbol'],
-          'price': float(trade['price']),
-          'qty': float(trade['qty']),
-          'quote_qty': float(trade['quoteQty']),
-          'time': datetime.utcfromtimestamp(trade['time'] / 1000),  # UTC
-          'is_buyer': trade['isBuyer'],
-          'commission': float(trade['commission']),
-          'commission_asset': trade['commissionAsset']
-        }
-        processed.append(processed_trade)
-      except KeyError as e:
-        self.logger.warning(f"Missing key in trade data: {e}")
-      except Exception as e:
-        self.logger.error(f"Error processing trade: {str(e)}")
-    return processed
+  def __init__(self):
+    super().__init__()
+    self._aclient: Optional[AsyncClient] = None
+
+  async def _ensure_client(self) -> AsyncClient:
+    if self._aclient is None:
+      connector = aiohttp.TCPConnector(limit=ASYNC_HTTP_POOL_LIMIT, ttl_dns_cache=300)
+      self._aclient = await AsyncClient.create(
+        api_key=BINANCE_API_KEY,
+        api_secret=BINANCE_SECRET_KEY,
+        testnet=TESTNET,
+        loop=asyncio.get_running_loop(),
+        session_params={'connector': connector}
+      )
+    if self._known_symbols is None:
+      exchange_info = await self._aclient.get_exchange_info()
+      self._known_symbols = frozenset(s['symbol'] for s in exchange_info['symbols'])
+    return self._aclient
+
+  def _get_known_symbols(self) -> FrozenSet[str]:
+    # Заполняется в _ensure_client, который fetch_* вызывают до любой валидации
+    if self._known_symbols is None:
+      raise RuntimeError("Exchange symbols are not loaded yet: await _ensure_client() before validation")
+    return self._known_symbols
+
+  async def close(self) -> None:
+    if self._aclient is not None:
+      await self._aclient.close_connection()
+      self._aclient = None
+
+  async def fetch_trade_history(
+    self,
+    symbol: str,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    limit: int = 500
+  ) -> List[Dict]:
+    """Асинхронный аналог get_trade_history"""
+    try:
+      client = await self._ensure_client()
+      params = self._build_params(symbol, start_time, end_time, limit)
+      raw_trades = await client.get_my_trades(**params)
+      return self._process_trades(raw_trades)
+
+    except exceptions.BinanceAPIException as e:
+      raise BinanceHistoryError(f"API Error: {e.message}")
+    except Exception as e:
+      raise BinanceHistoryError(f"Unexpected error: {str(e)}")
+
+  async def fetch_all_trades_history(self, limit: int = 10) -> List[Dict]:
+    """Асинхронный аналог get_all_trades_history"""
+    if not 1 <= limit <= MAX_HISTORY_LIMIT:
+      raise ValueError(f"Limit must be between 1 and {MAX_HISTORY_LIMIT}")
+
+    # Клиент создается до запуска задач, чтобы они не создавали его конкурентно
+    try:
+      await self._ensure_client()
+    except Exception:
+      self.logger.error("Failed to initialize async Binance client", exc_info=True)
+      return []
+
+    results = await asyncio.gather(
+      *(self.fetch_trade_history(symbol=symbol, limit=limit) for symbol in SYMBOLS),
+      return_exceptions=True
+    )
+
+    all_trades = []
+    for symbol, result in zip(SYMBOLS, results):
+      if isinstance(result, BaseException):
+        self.logger.error(f"Error getting history for {symbol}", exc_info=result)
+      else:
+        all_trades.extend(result)
+
+    # Сортировка по времени (новые сначала)
+    return nlargest(limit, all_trades, key=_BY_TIME)
+
+  async def _run_and_close(self, coro):
+    try:
+      return await coro
+    finally:
+      await self.close()
+
+  def get_trade_history(
+    self,
+    symbol: str,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    limit: int = 500
+  ) -> List[Dict]:
+    return asyncio.run(self._run_and_close(
+      self.fetch_trade_history(symbol, start_time, end_time, limit)
+    ))
+
+  def get_all_trades_history(self, limit: int = 10) -> List[Dict]:
+    return asyncio.run(self._run_and_close(self.fetch_all_trades_history(limit)))
 
 
 class BinanceHistoryError(Exception):
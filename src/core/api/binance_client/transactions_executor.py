@@ -1,49 +1,123 @@
 #src/core/api/binance_client/transactions_executor.py
-import json
+import functools
 import logging
+import threading
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from binance import Client, exceptions
-from decimal import Decimal, ROUND_DOWN
-from typing import Optional, Dict
+import orjson
+from math import fsum
+from typing import Optional, Dict, List
+from src.core.api.binance_client.balance_book import get_balance_book
+from src.core.api.binance_client.price_book import get_price_book
+from src.core.api.binance_client.rest_client import get_rest_client
+from src.core.api.binance_client.symbol_spec import SymbolSpec, build_symbol_spec, floor_to_step, is_step_multiple
 from src.core.settings.config import (
-  BINANCE_API_KEY,
-  BINANCE_SECRET_KEY,
-  TESTNET,
-  SAFETY_MARGIN
+  SAFETY_MARGIN,
+  ORDER_FANOUT_WORKERS,
+  INVALID_SYMBOL_TTL
 )
 
 
+# Константы Binance, используемые на горячем пути исполнения ордеров
+_ORDER_MARKET = Client.ORDER_TYPE_MARKET
+_ORDER_LIMIT = Client.ORDER_TYPE_LIMIT
+_SIDE_BUY = Client.SIDE_BUY
+_SIDE_SELL = Client.SIDE_SELL
+_USED_FILTERS = frozenset(('LOT_SIZE', 'PRICE_FILTER', 'NOTIONAL', 'MIN_NOTIONAL'))
+
+
+def _dump_response(response: Dict, indent: bool = False) -> str:
+  return orjson.dumps(response, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+
 class TransactionsExecutor:
-  def __init__(self):
-    self.client = Client(
-      api_key=BINANCE_API_KEY,
-      api_secret=BINANCE_SECRET_KEY,
-      testnet=TESTNET
-    )
+  def __init__(self, client: Optional[Client] = None):
+    self.client = client if client is not None else get_rest_client()
     self.symbols_info = {}
+    self._preload_attempted = False
+    self._preload_lock = threading.Lock()
+    self._symbols_complete = False
+    self._symbol_specs: Dict[str, SymbolSpec] = {}
+    self._invalid_until: Dict[str, float] = {}
+    self._price_book = get_price_book(self.client)
+    self._balance_book = get_balance_book(self.client)
+    # Долгоживущий пул для параллельного запроса баланса, когда и цена, и баланс требуют REST
+    self._prefetch_pool = ThreadPoolExecutor(max_workers=ORDER_FANOUT_WORKERS, thread_name_prefix='order-prefetch')
     self.logger = logging.getLogger(self.__class__.__name__)
 
-  def _get_symbol_filters(self, symbol: str) -> Dict:
-    if symbol not in self.symbols_info:
-      info = self.client.get_symbol_info(symbol)
-      if not info:
-        raise InvalidSymbolError(f"Invalid symbol: {symbol}")
-      self.symbols_info[symbol] = {
-        'filters': {f['filterType']: f for f in info['filters']},
-        'base_asset': info['baseAsset'],
-        'quote_asset': info['quoteAsset']
-      }
-    return self.symbols_info[symbol]
-
-  def _format_quantity(self, symbol: str, quantity: float) -> float:
-    lot_size = self._get_symbol_filters(symbol)['filters']['LOT_SIZE']
-    step = Decimal(lot_size['stepSize']).normalize()
-    return float(Decimal(str(quantity)).quantize(step, ROUND_DOWN))
+  @staticmethod
+  def _symbol_entry(info: Dict) -> Dict:
+    # Храним только фильтры, которые читает build_symbol_spec: кэш держит все символы биржи
+    return {
+      'filters': {f['filterType']: f for f in info['filters'] if f['filterType'] in _USED_FILTERS},
+      'base_asset': info['baseAsset'],
+      'quote_asset': info['quoteAsset']
+    }
+
+  def _preload_symbols_info(self) -> bool:
+    """Загрузка правил всех символов одним запросом exchangeInfo.
+    Возвращает True, если получен полный список символов."""
+    try:
+      exchange_info = self.client.get_exchange_info()
+      loaded = 0
+      for info in exchange_info.get('symbols', []):
+        self.symbols_info[info['symbol']] = self._symbol_entry(info)
+        loaded += 1
+    except Exception as e:
+      self.logger.warning("Bulk symbols preload failed, falling back to per-symbol lookup: %s", e)
+      return False
+    return loaded > 0
 
-  def _format_price(self, symbol: str, price: float) -> float:
-    price_filter = self._get_symbol_filters(symbol)['filters']['PRICE_FILTER']
-    tick_size = Decimal(price_filter['tickSize']).normalize()
-    return float(Decimal(str(price)).quantize(tick_size, ROUND_DOWN))
+  def _get_symbol_filters(self, symbol: str) -> Dict:
+    data = self.symbols_info.get(symbol)
+    if data is not None:
+      return data
+
+    with self._preload_lock:
+      if not self._preload_attempted:
+        self._preload_attempted = True
+        self._symbols_complete = self._preload_symbols_info()
+    data = self.symbols_info.get(symbol)
+    if data is not None:
+      return data
+
+    # Полный список уже загружен - повторный запрос exchangeInfo символ не найдёт
+    if self._symbols_complete:
+      raise InvalidSymbolError(f"Invalid symbol: {symbol}")
+
+    # Отрицательный кэш: неизвестный символ не запрашивается снова до истечения INVALID_SYMBOL_TTL
+    invalid_until = self._invalid_until.get(symbol)
+    if invalid_until is not None and time.monotonic() < invalid_until:
+      raise InvalidSymbolError(f"Invalid symbol: {symbol}")
+
+    info = self.client.get_symbol_info(symbol)
+    if not info:
+      self._invalid_until[symbol] = time.monotonic() + INVALID_SYMBOL_TTL
+      raise InvalidSymbolError(f"Invalid symbol: {symbol}")
+    self._invalid_until.pop(symbol, None)
+    data = self.symbols_info[symbol] = self._symbol_entry(info)
+    return data
+
+  def _get_symbol_spec(self, symbol: str) -> SymbolSpec:
+    """Разобранные правила символа (Decimal-значения фильтров), кэшируемые по символу"""
+    spec = self._symbol_specs.get(symbol)
+    if spec is None:
+      data = self._get_symbol_filters(symbol)
+      spec = build_symbol_spec(symbol, data['base_asset'], data['quote_asset'], data.get('filters', {}))
+      self._symbol_specs[symbol] = spec
+    return spec
+
+  def _format_quantity(self, symbol: str, quantity: float, spec: Optional[SymbolSpec] = None) -> float:
+    if spec is None:
+      spec = self._get_symbol_spec(symbol)
+    return floor_to_step(quantity, spec.qty_scale, spec.step_units)
+
+  def _format_price(self, symbol: str, price: float, spec: Optional[SymbolSpec] = None) -> float:
+    if spec is None:
+      spec = self._get_symbol_spec(symbol)
+    return floor_to_step(price, spec.price_scale, spec.tick_units)
 
   def _validate_order_parameters(
     self,
@@ -51,41 +125,22 @@ class TransactionsExecutor:
     side: str,
     quantity: float,
     order_type: str,
-    price: Optional[float] = None
+    price: Optional[float] = None,
+    current_price: Optional[float] = None,
+    spec: Optional[SymbolSpec] = None
   ):
     logger = self.logger
 
     try:
-      symbol_filters_data = self._get_symbol_filters(symbol)
-      symbol_filters = symbol_filters_data.get('filters', {})
-
-      lot_size = symbol_filters.get('LOT_SIZE', {
-        'minQty': '0.001',
-        'stepSize': '0.001'
-      })
-
-      notional_filter = symbol_filters.get('NOTIONAL', {
-        'minNotional': '5.0',
-        'applyToMarket': True
-      })
-      if 'MIN_NOTIONAL' in symbol_filters and 'NOTIONAL' not in symbol_filters:
-        notional_filter = symbol_filters.get('MIN_NOTIONAL', {
-          'minNotional': '5.0',
-          'applyMinToMarket': True # Binance API uses applyMinToMarket for MIN_NOTIONAL
-        })
-
-
-      min_qty = float(lot_size.get('minQty', '0.001'))
-      min_notional = float(notional_filter.get('minNotional', '5.0'))
-      apply_to_market = notional_filter.get('applyToMarket', True)
-      if 'applyMinToMarket' in notional_filter: # For MIN_NOTIONAL
-        apply_to_market = notional_filter.get('applyMinToMarket', True)
-
+      if spec is None:
+        spec = self._get_symbol_spec(symbol)
+      min_qty = spec.min_qty_float
+      min_notional = spec.min_notional_float
+      apply_to_market = spec.apply_to_market
 
       logger.debug(
-        f"Validating order: {symbol} {side} {quantity} {order_type} | "
-        f"Params: minQty={min_qty}, "
-        f"minNotional={min_notional}, applyToMarket={apply_to_market}"
+        "Validating order: %s %s %s %s | Params: minQty=%s, minNotional=%s, applyToMarket=%s",
+        symbol, side, quantity, order_type, min_qty, min_notional, apply_to_market
       )
 
       if quantity < min_qty:
@@ -93,9 +148,9 @@ class TransactionsExecutor:
         logger.error(error_msg)
         raise InvalidOrderParameters(error_msg)
 
-      if order_type == Client.ORDER_TYPE_MARKET:
+      if order_type == _ORDER_MARKET:
         if apply_to_market:
-          current_price_float = self.get_current_price(symbol)
+          current_price_float = current_price if current_price else self.get_current_price(symbol)
           if not current_price_float or current_price_float <= 0:
             error_msg = f"Can't validate notional for {symbol} - current price unavailable or zero: {current_price_float}"
             logger.error(error_msg)
@@ -110,31 +165,22 @@ class TransactionsExecutor:
             logger.error(error_msg)
             raise InvalidOrderParameters(error_msg)
 
-      if order_type == Client.ORDER_TYPE_LIMIT:
+      if order_type == _ORDER_LIMIT:
         if not price:
           error_msg = f"Price required for limit orders for {symbol}"
           logger.error(error_msg)
           raise InvalidOrderParameters(error_msg)
 
-        price_filter_rules = symbol_filters.get('PRICE_FILTER', {})
-        tick_size_str = price_filter_rules.get('tickSize', '0.01')
-        tick_size = Decimal(tick_size_str)
-        if (Decimal(str(price)) % tick_size).compare(Decimal('0')) != 0:
-          error_msg = f"Invalid price format for {symbol}. Price {price} is not a multiple of tickSize {tick_size}."
+        if not is_step_multiple(price, spec.price_scale, spec.tick_units):
+          error_msg = f"Invalid price format for {symbol}. Price {price} is not a multiple of tickSize {spec.tick_size}."
           logger.error(error_msg)
           raise InvalidOrderParameters(error_msg)
 
-      logger.info(f"Order parameters validation passed for {symbol} {side} {quantity}")
+      logger.info("Order parameters validation passed for %s %s %s", symbol, side, quantity)
 
     except KeyError as e:
       error_msg = f"Missing key in symbol data during validation for {symbol}: {str(e)}"
-      logger.error(error_msg, exc_info=True)
-      raise InvalidOrderParameters(error_msg)
-    except InvalidOrderParameters:
-      raise
-    except Exception as e:
-      error_msg = f"Unexpected validation error for {symbol}: {str(e)}"
-      logger.error(error_msg, exc_info=True)
+      logger.error(error_msg)
       raise InvalidOrderParameters(error_msg)
 
   def execute_order(
@@ -144,45 +190,77 @@ class TransactionsExecutor:
     quantity: float,
     order_type: str = Client.ORDER_TYPE_MARKET,
     price: Optional[float] = None,
-    time_in_force: str = Client.TIME_IN_FORCE_GTC
+    time_in_force: str = Client.TIME_IN_FORCE_GTC,
+    current_price: Optional[float] = None,
+    available_balance: Optional[float] = None
   ) -> Dict:
-    self.logger.info(f"🔄 Starting order execution: {symbol} {side} {quantity} {order_type}")
+    """
+    Исполнение ордера.
+    current_price и available_balance - необязательный снимок рынка/баланса,
+    сделанный вызывающим кодом в момент принятия решения; если они переданы,
+    соответствующие запросы к API не выполняются.
+    """
+    self.logger.info("🔄 Starting order execution: %s %s %s %s", symbol, side, quantity, order_type)
 
     try:
-      symbol_info_data = self._get_symbol_filters(symbol)
-      base_asset = symbol_info_data['base_asset']
-      quote_asset = symbol_info_data['quote_asset']
-
-      formatted_quantity = self._format_quantity(symbol, quantity)
-      formatted_price = self._format_price(symbol, price) if price and order_type != Client.ORDER_TYPE_MARKET else None
-
-      self.logger.debug(
-        f"Formatted params for {symbol}: Qty: {quantity} → {formatted_quantity} | "
-        f"Price: {price} → {formatted_price}"
-      )
+      spec = self._get_symbol_spec(symbol)
+      base_asset = spec.base_asset
+      quote_asset = spec.quote_asset
+
+      is_buy = side == _SIDE_BUY
+      is_market = order_type == _ORDER_MARKET
+      # Уровень логгера проверяется один раз на ордер
+      debug = self.logger.isEnabledFor(logging.DEBUG)
+
+      formatted_quantity = self._format_quantity(symbol, quantity, spec)
+      formatted_price = self._format_price(symbol, price, spec) if price and not is_market else None
+
+      if debug:
+        self.logger.debug(
+          "Formatted params for %s: Qty: %s → %s | Price: %s → %s",
+          symbol, quantity, formatted_quantity, price, formatted_price
+        )
+
+      asset_to_check = quote_asset if is_buy else base_asset
+
+      # Одна цена на весь ордер: её используют и проверка notional, и проверка баланса.
+      # Параллельно запрашиваются, только если оба кэша устарели: попадание в кэш
+      # или поток дешевле передачи задачи в другой поток
+      need_price = not current_price and is_market
+      if (need_price and available_balance is None
+          and not self._price_book.is_fresh(symbol) and not self._balance_book.is_fresh()):
+        balance_future = self._prefetch_pool.submit(self.get_available_balance, asset_to_check)
+        current_price = self.get_current_price(symbol)
+        available_balance = balance_future.result()
+      elif need_price:
+        current_price = self.get_current_price(symbol)
 
       self._validate_order_parameters(
         symbol,
         side,
         formatted_quantity,
         order_type,
-        formatted_price
+        formatted_price,
+        current_price,
+        spec
       )
 
-      asset_to_check = quote_asset if side == Client.SIDE_BUY else base_asset
-      available_balance = self.get_available_balance(asset_to_check)
-      self.logger.debug(f"Available balance for {asset_to_check}: {available_balance}")
+      if available_balance is None:
+        available_balance = self.get_available_balance(asset_to_check)
+      if debug:
+        self.logger.debug("Available balance for %s: %s", asset_to_check, available_balance)
 
-      if side == Client.SIDE_BUY and order_type == Client.ORDER_TYPE_MARKET:
-        current_price_float = self.get_current_price(symbol)
+      if is_buy and is_market:
+        current_price_float = current_price if current_price else self.get_current_price(symbol)
         if current_price_float > 0:
-          required_quote = Decimal(str(formatted_quantity)) * Decimal(str(current_price_float)) * Decimal(str(SAFETY_MARGIN))
-          if Decimal(str(available_balance)) < required_quote:
+          # Количество уже кратно stepSize, а запас SAFETY_MARGIN перекрывает погрешность float
+          required_quote = formatted_quantity * current_price_float * SAFETY_MARGIN
+          if available_balance < required_quote:
             raise InsufficientFundsError(
               f"Need approx {required_quote:.4f} {quote_asset}, available {available_balance:.4f} for {symbol} BUY"
             )
-      elif side == Client.SIDE_SELL:
-        if Decimal(str(available_balance)) < Decimal(str(formatted_quantity)):
+      elif side == _SIDE_SELL:
+        if available_balance < formatted_quantity:
           raise InsufficientFundsError(
             f"Need {formatted_quantity} {base_asset}, available {available_balance} for {symbol} SELL"
           )
@@ -194,9 +272,9 @@ class TransactionsExecutor:
         'newOrderRespType': 'FULL'
       }
 
-      if order_type == Client.ORDER_TYPE_MARKET:
+      if is_market:
         order_params['quantity'] = formatted_quantity
-      elif order_type == Client.ORDER_TYPE_LIMIT:
+      elif order_type == _ORDER_LIMIT:
         if not formatted_price:
           raise InvalidOrderParameters(f"Price is required for LIMIT order for {symbol}")
         order_params.update({
@@ -205,88 +283,92 @@ class TransactionsExecutor:
           'timeInForce': time_in_force
         })
 
-      self.logger.debug(f"Sending order params to Binance for {symbol}: {order_params}")
+      if debug:
+        self.logger.debug("Sending order params to Binance for %s: %s", symbol, order_params)
 
       response = self.client.create_order(**order_params)
-      self.logger.debug(f"Binance API response for {symbol} order: {json.dumps(response, indent=2)}")
+      self._balance_book.invalidate()  # Балансы изменились после ордера
+      if debug:
+        self.logger.debug("Binance API response for %s order: %s", symbol, _dump_response(response, indent=True))
 
-      executed_qty_final = Decimal('0')
-      avg_price_final = Decimal('0')
-      commission_final = Decimal('0')
+      executed_qty_final = 0.0
+      avg_price_final = 0.0
+      commission_final = 0.0
       commission_asset_final = ''
       order_status = response.get('status', 'UNKNOWN')
 
       fills = response.get('fills', [])
       if fills:
-        accumulated_qty = Decimal('0')
-        accumulated_quote_qty = Decimal('0')
-        accumulated_commission = Decimal('0')
-
-        for fill in fills:
-          fill_qty = Decimal(str(fill.get('qty', '0')))
-          fill_price = Decimal(str(fill.get('price', '0')))
-          accumulated_qty += fill_qty
-          accumulated_quote_qty += fill_qty * fill_price
-          accumulated_commission += Decimal(str(fill.get('commission', '0')))
-          if not commission_asset_final and fill.get('commissionAsset'):
-            commission_asset_final = fill['commissionAsset']
-
-        if accumulated_qty > Decimal('0'):
-          executed_qty_final = accumulated_qty
+        # Суммы по fills во float (fsum - без накопления ошибки округления)
+        fill_qtys = [float(fill.get('qty', 0)) for fill in fills]
+        accumulated_qty = fsum(fill_qtys)
+        accumulated_quote_qty = fsum([qty * float(fill.get('price', 0)) for qty, fill in zip(fill_qtys, fills)])
+        accumulated_commission = fsum([float(fill.get('commission', 0)) for fill in fills])
+        commission_asset_final = next((fill['commissionAsset'] for fill in fills if fill.get('commissionAsset')), '')
+
+        if accumulated_qty > 0:
+          # Исполненный объём кратен stepSize: округление до масштаба шага убирает шум float-суммы
+          executed_qty_final = round(accumulated_qty * spec.qty_scale) / spec.qty_scale
           avg_price_final = accumulated_quote_qty / accumulated_qty
           commission_final = accumulated_commission
-          self.logger.debug(
-            f"Calculated from {len(fills)} fills for {symbol}: exec_qty={executed_qty_final}, avg_price={avg_price_final:.4f}")
+          if debug:
+            self.logger.debug(
+              "Calculated from %d fills for %s: exec_qty=%s, avg_price=%.4f",
+              len(fills), symbol, executed_qty_final, avg_price_final)
         else:
           self.logger.warning(
-            f"Fills array is present but total quantity from fills is 0 for {symbol}. Response: {response}")
-          executed_qty_final = Decimal(str(response.get('executedQty', '0')))
-          if executed_qty_final > Decimal('0'):
+            "Fills array is present but total quantity from fills is 0 for %s. Response: %s", symbol, response)
+          executed_qty_final = float(response.get('executedQty', 0))
+          if executed_qty_final > 0:
             self.logger.warning(
-              f"Using executedQty ({executed_qty_final}) from main response for {symbol} as fills qty is 0. Avg price cannot be determined from fills.")
+              "Using executedQty (%s) from main response for %s as fills qty is 0. Avg price cannot be determined from fills.",
+              executed_qty_final, symbol)
           else:
-            self.logger.warning(f"executedQty from main response is also 0 for {symbol}.")
+            self.logger.warning("executedQty from main response is also 0 for %s.", symbol)
 
       elif response.get('executedQty'):
-        executed_qty_final = Decimal(str(response.get('executedQty', '0')))
-        if executed_qty_final > Decimal('0'):
+        executed_qty_final = float(response.get('executedQty', 0))
+        if executed_qty_final > 0:
           self.logger.warning(
-            f"Order for {symbol} has executedQty={executed_qty_final} but no 'fills' data. "
-            f"Avg price cannot be determined. This is common in Testnet. Status: {order_status}."
+            "Order for %s has executedQty=%s but no 'fills' data. "
+            "Avg price cannot be determined. This is common in Testnet. Status: %s.",
+            symbol, executed_qty_final, order_status
           )
         else:
-          self.logger.warning(f"executedQty from main response is 0 and no fills for {symbol}.")
+          self.logger.warning("executedQty from main response is 0 and no fills for %s.", symbol)
       else:
         self.logger.warning(
-          f"No 'fills' and no 'executedQty' in response for {symbol}. Order likely not filled or partially filled without details. Status: {order_status}.")
+          "No 'fills' and no 'executedQty' in response for %s. Order likely not filled or partially filled without details. Status: %s.",
+          symbol, order_status)
 
-      is_considered_executed = (order_status in ['FILLED', 'PARTIALLY_FILLED'] and executed_qty_final > Decimal('0')) or \
-                               (order_status == 'NEW' and order_type != Client.ORDER_TYPE_MARKET)
+      is_considered_executed = (order_status in ['FILLED', 'PARTIALLY_FILLED'] and executed_qty_final > 0) or \
+                               (order_status == 'NEW' and not is_market)
 
-      if not is_considered_executed and order_type == Client.ORDER_TYPE_MARKET:
+      if not is_considered_executed and is_market:
         raise OrderExecutionError(
-          f"Market order for {symbol} reported as {order_status} with zero executed quantity. Response: {json.dumps(response)}")
+          f"Market order for {symbol} reported as {order_status} with zero executed quantity. Response: {_dump_response(response)}")
 
       result = {
         'symbol': symbol,
         'side': side,
         'order_type': order_type,
         'requested_qty': float(formatted_quantity),
-        'executed_qty': float(executed_qty_final),
-        'avg_price': float(avg_price_final.quantize(Decimal('0.00000001')) if avg_price_final > 0 else 0.0),
-        'commission': float(commission_final),
+        'executed_qty': executed_qty_final,
+        'avg_price': round(avg_price_final, 8) if avg_price_final > 0 else 0.0,
+        'commission': commission_final,
         'commission_asset': commission_asset_final,
         'status': order_status,
         'success': is_considered_executed or order_status == 'FILLED',
         'exchange_id': response.get('orderId'),
-        'raw_response': response,
+        # Полный ответ (с массивом fills) держим в результате только при отладке
+        'raw_response': response if debug else None,
         'base_asset': base_asset,
         'quote_asset': quote_asset
       }
 
       self.logger.info(
-        f"✅ Order for {symbol} processed: Status {result['status']}, Executed {result['executed_qty']} @ ~{result['avg_price']:.4f} "
-        f"(Commission: {result['commission']:.6f} {result['commission_asset']})"
+        "✅ Order for %s processed: Status %s, Executed %s @ ~%.4f (Commission: %.6f %s)",
+        symbol, order_status, executed_qty_final, result['avg_price'], commission_final, commission_asset_final
       )
       return result
 
@@ -296,11 +378,16 @@ class TransactionsExecutor:
       raise OrderExecutionError(error_msg)
 
     except InsufficientFundsError as e:
-      self.logger.error(f"🔥 InsufficientFundsError for {symbol}: {str(e)}")
+      self.logger.error("🔥 InsufficientFundsError for %s: %s", symbol, e)
       raise
 
     except InvalidOrderParameters as e:
-      self.logger.error(f"🔥 InvalidOrderParameters for {symbol}: {str(e)}")
+      self.logger.error("🔥 InvalidOrderParameters for %s: %s", symbol, e)
+      raise
+
+    except OrderExecutionError as e:
+      # Ожидаемые типизированные ошибки (неизвестный символ, пустое исполнение) - без traceback
+      self.logger.error("🔥 %s for %s: %s", e.__class__.__name__, symbol, e)
       raise
 
     except Exception as e:
@@ -308,46 +395,120 @@ class TransactionsExecutor:
       self.logger.error(error_msg, exc_info=True)
       raise OrderExecutionError(error_msg)
 
+  def _prepare_batch(self, orders: List[Dict]) -> List[Dict]:
+    """
+    Общий снимок рынка для пакета: цена запрашивается один раз на символ,
+    баланс - один раз на актив. Средства, нужные ордеру, резервируются из снимка,
+    поэтому следующие ордера пакета проверяются по остатку.
+    """
+    prices: Dict[str, float] = {}
+    balances: Dict[str, float] = {}
+    prepared = []
+
+    for order in orders:
+      params = dict(order)
+      prepared.append(params)
+      symbol = params.get('symbol')
+      try:
+        spec = self._get_symbol_spec(symbol)
+      except Exception:
+        continue  # Ошибка символа будет возвращена execute_order для этого ордера
+
+      is_buy = params.get('side') == _SIDE_BUY
+      is_market = params.get('order_type', _ORDER_MARKET) == _ORDER_MARKET
+
+      price = params.get('current_price')
+      if not price and is_market:
+        if symbol not in prices:
+          prices[symbol] = self.get_current_price(symbol)
+        price = prices[symbol]
+        if price:
+          params['current_price'] = price
+
+      if params.get('available_balance') is None:
+        asset = spec.quote_asset if is_buy else spec.base_asset
+        if asset not in balances:
+          balances[asset] = self.get_available_balance(asset)
+        params['available_balance'] = balances[asset]
+
+        quantity = params.get('quantity') or 0.0
+        if not is_buy:
+          balances[asset] -= quantity
+        else:
+          order_price = price if is_market else params.get('price')
+          if order_price:
+            margin = SAFETY_MARGIN if is_market else 1.0
+            balances[asset] -= quantity * order_price * margin
+
+    return prepared
+
+  def execute_orders(self, orders: List[Dict]) -> List[Dict]:
+    """
+    Параллельное исполнение нескольких ордеров.
+    Каждый элемент orders - аргументы execute_order. Результаты идут в порядке orders;
+    для неудачного ордера возвращается {'symbol', 'side', 'success': False, 'error'}.
+    Спотовый API Binance не поддерживает пакетные ордера, поэтому запросы
+    отправляются параллельно, а не одним вызовом. Цены и балансы берутся из общего
+    снимка пакета (см. _prepare_batch), проверка баланса учитывает ордера,
+    стоящие в пакете раньше.
+    """
+    if not orders:
+      return []
+
+    def run(order: Dict) -> Dict:
+      try:
+        return self.execute_order(**order)
+      except Exception as e:
+        return {
+          'symbol': order.get('symbol'),
+          'side': order.get('side'),
+          'success': False,
+          'error': str(e)
+        }
+
+    prepared = self._prepare_batch(orders)
+    with ThreadPoolExecutor(max_workers=min(ORDER_FANOUT_WORKERS, len(prepared))) as executor:
+      return list(executor.map(run, prepared))
+
   def cancel_order(self, symbol: str, order_id: str) -> Dict:
     try:
-      self.logger.info(f"Attempting to cancel order {order_id} for {symbol}")
+      self.logger.info("Attempting to cancel order %s for %s", order_id, symbol)
       response = self.client.cancel_order(
         symbol=symbol,
         orderId=order_id
       )
-      self.logger.info(f"Cancel order response for {order_id} ({symbol}): {response}")
+      self.logger.info("Cancel order response for %s (%s): %s", order_id, symbol, response)
       return response
     except exceptions.BinanceAPIException as e:
-      self.logger.error(f"Cancel order failed for {order_id} ({symbol}): {e.message}")
+      self.logger.error("Cancel order failed for %s (%s): %s", order_id, symbol, e.message)
       raise OrderCancelError(f"Cancel failed for {symbol} order {order_id}: {e.message}")
 
   def get_available_balance(self, asset: str) -> float:
     try:
-      account = self.client.get_account()
-      balance_info = next(
-        (acc for acc in account['balances'] if acc['asset'] == asset),
-        None
-      )
+      balance_info = self._balance_book.get(asset)
       if balance_info:
         return float(balance_info['free'])
-      self.logger.warning(f"Asset {asset} not found in account balances.")
+      self.logger.warning("Asset %s not found in account balances.", asset)
       return 0.0
     except exceptions.BinanceAPIException as e:
-      self.logger.error(f"Failed to get balance for {asset} due to API error: {e.message}")
+      self.logger.error("Failed to get balance for %s due to API error: %s", asset, e.message)
       return 0.0
     except Exception as e:
-      self.logger.error(f"Unexpected error getting balance for {asset}: {str(e)}")
+      self.logger.error("Unexpected error getting balance for %s: %s", asset, e)
       return 0.0
 
   def get_current_price(self, symbol: str) -> float:
     try:
-      ticker = self.client.get_symbol_ticker(symbol=symbol)
-      return float(ticker['price'])
+      price = self._price_book.get(symbol)
+      if price is None:
+        self.logger.error("Price not found for %s", symbol)
+        return 0.0
+      return float(price)
     except exceptions.BinanceAPIException as e:
-      self.logger.error(f"Failed to get price for {symbol} due to API error: {e.message}")
+      self.logger.error("Failed to get price for %s due to API error: %s", symbol, e.message)
       return 0.0
     except Exception as e:
-      self.logger.error(f"Unexpected error getting price for {symbol}: {str(e)}")
+      self.logger.error("Unexpected error getting price for %s: %s", symbol, e)
       return 0.0
 
 
@@ -369,3 +530,9 @@ class InvalidSymbolError(OrderExecutionError):
 
 class InvalidOrderParameters(OrderExecutionError):
   pass
+
+
+@functools.lru_cache(maxsize=1)
+def get_transactions_executor() -> TransactionsExecutor:
+  """Общий для процесса исполнитель: один клиент, кэши правил символов, цен и балансов"""
+  return TransactionsExecutor()
@@ -0,0 +1,50 @@
+# src/core/api/binance_client/user_stream.py
+import logging
+from typing import Dict, Optional
+
+from binance import Client, ThreadedWebsocketManager
+from src.core.api.binance_client.balance_book import BalanceBook, get_balance_book
+
+
+class UserDataStream:
+  """
+  User data stream Binance: изменения балансов приходят событиями
+  outboundAccountPosition и сразу попадают в общий BalanceBook клиента,
+  поэтому проверки баланса не требуют запроса /api/v3/account.
+  """
+
+  def __init__(self, client: Client, balance_book: Optional[BalanceBook] = None):
+    self.client = client
+    self.balance_book = balance_book if balance_book is not None else get_balance_book(client)
+    self._manager: Optional[ThreadedWebsocketManager] = None
+    self.logger = logging.getLogger(self.__class__.__name__)
+
+  def start(self) -> None:
+    if self._manager is not None:
+      return
+    manager = ThreadedWebsocketManager(
+      api_key=self.client.API_KEY,
+      api_secret=self.client.API_SECRET,
+      testnet=self.client.testnet
+    )
+    self._manager = manager
+    manager.start()
+    manager.start_user_socket(callback=self._handle_message)
+    self.balance_book.set_live(True)
+    self.logger.info("User data stream started")
+
+  def stop(self) -> None:
+    self.balance_book.set_live(False)
+    if self._manager is not None:
+      self._manager.stop()
+      self._manager = None
+      self.logger.info("User data stream stopped")
+
+  def _handle_message(self, msg: Dict) -> None:
+    event = msg.get('e')
+    if event == 'outboundAccountPosition':
+      self.balance_book.apply_updates(msg.get('B', []))
+    elif event == 'error':
+      # Без потока балансы снова читаются через REST с обычным TTL
+      self.logger.warning(f"User data stream error, falling back to REST balances: {msg.get('m')}")
+      self.balance_book.set_live(False)
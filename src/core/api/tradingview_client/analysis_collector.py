@@ -1,10 +1,33 @@
 # src/core/api/tradingview_client/analysis_collector.py
 from pathlib import Path
-import json
+import mmap
+import os
+import orjson
 from typing import Dict, Optional, List
+from src.core.api.tradingview_client.analysis_saver import read_latest
 from src.core.settings.config import SYMBOLS
 from src.core.paths import TW_ANALYSIS
 
+
+def _tail_lines(file_path: Path, limit: int) -> List[bytes]:
+    """Последние limit непустых строк файла.
+    Переводы строк ищутся с конца через mmap, поэтому файл не читается целиком."""
+    with open(file_path, "rb") as f:
+        if limit <= 0 or os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = []
+            end = len(mm)
+            while end > 0 and len(lines) < limit:
+                start = mm.rfind(b"\n", 0, end) + 1
+                line = mm[start:end]
+                if line.strip():
+                    lines.append(line)
+                end = start - 1
+    lines.reverse()
+    return lines
+
+
 class AnalysisCollector:
     def __init__(self, storage_path: Path = TW_ANALYSIS):
         self.storage = storage_path
@@ -13,17 +36,19 @@ class AnalysisCollector:
         """Получение последней записи для конкретного символа"""
         file_path = self.storage / f"{symbol}.jsonl"
         try:
-            with open(file_path, "r") as f:
-                lines = f.readlines()
-                return json.loads(lines[-1]) if lines else None
-        except (FileNotFoundError, json.JSONDecodeError):
+            lines = _tail_lines(file_path, 1)
+            return orjson.loads(lines[0]) if lines else None
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return None
 
     def get_all_latest(self) -> Dict[str, Dict]:
-        """Получение последних данных для всех символов"""
+        """Получение последних данных для всех символов.
+        Берутся из индекса AnalysisSaver одним чтением; символы без записи в индексе
+        читаются из своих .jsonl"""
+        latest = read_latest(self.storage)
         processed_data = {}
         for symbol in SYMBOLS:
-            data = self.get_latest_for_symbol(symbol)
+            data = latest.get(symbol) or self.get_latest_for_symbol(symbol)
             if data:
                 processed_data[symbol] = data
         return processed_data
@@ -32,7 +57,6 @@ class AnalysisCollector:
         """Получение истории записей для символа"""
         file_path = self.storage / f"{symbol}.jsonl"
         try:
-            with open(file_path, "r") as f:
-                return [json.loads(line) for line in f.readlines()[-limit:]]
+            return [orjson.loads(line) for line in _tail_lines(file_path, limit)]
         except FileNotFoundError:
-            return []
\ No newline at end of file
+            return []
@@ -1,57 +1,126 @@
 # src/core/api/tradingview_client/analysis_fetcher.py
+import json
 import logging
+import random
+import re
 import time
-from typing import Dict, Optional
-from tradingview_ta import TA_Handler, Exchange
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, TypeVar
+from requests.exceptions import RequestException
+from tradingview_ta import TA_Handler, Exchange, get_multiple_analysis
+from src.core.api.binance_client.rate_limiter import RequestWeightLimiter
 from src.core.settings.config import (
   SYMBOLS,
   TIMEFRAMES,
   RECOMMENDATION_SCORE_MAP,
-  TV_FETCH_DELAY
+  TV_FETCH_DELAY,
+  TV_FETCH_WORKERS
 )
 
+T = TypeVar('T')
+
+# tradingview_ta сообщает о неуспешном HTTP-ответе обычным Exception с кодом в тексте
+_HTTP_STATUS_RE = re.compile(r"HTTP status code: (\d+)")
+
+
+def _is_retryable(error: Exception) -> bool:
+  """Сетевые сбои, 429/5xx и не-JSON ответ (страница троттлинга) имеет смысл повторить;
+  ошибки разбора и неизвестный символ - нет"""
+  if isinstance(error, (RequestException, OSError, json.JSONDecodeError)):
+    return True
+  match = _HTTP_STATUS_RE.search(str(error))
+  if match:
+    status = int(match.group(1))
+    return status == 429 or status >= 500
+  return False
+
 
 class TradingViewFetcher:
-  def __init__(self, rate_limit_delay: float = TV_FETCH_DELAY):
+  def __init__(self, rate_limit_delay: float = TV_FETCH_DELAY, max_workers: int = TV_FETCH_WORKERS):
     self.rate_limit_delay = rate_limit_delay
+    self.max_workers = max_workers
+    # Token bucket: в среднем один запрос за rate_limit_delay, всплеск до max_workers запросов
+    self.rate_limiter = (
+      RequestWeightLimiter(limit=max_workers, window=max_workers * rate_limit_delay)
+      if rate_limit_delay > 0 else None
+    )
+    self._score_get = RECOMMENDATION_SCORE_MAP.get
     self.logger = logging.getLogger(__name__)
 
-  def _fetch_single(self, symbol: str, timeframe: str) -> Optional[dict]:
-    """Получение данных для одного символа и таймфрейма"""
+  def _to_record(self, timeframe: str, analysis) -> dict:
+    # TradingView возвращает рекомендации в верхнем регистре: .upper() нужен только при промахе
+    recommendation = analysis.summary.get("RECOMMENDATION") or "NEUTRAL"
+    score = self._score_get(recommendation)
+    if score is None:
+      recommendation = recommendation.upper()
+      score = self._score_get(recommendation, 0)
+    return {
+      "timeframe": timeframe,
+      "recommendation": recommendation,
+      "score": score
+    }
+
+  def _with_retries(self, description: str, request: Callable[[], T]) -> Optional[T]:
+    """Запрос с повторами: экспоненциальная пауза с jitter, неповторяемые ошибки - сразу None"""
     for attempt in range(3):
+      if self.rate_limiter is not None:
+        self.rate_limiter.acquire()
       try:
-        analysis = TA_Handler(
-          symbol=symbol,
-          screener="crypto",
-          exchange="BINANCE",
-          interval=timeframe
-        ).get_analysis()
-
-        recommendation = analysis.summary.get("RECOMMENDATION", "NEUTRAL").upper()
-        return {
-          "timeframe": timeframe,
-          "recommendation": recommendation,
-          "score": RECOMMENDATION_SCORE_MAP.get(recommendation, 0)
-        }
+        return request()
       except Exception as e:
-        self.logger.error(f"Failed to fetch {symbol} {timeframe}: {str(e)}")
-        time.sleep(1.5 ** attempt)
+        if not _is_retryable(e):
+          self.logger.error(f"Failed to fetch {description} (not retryable): {str(e)}")
+          return None
+        self.logger.error(f"Failed to fetch {description}: {str(e)}")
+        if attempt < 2:
+          time.sleep(min(30, 2 ** attempt) + random.uniform(0, 0.5))
     return None
 
+  def _fetch_single(self, symbol: str, timeframe: str) -> Optional[dict]:
+    """Получение данных для одного символа и таймфрейма"""
+    return self._with_retries(
+      f"{symbol} {timeframe}",
+      lambda: self._to_record(timeframe, TA_Handler(
+        symbol=symbol,
+        screener="crypto",
+        exchange="BINANCE",
+        interval=timeframe
+      ).get_analysis())
+    )
+
+  def _fetch_timeframe(self, timeframe: str) -> Dict[str, dict]:
+    """Данные всех SYMBOLS для одного таймфрейма одним запросом к сканеру TradingView"""
+    tickers = [f"BINANCE:{symbol}" for symbol in SYMBOLS]
+
+    def request() -> Dict[str, dict]:
+      analyses = get_multiple_analysis(screener="crypto", interval=timeframe, symbols=tickers)
+      records = {}
+      for symbol, ticker in zip(SYMBOLS, tickers):
+        analysis = analyses.get(ticker.upper())
+        if analysis is not None:
+          records[symbol] = self._to_record(timeframe, analysis)
+      return records
+
+    return self._with_retries(f"{timeframe} for {len(tickers)} symbols", request) or {}
+
   def fetch_all_data(self) -> Dict[str, Dict[str, dict]]:
-    """Основной метод получения данных"""
+    """Основной метод получения данных: один запрос на таймфрейм для всех символов,
+    таймфреймы запрашиваются параллельно, темп ограничивает общий token bucket"""
+    if not SYMBOLS or not TIMEFRAMES:
+      return {}
+
+    with ThreadPoolExecutor(max_workers=min(self.max_workers, len(TIMEFRAMES))) as pool:
+      fetched = list(pool.map(self._fetch_timeframe, TIMEFRAMES))
+
     results = {}
     for symbol in SYMBOLS:
-      symbol_data = {}
-      for timeframe in TIMEFRAMES:
-        if data := self._fetch_single(symbol, timeframe):
-          symbol_data[timeframe] = data
-        time.sleep(self.rate_limit_delay)
-
+      symbol_data = {
+        timeframe: records[symbol]
+        for timeframe, records in zip(TIMEFRAMES, fetched)
+        if symbol in records
+      }
       if symbol_data:
         results[symbol] = symbol_data
       else:
         self.logger.warning(f"No data for {symbol}")
-
-      time.sleep(self.rate_limit_delay * 2)
-    return results
\ No newline at end of file
+    return results
@@ -1,12 +1,17 @@
 # src/core/api/tradingview_client/analysis_saver.py
 from decimal import Decimal
 import json
+import os
+import orjson
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 from src.core.paths import TW_ANALYSIS
 
+# Файл с последней записью каждого символа: коллектор читает его вместо N файлов .jsonl
+LATEST_FILENAME = "_latest.json"
+
 
 class DecimalEncoder(json.JSONEncoder):
     def default(self, o):
@@ -14,14 +19,40 @@ class DecimalEncoder(json.JSONEncoder):
             return float(o)
         return super().default(o)
 
+def _decimal_default(o):
+    if isinstance(o, Decimal):
+        return float(o)
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+
+
+def _dump_line(entry: Dict) -> bytes:
+    return orjson.dumps(entry, default=_decimal_default, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def read_latest(storage_path: Path) -> Dict[str, Dict]:
+    """Последние записи символов из LATEST_FILENAME ({} если файла нет или он повреждён)"""
+    try:
+        latest = orjson.loads((storage_path / LATEST_FILENAME).read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+    return latest if isinstance(latest, dict) else {}
+
+
 class AnalysisSaver:
     def __init__(self, storage_path: Path = TW_ANALYSIS):
         self.storage = storage_path
         self.storage.mkdir(parents=True, exist_ok=True)
+        # Записи символов, сохранённые до перезапуска, остаются в индексе
+        self._latest: Dict[str, Dict] = read_latest(self.storage)
+        self._defer_latest = False
 
-    def _transform_entry(self, symbol: str, data: Dict) -> Dict:
+    @staticmethod
+    def _timestamp() -> str:
+        return datetime.utcnow().isoformat() + "Z"
+
+    def _transform_entry(self, symbol: str, data: Dict, timestamp: Optional[str] = None) -> Dict:
         return {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": timestamp or self._timestamp(),
             "symbol": symbol,
             "timeframes": {
                 tf: {
@@ -32,17 +63,39 @@ class AnalysisSaver:
             }
         }
 
-    def save_symbol_data(self, symbol: str, data: Dict):
-        transformed = self._transform_entry(symbol, data)
+    def save_symbol_data(self, symbol: str, data: Dict, timestamp: Optional[str] = None):
+        transformed = self._transform_entry(symbol, data, timestamp)
         file_path = self.storage / f"{symbol}.jsonl"
         try:
-            with open(file_path, "a") as f:
-                f.write(json.dumps(transformed, cls=DecimalEncoder) + "\n")
+            with open(file_path, "ab") as f:
+                f.write(_dump_line(transformed))
         except IOError as e:
             print(f"Save error for {symbol}: {str(e)}")
+            return
+
+        self._latest[symbol] = transformed
+        if not self._defer_latest:
+            self._write_latest()
+
+    def _write_latest(self):
+        """Атомарная перезапись файла последних записей (tmp + os.replace)"""
+        path = self.storage / LATEST_FILENAME
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_bytes(_dump_line(self._latest))
+            os.replace(tmp_path, path)
+        except IOError as e:
+            print(f"Latest index save error: {str(e)}")
 
     # Добавляем отсутствующий метод
     def batch_save(self, all_data: Dict[str, Dict]):
         """Пакетное сохранение данных для всех символов"""
-        for symbol, data in all_data.items():
-            self.save_symbol_data(symbol, data)
\ No newline at end of file
+        # Общая метка времени пакета; индекс последних записей перезаписывается один раз
+        timestamp = self._timestamp()
+        self._defer_latest = True
+        try:
+            for symbol, data in all_data.items():
+                self.save_symbol_data(symbol, data, timestamp)
+        finally:
+            self._defer_latest = False
+        self._write_latest()
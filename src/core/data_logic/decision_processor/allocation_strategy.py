@@ -1,7 +1,8 @@
-import json
 from decimal import Decimal, ROUND_DOWN, ROUND_UP, InvalidOperation
 import logging
+import orjson
 from typing import Dict, Optional
+from src.core.api.binance_client.symbol_spec import SymbolSpec, build_symbol_spec
 from src.core.settings.config import (
   BUY_THRESHOLD,
   SELL_THRESHOLD,
@@ -9,25 +10,97 @@ from src.core.settings.config import (
   MIN_ORDER_SIZE
 )
 
+# Общий логгер всех экземпляров (по одному на символ); имя совпадает с прежним именем по классу
+logger = logging.getLogger('AllocationStrategy')
+
+
+def _dump_symbol_info(symbol_info: Dict) -> str:
+  return orjson.dumps(symbol_info, default=str, option=orjson.OPT_INDENT_2).decode()
+
+# Схема symbol_info, развёрнутая при импорте в плоский список проверок:
+# (альтернативные пути к полю, допустимые типы значения). Поле считается
+# присутствующим, если найдено хотя бы по одному из путей (MIN_NOTIONAL - старый API)
+_NUMBER_TYPES = (Decimal, str, int, float)
+_SCHEMA_PROBES = (
+  ((('filters', 'LOT_SIZE', 'minQty'),), _NUMBER_TYPES),
+  ((('filters', 'LOT_SIZE', 'stepSize'),), _NUMBER_TYPES),
+  ((('filters', 'NOTIONAL', 'minNotional'), ('filters', 'MIN_NOTIONAL', 'minNotional')), _NUMBER_TYPES),
+)
+
+# Неизменные между вызовами Decimal-константы: создание Decimal и деление
+# заметно дороже остальной арифметики, поэтому считаются один раз
+_ZERO = Decimal(0)
+_ONE = Decimal(1)
+_TWO = Decimal(2)  # Максимальный |score| (STRONG_BUY/STRONG_SELL)
+_HALF = Decimal('0.5')
+_BALANCE_TOLERANCE = Decimal('1.0001')  # Допуск на округления при сверке с балансом
+_MIN_SELL_FRACTION = Decimal('0.1')  # Минимальная доля продажи при сигнале сильнее порога
+_THRESHOLD_SELL_FRACTION = Decimal('0.25')  # Доля продажи при score ровно на пороге
+_RANGE_EPSILON = Decimal('0.0001')  # Защита от деления на ноль
+
+
+# Константы, производные от настроек порогов, ALLOCATION_MAX_PERCENT и MIN_ORDER_SIZE
+_BUY_THRESHOLD_DEC = Decimal(str(BUY_THRESHOLD))
+_SELL_THRESHOLD_DEC = Decimal(str(SELL_THRESHOLD))
+_ABS_SELL_TH = abs(_SELL_THRESHOLD_DEC)
+_SELL_RANGE = _ONE - _ABS_SELL_TH  # Диапазон |score| от порога продажи до обычного SELL
+# SELL_THRESHOLD почти -1.0 - интерполировать не по чему, продаётся всё
+_SELL_RANGE_DEGENERATE = _SELL_RANGE <= _RANGE_EPSILON
+_RISK_FRACTION = Decimal(str(ALLOCATION_MAX_PERCENT)) / Decimal(100)
+# Сравнение Decimal с float/int из настроек шло бы через приведение типов на каждом вызове
+_MIN_ORDER_SIZE_DEC = Decimal(str(MIN_ORDER_SIZE))
+
+
+def _round_to_step(value: Decimal, step: Decimal, step_units: int, rounding: str) -> Decimal:
+  """
+  Округление до кратного шагу. Для шагов вида 10**k достаточно одного quantize;
+  quantize учитывает только экспоненту шага, поэтому шаги вроде 0.5 округляются
+  через целое число шагов.
+  """
+  if step_units == 1:  # Нормализованный шаг вида 10**k (см. SymbolSpec.step_units)
+    return value.quantize(step, rounding=rounding)
+  return (value / step).to_integral_value(rounding=rounding) * step
+
 
 class AllocationStrategy:
   def __init__(self, symbol: str, info_fetcher, position_manager):
     self.symbol = symbol
     self.info_fetcher = info_fetcher
     self.position_manager = position_manager
-    self.logger = logging.getLogger(self.__class__.__name__)
+    self.logger = logger
+    # Последний прошедший валидацию symbol_info. info_fetcher отдаёт один и тот же dict
+    # на символ (после refresh() - новый), поэтому повторная проверка того же объекта не нужна
+    self._last_validated: Optional[Dict] = None
+    # Разобранные фильтры по символу; действительны, пока info_fetcher отдаёт тот же dict
+    self._params_cache: Dict[str, SymbolSpec] = {}
+    self._last_symbol_info: Optional[Dict] = None
+
+  def _is_valid_symbol_info(self, symbol_info: Dict) -> bool:
+    """Валидация symbol_info; успешный результат запоминается для последнего объекта"""
+    if symbol_info is self._last_validated:
+      return True
+    valid = self._validate_symbol_info(symbol_info)
+    if valid:
+      self._last_validated = symbol_info
+    return valid
 
   def _validate_symbol_info(self, symbol_info: Dict) -> bool:
-    # Эта валидация должна быть более гибкой или вызываться с осторожностью,
-    # так как структура ответа Binance может немного меняться.
-    # Для простоты пока оставим базовую проверку.
-    if not symbol_info or 'filters' not in symbol_info:
-      self.logger.error(f"Symbol info for {self.symbol} is missing or malformed (no 'filters').")
+    """Проверка структуры symbol_info одним плоским проходом по _SCHEMA_PROBES"""
+    if not symbol_info or not isinstance(symbol_info.get('filters'), dict):
+      self.logger.error("Symbol info for %s is missing or malformed (no 'filters').", self.symbol)
       return False
-    if 'LOT_SIZE' not in symbol_info['filters'] or 'NOTIONAL' not in symbol_info['filters']:  # или MIN_NOTIONAL
-      self.logger.error(f"Essential filters LOT_SIZE or NOTIONAL missing for {self.symbol}.")
-      # Проверим также MIN_NOTIONAL на случай старого API
-      if 'MIN_NOTIONAL' not in symbol_info['filters']:
+    for paths, types in _SCHEMA_PROBES:
+      for path in paths:
+        node = symbol_info
+        for key in path[:-1]:
+          node = node.get(key)
+          if not isinstance(node, dict):
+            break
+        else:
+          if isinstance(node.get(path[-1]), types):
+            break
+      else:
+        self.logger.error("Essential field %s missing or invalid for %s.", '.'.join(paths[0]), self.symbol)
         return False
     return True
 
@@ -45,18 +118,30 @@ class AllocationStrategy:
           self.logger.error(f"Failed to convert score to Decimal for {self.symbol}.")
           return None
 
+      # Большинство сигналов не проходит порог - отсекаем их до запроса и валидации symbol_info
+      if signal == "BUY" and score < _BUY_THRESHOLD_DEC:
+        self.logger.debug("Buy score %.4f for %s is below threshold %s", score, self.symbol, _BUY_THRESHOLD_DEC)
+        return None
+      if signal == "SELL" and score > _SELL_THRESHOLD_DEC:  # score отрицательный, SELL_THRESHOLD тоже
+        self.logger.debug(
+          "[SELL] Score %.4f for %s is above (less negative/positive than) threshold %s",
+          score, self.symbol, _SELL_THRESHOLD_DEC
+        )
+        return None
+
       symbol_info = self.info_fetcher.get_symbol_info(self.symbol)
       if not symbol_info:
         self.logger.error(f"Symbol info not found for {self.symbol} in allocation calculation.")
         return None
 
-      if not self._validate_symbol_info(symbol_info):  # Валидация структуры
-        self.logger.error(f"Invalid symbol_info structure for {self.symbol}. Data:\n"
-                          f"{json.dumps(symbol_info, indent=2, default=str)}")
+      if not self._is_valid_symbol_info(symbol_info):  # Валидация структуры (с кэшем)
+        self.logger.error("Invalid symbol_info structure for %s.", self.symbol)
+        # Полный дамп symbol_info нужен только при отладке
+        if self.logger.isEnabledFor(logging.DEBUG):
+          self.logger.debug("Actual symbol_info for %s:\n%s", self.symbol, _dump_symbol_info(symbol_info))
         return None
 
-      self.logger.debug(f"Processing {signal} signal for {self.symbol} "
-                        f"with score: {score:.4f}")
+      self.logger.debug("Processing %s signal for %s with score: %.4f", signal, self.symbol, score)
 
       if signal == "BUY":
         result = self._calculate_buy(score, symbol_info)
@@ -66,10 +151,10 @@ class AllocationStrategy:
         result = None
 
       if result:
-        self.logger.info(f"Allocation calculated for {self.symbol} {signal}: {result}")
+        self.logger.info("Allocation calculated for %s %s: %s", self.symbol, signal, result)
         return result
 
-      self.logger.warning(f"No allocation could be calculated for {self.symbol} {signal} with score {score:.4f}")
+      self.logger.warning("No allocation could be calculated for %s %s with score %.4f", self.symbol, signal, score)
       return None
 
     except KeyError as e:
@@ -83,59 +168,43 @@ class AllocationStrategy:
                         f"{str(e)}", exc_info=True)
       return None
 
-  def _get_filter_param(self, symbol_info: Dict, filter_type: str, param_name: str, default_value: str) -> Decimal:
-    """Вспомогательная функция для безопасного извлечения параметра фильтра."""
-    try:
-      value_str = symbol_info['filters'][filter_type][param_name]
-      return Decimal(value_str)
-    except (KeyError, TypeError, InvalidOperation) as e:
-      self.logger.warning(
-        f"Could not get {param_name} from {filter_type} for {self.symbol}. Using default {default_value}. Error: {e}"
-      )
-      return Decimal(default_value)
+  def _get_symbol_spec(self, symbol_info: Dict) -> SymbolSpec:
+    """
+    Фильтры символа в виде SymbolSpec (Decimal-поля, нормализованный шаг).
+    Строится заново только при смене объекта symbol_info.
+    """
+    if symbol_info is self._last_symbol_info:
+      spec = self._params_cache.get(self.symbol)
+      if spec is not None:
+        return spec
+    spec = build_symbol_spec(
+      self.symbol,
+      symbol_info.get('base_asset'),
+      symbol_info.get('quote_asset', 'USDT'),
+      symbol_info['filters']
+    )
+    self._params_cache[self.symbol] = spec
+    self._last_symbol_info = symbol_info
+    return spec
 
   def _calculate_buy(self, score: Decimal, symbol_info: Dict) -> Optional[Dict]:
+    # Порог BUY_THRESHOLD проверяется в calculate_allocation
     try:
-      BUY_THRESHOLD_DEC = Decimal(str(BUY_THRESHOLD))  # Убедимся, что тип Decimal
-      if score < BUY_THRESHOLD_DEC:
-        self.logger.debug(f"Buy score {score:.4f} for {self.symbol} is below threshold {BUY_THRESHOLD_DEC}")
-        return None
-
-      step_size = self._get_filter_param(symbol_info, 'LOT_SIZE', 'stepSize', '0.00000001')
-      min_qty = self._get_filter_param(symbol_info, 'LOT_SIZE', 'minQty', '0.00000001')
-
-      # Обработка NOTIONAL или MIN_NOTIONAL фильтра
-      notional_filter_data = symbol_info['filters'].get('NOTIONAL')
-      min_notional_fallback = '5.0'  # Значение по умолчанию для minNotional
-      apply_to_market_default = True
-
-      if notional_filter_data:
-        min_notional_value = Decimal(str(notional_filter_data.get('minNotional', min_notional_fallback)))
-        apply_to_market = notional_filter_data.get('applyToMarket', apply_to_market_default)
-      elif 'MIN_NOTIONAL' in symbol_info['filters']:  # Старый API
-        notional_filter_data = symbol_info['filters']['MIN_NOTIONAL']
-        min_notional_value = Decimal(str(notional_filter_data.get('minNotional', min_notional_fallback)))
-        apply_to_market = notional_filter_data.get('applyMinToMarket', apply_to_market_default)
-      else:
-        self.logger.warning(
-          f"Neither NOTIONAL nor MIN_NOTIONAL filter found for {self.symbol}. Using default minNotional={min_notional_fallback}.")
-        min_notional_value = Decimal(min_notional_fallback)
-        apply_to_market = apply_to_market_default
+      spec = self._get_symbol_spec(symbol_info)
+      step_size, step_units, min_qty = spec.step_size, spec.step_units, spec.min_qty
+      min_notional_value, apply_to_market, quote_asset = spec.min_notional, spec.apply_to_market, spec.quote_asset
 
-      quote_asset = symbol_info.get('quote_asset', 'USDT')
-
-      current_price = self.info_fetcher.get_current_price(self.symbol)  # Возвращает Decimal
-      if not current_price or current_price <= Decimal('0'):
+      snapshot = self.info_fetcher.get_price_and_balance(self.symbol, quote_asset)  # {'price', 'free'} - Decimal
+      current_price = snapshot['price']
+      if not current_price or current_price <= _ZERO:
         self.logger.error(f"Invalid or zero current price ({current_price}) for {self.symbol} during BUY.")
         return None
 
-      balance_data = self.info_fetcher.get_asset_balance(quote_asset)  # Возвращает Dict[str, Decimal]
-      if not balance_data or balance_data['free'] <= Decimal('0'):
-        self.logger.info(f"Zero or no free balance for {quote_asset} ({self.symbol}).")
+      free_balance_quote = snapshot['free']
+      if not free_balance_quote or free_balance_quote <= _ZERO:
+        self.logger.info("Zero or no free balance for %s (%s).", quote_asset, self.symbol)
         return None
 
-      free_balance_quote = balance_data['free']
-
       # Расчет доступного капитала для сделки
       # score здесь может быть > 1 (STRONG_BUY). ALLOCATION_MAX_PERCENT - это максимум от баланса.
       # Сила сигнала (score) может влиять на то, какую часть от этого максимума мы берем.
@@ -146,10 +215,12 @@ class AllocationStrategy:
       # Доля от максимальной аллокации, зависящая от силы сигнала (score > BUY_THRESHOLD)
       # Нормализуем score относительно BUY_THRESHOLD (если BUY_THRESHOLD=1, score=1.5 -> factor=1.5)
       # Ограничим максимальный фактор, например, 2.0 (для STRONG_BUY)
-      score_factor = min(score / BUY_THRESHOLD_DEC, Decimal('2.0'))  # Max factor 2, if score is 2*BUY_THRESHOLD
+      score_factor = score / _BUY_THRESHOLD_DEC
+      if score_factor > _TWO:  # Max factor 2, if score is 2*BUY_THRESHOLD
+        score_factor = _TWO
 
       # Капитал для аллокации (не более ALLOCATION_MAX_PERCENT от свободного баланса)
-      max_capital_for_trade = free_balance_quote * (ALLOCATION_MAX_PERCENT / Decimal('100'))
+      max_capital_for_trade = free_balance_quote * _RISK_FRACTION
 
       # Аллоцируемый капитал = max_capital_for_trade * (доля от силы сигнала, но не более 100% от max_capital_for_trade)
       # Если score_factor = 1 (т.е. score == BUY_THRESHOLD), то берем, например, 50% от max_capital_for_trade
@@ -157,70 +228,70 @@ class AllocationStrategy:
       # Линейная интерполяция: (score_factor - 1) / (2-1) -> от 0 до 1. Прибавим 0.5, чтобы было от 0.5 до 1.5, но клипнем до 1.
       # Простая версия: если score сильный, берем больше.
 
-      effective_allocation_percentage_of_max = Decimal('0.5')  # Базовая аллокация при минимальном BUY_THRESHOLD
-      if score_factor > Decimal('1.0'):  # Если сигнал сильнее порога
-        effective_allocation_percentage_of_max += (score_factor - Decimal('1.0')) * Decimal(
-          '0.5')  # Добавляем до 50% сверху
-      effective_allocation_percentage_of_max = min(effective_allocation_percentage_of_max,
-                                                   Decimal('1.0'))  # Не более 100% от max_capital_for_trade
+      effective_allocation_percentage_of_max = _HALF  # Базовая аллокация при минимальном BUY_THRESHOLD
+      if score_factor > _ONE:  # Если сигнал сильнее порога
+        # Добавляем до 50% сверху; score_factor <= 2, поэтому итог не более 100% от max_capital_for_trade
+        effective_allocation_percentage_of_max += (score_factor - _ONE) * _HALF
 
       allocated_capital = max_capital_for_trade * effective_allocation_percentage_of_max
 
       # Убедимся, что аллоцированный капитал не меньше MIN_ORDER_SIZE (в quote_asset)
-      if allocated_capital < MIN_ORDER_SIZE:
-        if max_capital_for_trade >= MIN_ORDER_SIZE:  # Если можем взять MIN_ORDER_SIZE
-          allocated_capital = MIN_ORDER_SIZE
+      if allocated_capital < _MIN_ORDER_SIZE_DEC:
+        if max_capital_for_trade >= _MIN_ORDER_SIZE_DEC:  # Если можем взять MIN_ORDER_SIZE
+          allocated_capital = _MIN_ORDER_SIZE_DEC
           self.logger.debug(
-            f"Calculated allocation {allocated_capital} for {self.symbol} was less than MIN_ORDER_SIZE {MIN_ORDER_SIZE}. Adjusted to MIN_ORDER_SIZE.")
+            "Calculated allocation for %s was less than MIN_ORDER_SIZE %s. Adjusted to MIN_ORDER_SIZE.",
+            self.symbol, _MIN_ORDER_SIZE_DEC
+          )
         else:
           self.logger.info(
-            f"Max capital for trade {max_capital_for_trade:.4f} {quote_asset} for {self.symbol} "
-            f"is less than MIN_ORDER_SIZE {MIN_ORDER_SIZE} {quote_asset}. Cannot BUY."
+            "Max capital for trade %.4f %s for %s is less than MIN_ORDER_SIZE %s %s. Cannot BUY.",
+            max_capital_for_trade, quote_asset, self.symbol, _MIN_ORDER_SIZE_DEC, quote_asset
           )
           return None
 
       # Рассчитанное количество базового актива
       raw_quantity = allocated_capital / current_price
-      quantity = raw_quantity.quantize(step_size, rounding=ROUND_DOWN)
+      quantity = _round_to_step(raw_quantity, step_size, step_units, ROUND_DOWN)
 
       # Проверка минимального количества и минимального номинала
       if quantity < min_qty:
-        self.logger.info(f"Calculated quantity {quantity} for {self.symbol} BUY is less than minQty {min_qty}.")
+        self.logger.info("Calculated quantity %s for %s BUY is less than minQty %s.", quantity, self.symbol, min_qty)
         # Попробовать увеличить до min_qty, если это возможно по балансу и min_notional
         quantity = min_qty
         if quantity * current_price > allocated_capital or quantity * current_price > free_balance_quote:
           self.logger.info(
-            f"Cannot adjust quantity to minQty {min_qty} for {self.symbol} due to balance/notional constraints.")
+            "Cannot adjust quantity to minQty %s for %s due to balance/notional constraints.", min_qty, self.symbol)
           return None
-        self.logger.debug(f"Adjusted quantity to minQty {min_qty} for {self.symbol} BUY.")
+        self.logger.debug("Adjusted quantity to minQty %s for %s BUY.", min_qty, self.symbol)
 
       final_notional = quantity * current_price
       if apply_to_market and final_notional < min_notional_value:
         self.logger.info(
-          f"Final notional {final_notional:.4f} for {self.symbol} BUY is less than minNotional {min_notional_value:.4f}. "
-          f"Qty: {quantity}, Price: {current_price}"
+          "Final notional %.4f for %s BUY is less than minNotional %.4f. Qty: %s, Price: %s",
+          final_notional, self.symbol, min_notional_value, quantity, current_price
         )
         # Попробовать увеличить количество, чтобы удовлетворить min_notional
-        required_qty_for_min_notional = (min_notional_value / current_price).quantize(step_size, rounding=ROUND_UP)
+        required_qty_for_min_notional = _round_to_step(min_notional_value / current_price, step_size, step_units, ROUND_UP)
         if required_qty_for_min_notional * current_price > allocated_capital or \
           required_qty_for_min_notional * current_price > free_balance_quote:
-          self.logger.info(f"Cannot adjust quantity for {self.symbol} to meet minNotional due to balance constraints.")
+          self.logger.info("Cannot adjust quantity for %s to meet minNotional due to balance constraints.", self.symbol)
           return None
         quantity = required_qty_for_min_notional
         final_notional = quantity * current_price
         self.logger.debug(
-          f"Adjusted quantity to {quantity} for {self.symbol} to meet minNotional. New notional: {final_notional}")
+          "Adjusted quantity to %s for %s to meet minNotional. New notional: %s", quantity, self.symbol, final_notional)
 
       # Финальная проверка, что мы не превышаем баланс
-      if quantity * current_price > free_balance_quote * Decimal('1.0001'):  # Небольшой допуск на округления
+      if quantity * current_price > free_balance_quote * _BALANCE_TOLERANCE:  # Небольшой допуск на округления
         self.logger.error(
           f"FATAL: Calculated order cost {quantity * current_price:.4f} {quote_asset} for {self.symbol} BUY "
           f"exceeds free balance {free_balance_quote:.4f} {quote_asset} after all adjustments."
         )
         return None
 
-      if quantity <= Decimal(0):
-        self.logger.info(f"Final quantity for {self.symbol} BUY is zero or negative.")
+      if quantity <= _ZERO:
+        self.logger.info("Final quantity for %s BUY is zero or negative.", self.symbol)
         return None
 
       return {
@@ -228,6 +299,7 @@ class AllocationStrategy:
         'quantity': float(quantity),  # TransactionsExecutor ожидает float
         'calculated_notional': float(final_notional),
         'min_notional_filter': float(min_notional_value),
+        'available_before_buy': float(free_balance_quote),
         'current_price': float(current_price)
       }
 
@@ -237,147 +309,107 @@ class AllocationStrategy:
 
   def _calculate_sell(self, score: Decimal, symbol_info: Dict) -> Optional[Dict]:
     try:
-      self.logger.debug(f"[SELL] Starting calculation for {self.symbol}. Score: {score:.4f}")
+      self.logger.debug("[SELL] Starting calculation for %s. Score: %.4f", self.symbol, score)
 
-      SELL_THRESHOLD_DEC = Decimal(str(SELL_THRESHOLD))  # Убедимся, что тип Decimal
-      if score > SELL_THRESHOLD_DEC:  # score отрицательный, SELL_THRESHOLD тоже. score=-1, threshold=-0.5 -> (-1 > -0.5) is False -> OK
-        # score=-0.2, threshold=-0.5 -> (-0.2 > -0.5) is True -> Skip
-        self.logger.debug(
-          f"[SELL] Score {score:.4f} for {self.symbol} is above (less negative/positive than) threshold {SELL_THRESHOLD_DEC}")
-        return None
-
-      step_size = self._get_filter_param(symbol_info, 'LOT_SIZE', 'stepSize', '0.00000001')
-      min_qty = self._get_filter_param(symbol_info, 'LOT_SIZE', 'minQty', '0.00000001')
-      base_asset = symbol_info.get('base_asset')
+      # Порог SELL_THRESHOLD проверяется в calculate_allocation
+      spec = self._get_symbol_spec(symbol_info)
+      step_size, step_units, min_qty = spec.step_size, spec.step_units, spec.min_qty
+      min_notional_value, apply_to_market = spec.min_notional, spec.apply_to_market
+      quote_asset, base_asset = spec.quote_asset, spec.base_asset
       if not base_asset:
         self.logger.error(f"[SELL] Missing base_asset in symbol_info for {self.symbol}")
         return None
 
-      # Обработка NOTIONAL или MIN_NOTIONAL фильтра для рыночных продаж
-      notional_filter_data = symbol_info['filters'].get('NOTIONAL')
-      min_notional_fallback = '5.0'
-      apply_to_market_default = True  # Для продаж это обычно тоже True, если фильтр есть
-
-      if notional_filter_data:
-        min_notional_value = Decimal(str(notional_filter_data.get('minNotional', min_notional_fallback)))
-        apply_to_market = notional_filter_data.get('applyToMarket', apply_to_market_default)
-      elif 'MIN_NOTIONAL' in symbol_info['filters']:
-        notional_filter_data = symbol_info['filters']['MIN_NOTIONAL']
-        min_notional_value = Decimal(str(notional_filter_data.get('minNotional', min_notional_fallback)))
-        apply_to_market = notional_filter_data.get('applyMinToMarket', apply_to_market_default)  # Имя поля другое
-      else:
-        self.logger.warning(
-          f"[SELL] Neither NOTIONAL nor MIN_NOTIONAL filter found for {self.symbol}. Using default minNotional={min_notional_fallback}.")
-        min_notional_value = Decimal(min_notional_fallback)
-        apply_to_market = apply_to_market_default
-
-      balance_data = self.info_fetcher.get_asset_balance(base_asset)
-      if not balance_data or balance_data['free'] <= Decimal(0):
-        self.logger.info(f"[SELL] Zero or no free balance for {base_asset} ({self.symbol}).")
+      snapshot = self.info_fetcher.get_price_and_balance(self.symbol, base_asset)
+      available_qty_base = snapshot['free']
+      if not available_qty_base or available_qty_base <= _ZERO:
+        self.logger.info("[SELL] Zero or no free balance for %s (%s).", base_asset, self.symbol)
         return None
-      available_qty_base = balance_data['free']
-      self.logger.info(f"[SELL] Available {base_asset} for {self.symbol}: {available_qty_base:.8f}")
-
-      # Логика определения количества к продаже
-      # abs_score будет >= abs(SELL_THRESHOLD)
-      # Например, SELL_THRESHOLD = -0.45. Если score = -1.0 (STRONG_SELL), abs(score) = 1.0
-      # Если score = -0.5, abs(score) = 0.5
-      # Мы хотим продать долю, пропорциональную силе сигнала, или всё, если сигнал очень сильный.
-
-      # Нормализуем силу сигнала. Максимальный score по модулю = 2.0 (STRONG_SELL)
-      # abs(SELL_THRESHOLD) - это минимальный порог для продажи.
-      # (abs(score) - abs(SELL_THRESHOLD_DEC)) / (2.0 - abs(SELL_THRESHOLD_DEC)) -> от 0 до 1, как далеко мы от порога к макс.силе
-
-      normalized_sell_strength = Decimal('0.0')
-      max_abs_score_sell = Decimal('2.0')  # Соответствует STRONG_SELL
-      abs_sell_threshold = abs(SELL_THRESHOLD_DEC)
-
-      if abs(score) >= max_abs_score_sell:  # Очень сильный сигнал, продать всё
-        normalized_sell_strength = Decimal('1.0')
-      elif abs(score) > abs_sell_threshold:  # Сигнал сильнее порога
-        # Линейная интерполяция доли продажи
-        # (чем score более отрицательный, тем больше продаем)
-        # Пример: SELL_THRESHOLD = -0.5 (abs=0.5), STRONG_SELL = -2.0 (abs=2.0)
-        # score = -1.0 (abs=1.0). (1.0 - 0.5) / (2.0 - 0.5) = 0.5 / 1.5 = 0.33
-        # Это доля "сверх" минимального. Т.е. можно продать (например) 50% + 0.33 * 50%
-        # Упрощенная версия:
-        # if abs(score) >= 1.0 (например, "SELL" или "STRONG_SELL"), продать все.
-        # Иначе (если score между SELL_THRESHOLD и -1.0), продать долю.
-        if abs(score) >= Decimal('1.0'):  # Если обычный "SELL" или "STRONG_SELL"
-          normalized_sell_strength = Decimal('1.0')  # Продать всё
-        else:  # Если сигнал слабее "SELL", но сильнее порога
-          # Продаем пропорционально от abs(SELL_THRESHOLD) до 1.0
-          # abs(score) будет здесь между abs(SELL_THRESHOLD) и 1.0
-          # (abs(score) - abs_sell_threshold) / (1.0 - abs_sell_threshold)
-          # Эта формула даст от 0 до 1 в этом диапазоне.
-          # Пример: SELL_THRESHOLD=-0.5 (abs=0.5). score=-0.75 (abs=0.75)
-          # (0.75 - 0.5) / (1.0 - 0.5) = 0.25 / 0.5 = 0.5. Продаем 50% от доступного.
-          if (Decimal('1.0') - abs_sell_threshold) > Decimal('0.0001'):  # Защита от деления на ноль
-            normalized_sell_strength = (abs(score) - abs_sell_threshold) / (Decimal('1.0') - abs_sell_threshold)
-            normalized_sell_strength = max(Decimal('0.1'),
-                                           min(normalized_sell_strength, Decimal('1.0')))  # Минимум 10% если уж продаем
-          else:  # Если SELL_THRESHOLD очень близок к -1.0
-            normalized_sell_strength = Decimal('1.0')  # Продать всё
-      else:  # score == SELL_THRESHOLD (минимально допустимый для продажи)
-        normalized_sell_strength = Decimal('0.25')  # Продать небольшую часть, например 25%
+      self.logger.info("[SELL] Available %s for %s: %s", base_asset, self.symbol, available_qty_base)
+
+      # Доля доступного количества к продаже по силе сигнала (abs_score >= |SELL_THRESHOLD|):
+      #   |score| >= 2 (STRONG_SELL)          -> всё
+      #   |score| == |SELL_THRESHOLD|          -> 25%
+      #   |score| >= 1 (SELL)                  -> всё
+      #   |SELL_THRESHOLD| < |score| < 1        -> линейно от 0 до 1, но не меньше 10%
+      # Пример: SELL_THRESHOLD=-0.5, score=-0.75: (0.75 - 0.5) / (1.0 - 0.5) = 0.5 - продаём 50%.
+      # Одна плоская цепочка сравнений вместо вложенных ветвлений
+      abs_score = abs(score)
+
+      if abs_score >= _TWO:
+        normalized_sell_strength = _ONE
+      elif abs_score <= _ABS_SELL_TH:  # score ровно на пороге (минимально допустимый для продажи)
+        normalized_sell_strength = _THRESHOLD_SELL_FRACTION
+      elif abs_score >= _ONE or _SELL_RANGE_DEGENERATE:  # Обычный SELL или SELL_THRESHOLD почти -1.0
+        normalized_sell_strength = _ONE
+      else:
+        # abs_score < 1, поэтому доля < 1 - ограничиваем только снизу.
+        # Именно деление: умножение на заранее посчитанное 1/_SELL_RANGE даёт 0.4999...
+        # вместо 0.5 и после ROUND_DOWN теряет шаг количества
+        normalized_sell_strength = (abs_score - _ABS_SELL_TH) / _SELL_RANGE
+        if normalized_sell_strength < _MIN_SELL_FRACTION:  # Минимум 10% если уж продаем
+          normalized_sell_strength = _MIN_SELL_FRACTION
 
       raw_quantity_to_sell = available_qty_base * normalized_sell_strength
-      quantity_to_sell = raw_quantity_to_sell.quantize(step_size, rounding=ROUND_DOWN)
+      quantity_to_sell = _round_to_step(raw_quantity_to_sell, step_size, step_units, ROUND_DOWN)
 
       self.logger.debug(
-        f"[SELL] {self.symbol} | Score: {score:.4f}, NormStrength: {normalized_sell_strength:.4f} | "
-        f"Avail: {available_qty_base:.8f} | RawSellQty: {raw_quantity_to_sell:.8f} | FinalSellQty: {quantity_to_sell:.8f}"
+        "[SELL] %s | Score: %.4f, NormStrength: %.4f | Avail: %s | RawSellQty: %s | FinalSellQty: %s",
+        self.symbol, score, normalized_sell_strength, available_qty_base, raw_quantity_to_sell, quantity_to_sell
       )
 
       if quantity_to_sell < min_qty:
         # Если доступного для продажи (даже всего) меньше min_qty, и это не пыль
-        if available_qty_base >= min_qty and available_qty_base > Decimal(
-          0):  # Проверяем, что сам баланс не меньше min_qty
+        if available_qty_base >= min_qty and available_qty_base > _ZERO:  # Проверяем, что сам баланс не меньше min_qty
           # Если рассчитанное количество меньше min_qty, но у нас есть min_qty или больше,
           # и сигнал достаточно сильный, то можно продать min_qty.
           # Здесь нужно решить, стоит ли продавать min_qty, если стратегия сказала продать меньше.
           # Пока что, если расчетное < min_qty, но available_qty >= min_qty, то не продаем, если сигнал не очень сильный.
           # Если normalized_sell_strength > 0.5 (достаточно сильный сигнал), то можно попробовать продать min_qty.
-          if normalized_sell_strength >= Decimal('0.5') and available_qty_base >= min_qty:
-            quantity_to_sell = min_qty.quantize(step_size,
-                                                rounding=ROUND_DOWN)  # Убедимся, что min_qty тоже кратно step_size
+          if normalized_sell_strength >= _HALF and available_qty_base >= min_qty:
+            # Убедимся, что min_qty тоже кратно step_size
+            quantity_to_sell = _round_to_step(min_qty, step_size, step_units, ROUND_DOWN)
             self.logger.info(
-              f"[SELL] Adjusted quantity to minQty {quantity_to_sell} for {self.symbol} due to strong signal and available amount.")
+              "[SELL] Adjusted quantity to minQty %s for %s due to strong signal and available amount.",
+              quantity_to_sell, self.symbol
+            )
           else:
             self.logger.info(
-              f"[SELL] Calculated quantity {quantity_to_sell:.8f} for {self.symbol} is less than minQty {min_qty:.8f}. "
-              f"Available: {available_qty_base:.8f}. Signal strength: {normalized_sell_strength:.4f}. Skipping sell."
+              "[SELL] Calculated quantity %s for %s is less than minQty %s. "
+              "Available: %s. Signal strength: %.4f. Skipping sell.",
+              quantity_to_sell, self.symbol, min_qty, available_qty_base, normalized_sell_strength
             )
             return None
         else:  # Если самого баланса меньше min_qty
           self.logger.info(
-            f"[SELL] Available quantity {available_qty_base:.8f} for {self.symbol} is less than minQty {min_qty:.8f}. Skipping sell."
+            "[SELL] Available quantity %s for %s is less than minQty %s. Skipping sell.",
+            available_qty_base, self.symbol, min_qty
           )
           return None
 
       # Проверка минимального ноушенала для ПРОДАЖИ (если применимо)
-      current_price = self.info_fetcher.get_current_price(self.symbol)
-      if not current_price or current_price <= Decimal('0'):
+      current_price = snapshot['price']
+      if not current_price or current_price <= _ZERO:
         self.logger.error(f"[SELL] Invalid or zero current price ({current_price}) for {self.symbol}.")
         return None
 
       notional_value = quantity_to_sell * current_price
       if apply_to_market and notional_value < min_notional_value:
         self.logger.info(
-          f"[SELL] Notional value {notional_value:.4f} for {self.symbol} (Qty: {quantity_to_sell}) "
-          f"is less than minNotional {min_notional_value:.4f}. Skipping sell."
+          "[SELL] Notional value %.4f for %s (Qty: %s) is less than minNotional %.4f. Skipping sell.",
+          notional_value, self.symbol, quantity_to_sell, min_notional_value
         )
         # В случае продажи, если ноушенал маленький, обычно просто не продаем,
         # а не пытаемся увеличить количество (т.к. это изменит стратегию)
         return None
 
-      if quantity_to_sell <= Decimal(0):
-        self.logger.info(f"Final quantity to sell for {self.symbol} is zero or negative.")
+      if quantity_to_sell <= _ZERO:
+        self.logger.info("Final quantity to sell for %s is zero or negative.", self.symbol)
         return None
 
       self.logger.info(
-        f"[SELL] Calculated to sell: {quantity_to_sell:.8f} {self.symbol} "
-        f"(Value: {notional_value:.2f} {symbol_info.get('quote_asset', 'USDT')})"
+        "[SELL] Calculated to sell: %s %s (Value: %.2f %s)",
+        quantity_to_sell, self.symbol, notional_value, quote_asset
       )
 
       return {
@@ -1,13 +1,20 @@
 # src/core/data_logic/decision_processor/decision_maker.py
 import logging
+import threading
+import time
+from collections import OrderedDict
 from decimal import Decimal
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 
 from src.core.api.binance_client.info_fetcher import BinanceInfoFetcher
-from src.core.api.binance_client.transactions_executor import TransactionsExecutor
+from src.core.api.binance_client.transactions_executor import get_transactions_executor
 from src.core.data_logic.decision_processor.allocation_strategy import AllocationStrategy
 from src.core.data_logic.decision_processor.position_manager import PositionManager
 from src.core.data_logic.decision_processor.risk_engine import RiskEngine
+from src.core.settings.config import SIGNAL_DEDUP_WINDOW, SIGNAL_DEDUP_MAX_KEYS
+
+# Точность score в ключе дедупликации сигналов
+_DEDUP_SCORE_STEP = Decimal('0.0001')
 
 
 class DecisionMaker:
@@ -33,11 +40,50 @@ class DecisionMaker:
             position_manager=position_manager
         )
 
-        self.executor = TransactionsExecutor()
+        self.executor = get_transactions_executor()
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # (сигнал, score с точностью 1e-4) -> время начала исполнения
+        self._lock = threading.Lock()
+        self._recent_signals: "OrderedDict[Tuple[str, Decimal], float]" = OrderedDict()
+
     def process_signal(self, score: Decimal, signal: str) -> bool:
-        """Основной процесс обработки торгового сигнала"""
+        """
+        Основной процесс обработки торгового сигнала.
+        Повтор сигнала с тем же score в пределах SIGNAL_DEDUP_WINDOW после исполнения
+        (или пока исполняется первый) пропускается без расчета аллокации и повторного ордера.
+        """
+        key = self._dedup_key(score, signal)
+        if key is not None:
+            # Блокировка держится только на проверку и резервирование ключа, не на время ордера
+            with self._lock:
+                now = time.monotonic()
+                executed_at = self._recent_signals.get(key)
+                if executed_at is not None and now - executed_at < SIGNAL_DEDUP_WINDOW:
+                    self.logger.debug("Duplicate %s signal for %s (score %s) skipped", signal, self.symbol, score)
+                    return False
+                self._recent_signals[key] = now
+                self._recent_signals.move_to_end(key)
+                if len(self._recent_signals) > SIGNAL_DEDUP_MAX_KEYS:
+                    self._recent_signals.popitem(last=False)
+
+        executed = self._process_signal(score, signal)
+        if not executed and key is not None:
+            # Неисполненный сигнал можно повторить сразу
+            with self._lock:
+                if self._recent_signals.get(key) == now:
+                    del self._recent_signals[key]
+        return executed
+
+    @staticmethod
+    def _dedup_key(score: Decimal, signal: str) -> Optional[Tuple[str, Decimal]]:
+        """Ключ дедупликации; None, если score не Decimal (такой сигнал не дедуплицируется)"""
+        try:
+            return signal, score.quantize(_DEDUP_SCORE_STEP)
+        except (AttributeError, TypeError, ArithmeticError):
+            return None
+
+    def _process_signal(self, score: Decimal, signal: str) -> bool:
         try:
             if signal not in ("BUY", "SELL"):
                 self.logger.warning(f"Invalid signal: {signal} for {self.symbol}")
@@ -56,9 +102,14 @@ class DecisionMaker:
                 self.logger.warning(f"Risk validation failed for {self.symbol}. Allocation: {allocation}")
                 return False
 
+            # Баланс из снимка аллокации: котируемый актив для BUY, базовый для SELL
+            balance_key = "available_before_buy" if allocation["action"] == "BUY" else "available_before_sell"
             order_result = self._execute_order(
                 action=allocation["action"],
-                quantity=validated_quantity # validated_quantity уже Decimal
+                quantity=validated_quantity, # validated_quantity уже Decimal
+                # Переиспользуем снимок цены/баланса, полученный при расчете аллокации
+                current_price=allocation.get("current_price"),
+                available_balance=allocation.get(balance_key)
             )
 
             if order_result and order_result.get('success', False):
@@ -89,14 +140,22 @@ class DecisionMaker:
             self.logger.error(f"Decision process failed for {self.symbol}: {str(e)}", exc_info=True)
             return False
 
-    def _execute_order(self, action: str, quantity: Decimal) -> Optional[Dict]:
+    def _execute_order(
+      self,
+      action: str,
+      quantity: Decimal,
+      current_price: Optional[float] = None,
+      available_balance: Optional[float] = None
+    ) -> Optional[Dict]:
         """Исполнение ордера на бирже"""
         try:
             return self.executor.execute_order(
                 symbol=self.symbol,
                 side=action.upper(), # Убедимся, что side в верхнем регистре (BUY/SELL)
                 quantity=float(quantity), # TransactionsExecutor ожидает float
-                order_type="MARKET"
+                order_type="MARKET",
+                current_price=current_price,
+                available_balance=available_balance
             )
         except Exception as e:
             self.logger.error(f"Order execution failed for {self.symbol} {action} {quantity}: {str(e)}")
@@ -113,43 +172,43 @@ class DecisionMaker:
                 )
                 self.logger.info(f"Position CREATED for {self.symbol}: {quantity} @ {price}")
             elif action == "SELL":
-                # При продаже мы уменьшаем существующую позицию или закрываем ее.
-                # Логика закрытия/уменьшения должна быть в PositionManager.
-                # Для простоты, если есть активные позиции, попробуем обновить первую подходящую.
-                # В идеале, PositionManager должен сам решать, какую позицию закрывать/уменьшать.
+                # Позиции читаются из файла на каждый вызов, поэтому постоянный индекс по
+                # количеству пришлось бы перестраивать заново; один проход min() дешевле сортировки.
                 active_positions = self.position_manager.get_active_positions()
                 if not active_positions:
                     self.logger.warning(f"Tried to SELL {quantity} of {self.symbol}, but no active positions found.")
                     return
 
-                # Простая логика: пытаемся закрыть часть первой открытой позиции
-                # Более сложная логика может учитывать FIFO/LIFO или конкретные ID позиций
-                updated_any = False
+                # Best fit: наименьшая позиция, которая целиком покрывает продажу
+                best_fit = min(
+                    (pos for pos in active_positions if pos['quantity'] >= quantity),
+                    key=lambda pos: pos['quantity'],
+                    default=None
+                )
+                if best_fit is not None:
+                    remaining = best_fit['quantity'] - quantity
+                    self.position_manager.update_position(best_fit['id'], {"quantity": remaining})
+                    self.logger.info(f"Position UPDATED for {self.symbol} (ID: {best_fit['id']}): sold {quantity}, remaining {remaining}")
+                    return
+
+                # Продажа больше любой позиции: закрываем позиции по порядку открытия,
+                # остаток списываем с последней затронутой
+                to_sell = quantity
                 for pos in active_positions:
-                    if pos['quantity'] >= quantity:
-                        self.position_manager.update_position(
-                            pos['id'],
-                            {"quantity": pos['quantity'] - quantity} # quantity здесь это то, что продали
-                        )
-                        self.logger.info(f"Position UPDATED for {self.symbol} (ID: {pos['id']}): sold {quantity}, remaining {pos['quantity'] - quantity}")
-                        updated_any = True
-                        break # Обновили одну позицию, выходим
+                    if pos['quantity'] <= to_sell:
+                        self.position_manager.close_position(pos['id'])
+                        to_sell -= pos['quantity']
+                        self.logger.info(f"Position CLOSED for {self.symbol} (ID: {pos['id']}): sold {pos['quantity']}")
                     else:
-                        # Если продаваемое количество больше, чем в текущей позиции,
-                        # можно закрыть эту позицию и продолжить с остатком для следующих
-                        # (требует более сложной логики отслеживания остатка quantity_to_sell)
-                        self.logger.warning(
-                            f"Sell quantity {quantity} for {self.symbol} is more than "
-                            f"quantity in position {pos['id']} ({pos['quantity']}). "
-                            f"Partially closing or complex logic needed."
-                        )
-                        # Пока что просто пропустим, или можно закрыть эту позицию полностью, если quantity_to_sell > pos_qty
-                        # self.position_manager.close_position(pos['id'])
-                        # quantity -= pos['quantity']
-                        # if quantity <= 0: break
-
-                if not updated_any:
-                    self.logger.warning(f"Could not fully apply SELL of {quantity} {self.symbol} to existing positions.")
+                        remaining = pos['quantity'] - to_sell
+                        self.position_manager.update_position(pos['id'], {"quantity": remaining})
+                        self.logger.info(f"Position UPDATED for {self.symbol} (ID: {pos['id']}): sold {to_sell}, remaining {remaining}")
+                        to_sell = Decimal(0)
+                    if to_sell <= 0:
+                        break
+
+                if to_sell > 0:
+                    self.logger.warning(f"Could not fully apply SELL of {quantity} {self.symbol} to existing positions: {to_sell} unmatched.")
 
         except Exception as e:
             self.logger.error(f"Position update failed for {self.symbol}: {str(e)}", exc_info=True)
\ No newline at end of file
@@ -5,12 +5,10 @@ from pathlib import Path
 from decimal import Decimal, InvalidOperation
 from datetime import datetime
 from binance import Client
+from src.core.api.binance_client.rest_client import get_rest_client
 import logging
 from typing import List, Dict, Optional
 from src.core.settings.config import (
-    BINANCE_API_KEY,
-    BINANCE_SECRET_KEY,
-    TESTNET,
     PROFIT_TAKE_LEVELS
 )
 from src.core.paths import POSITIONS
@@ -30,15 +28,11 @@ class PositionManager:
     class PositionConflictError(PositionError):
         pass
 
-    def __init__(self, symbol: str, info_fetcher):
+    def __init__(self, symbol: str, info_fetcher, client: Optional[Client] = None):
         self.symbol = symbol
         self.info_fetcher = info_fetcher
         self.logger = logging.getLogger(self.__class__.__name__)  # <-- Добавьте эту строку
-        self.client = Client(
-            api_key=BINANCE_API_KEY,
-            api_secret=BINANCE_SECRET_KEY,
-            testnet=TESTNET
-        )
+        self.client = client if client is not None else get_rest_client()
         self._data_file = POSITIONS / f"{symbol}.json"
         self._data_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -160,8 +154,8 @@ class PositionManager:
 
             base_asset = symbol_info['base_asset']  # Вместо грубой замены USDT
 
-            # 2. Получаем и валидируем баланс
-            balance = self.client.get_asset_balance(asset=base_asset)
+            # 2. Получаем и валидируем баланс (из общего кэша балансов, без запроса /account на символ)
+            balance = self.info_fetcher.get_asset_balance(base_asset)
             self.logger.debug(f"Raw balance response: {balance}")
 
             if not balance or not isinstance(balance, dict):
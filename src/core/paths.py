@@ -11,16 +11,19 @@ COLLECTED_DATA = BASE_DIR / "collected_data"
 TW_ANALYSIS = COLLECTED_DATA / "tradingview_analysis"
 POSITIONS = COLLECTED_DATA / "positions"
 TELEGRAM_CACHE = COLLECTED_DATA / "telegram_cache"
+EXCHANGE_CACHE = COLLECTED_DATA / "exchange_cache"
 
 # Автоматическое создание директорий при первом импорте
 COLLECTED_DATA.mkdir(parents=True, exist_ok=True)
 TW_ANALYSIS.mkdir(exist_ok=True)
 POSITIONS.mkdir(exist_ok=True)
 TELEGRAM_CACHE.mkdir(exist_ok=True)
+EXCHANGE_CACHE.mkdir(exist_ok=True)
 
 # Пример структуры после создания:
 # src/
 # └── collected_data/
 #     ├── tradingview_analysis/
 #     ├── positions/
-#     └── telegram_cache/
\ No newline at end of file
+#     ├── telegram_cache/
+#     └── exchange_cache/
\ No newline at end of file
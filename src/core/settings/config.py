@@ -9,7 +9,8 @@ API_RATE_LIMIT_DELAY = 1.0        # Задержка между API запрос
 INIT_SYNC_DELAY = 3.0             # Задержка при стартовой синхронизации (секунды) 3.0
 
 # TradingView
-TV_FETCH_DELAY = 2.0              # Задержка между запросами к TradingView (секунды)
+TV_FETCH_DELAY = 2.0              # Средний интервал между запросами к TradingView (секунды)
+TV_FETCH_WORKERS = 8              # Параллельные запросы к TradingView (и допустимый всплеск запросов)
 
 # Основные настройки
 SYMBOLS = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "ADAUSDT"]
@@ -53,6 +54,8 @@ TRAILING_STOP_PERCENT = Decimal('1.5')
 MIN_PROFIT_TO_TRAIL = Decimal('2.0')
 MIN_ORDER_SIZE = Decimal('5.0')
 PROCESS_NOTIONAL_FILTER = True
+SIGNAL_DEDUP_WINDOW = 2.0          # Окно, в котором повтор исполненного сигнала с тем же score пропускается (секунды, 0 - выкл.)
+SIGNAL_DEDUP_MAX_KEYS = 256        # Максимум запоминаемых сигналов на символ
 
 PROFIT_TAKE_LEVELS = {
     2.0: 0.3,   # 30% at +2%
@@ -70,6 +73,20 @@ BINANCE_API_KEY = "замените_меня"     # ВАЖНО: замените
 BINANCE_SECRET_KEY = "замените_меня"  # ВАЖНО: замените на свой закрытый Binance ключ
 TESTNET = True
 SAFETY_MARGIN = 1.05
+EXCHANGE_INFO_CACHE_TTL = 600.0   # Время жизни кэша exchangeInfo (секунды)
+SYMBOLS_INFO_DISK_TTL = 86400.0   # Время жизни дискового кэша symbols_info между перезапусками (секунды)
+INVALID_SYMBOL_TTL = 60.0         # Время, в течение которого неизвестный символ не запрашивается повторно (секунды)
+PRICE_CACHE_TTL = 1.0             # Время жизни кэша цен всех символов (секунды)
+PRICE_STREAM = True               # Получать цены SYMBOLS из websocket bookTicker вместо опроса REST
+LIVE_PRICE_MAX_AGE = 5.0          # Максимальный возраст цены из потока, после которого используется REST (секунды)
+BALANCE_CACHE_TTL = 0.5           # Время жизни кэша балансов аккаунта (секунды)
+USER_DATA_STREAM = True           # Обновлять балансы через websocket user data stream вместо опроса REST
+USER_STREAM_BALANCE_TTL = 5.0     # Страховочный REST-снимок балансов при активном user data stream; зависание потока по событиям не видно (секунды)
+ORDER_FANOUT_WORKERS = 5          # Максимум ордеров, отправляемых параллельно
+REQUEST_WEIGHT_LIMIT = 6000       # Лимит веса REST-запросов Binance Spot на IP за окно
+REQUEST_WEIGHT_WINDOW = 60.0      # Окно лимита веса запросов (секунды)
+RATE_LIMIT_BACKOFF = 60.0         # Пауза после 429/418, если Binance не прислал Retry-After (секунды)
+HTTP_POOL_MAXSIZE = 32            # Максимум keep-alive соединений общего REST-клиента
 
 # Технические константы
 INF = 10**9
@@ -78,6 +95,8 @@ MIN_BALANCE_TO_SHOW = Decimal('0.001')
 
 DEFAULT_HISTORY_LIMIT = 10  # Количество записей по умолчанию
 MAX_HISTORY_LIMIT = 48      # Максимальное допустимое количество
+HISTORY_FETCH_WORKERS = 8   # Максимум параллельных запросов истории по символам
+ASYNC_HTTP_POOL_LIMIT = 32  # Размер пула соединений aiohttp для асинхронного клиента
 
 SYMBOL_FILTERS_KEYS = {
     'LOT_SIZE': ['minQty', 'stepSize'],
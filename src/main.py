@@ -7,7 +7,7 @@ import time
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 # Добавление корневой директории в PYTHONPATH
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -16,7 +16,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from src.core.api.tradingview_client.analysis_fetcher import TradingViewFetcher
 from src.core.api.tradingview_client.analysis_saver import AnalysisSaver
 from src.core.api.tradingview_client.analysis_collector import AnalysisCollector
-from src.core.api.binance_client.info_fetcher import BinanceInfoFetcher
+from src.core.api.binance_client.info_fetcher import get_info_fetcher
+from src.core.api.binance_client.price_stream import PriceStream
+from src.core.api.binance_client.user_stream import UserDataStream
 from src.core.data_logic.timeframe_weights_calculator import calculate_timeframe_weights
 from src.core.data_logic.score_processor import ScoreProcessor
 from src.core.data_logic.decision_processor.decision_maker import DecisionMaker
@@ -31,9 +33,8 @@ from src.core.settings.config import (
     INIT_SYNC_DELAY,
     MIN_SCORE_FOR_EXECUTION,
     DATA_STALE_MINUTES,
-    BINANCE_API_KEY,
-    BINANCE_SECRET_KEY,
-    TESTNET
+    USER_DATA_STREAM,
+    PRICE_STREAM
 )
 
 def setup_logging():
@@ -61,11 +62,8 @@ class TradingBot:
         self.analysis_fetcher = TradingViewFetcher()
         self.analysis_saver = AnalysisSaver()
         self.analysis_collector = AnalysisCollector()
-        self.info_fetcher = BinanceInfoFetcher(
-            api_key=BINANCE_API_KEY,
-            api_secret=BINANCE_SECRET_KEY,
-            testnet=TESTNET
-        )
+        self.info_fetcher = get_info_fetcher()
+        self.streams = self._start_streams()
 
         # Инициализация компонентов
         self._init_components()
@@ -92,6 +90,25 @@ class TradingBot:
             for symbol in SYMBOLS
         }
 
+    def _start_streams(self) -> List:
+        """Запуск websocket-потоков балансов и цен (при ошибке - работа через REST)"""
+        client = self.info_fetcher.client
+        streams = []
+        if USER_DATA_STREAM:
+            streams.append(UserDataStream(client))
+        if PRICE_STREAM:
+            streams.append(PriceStream(client, SYMBOLS))
+
+        started = []
+        for stream in streams:
+            try:
+                stream.start()
+                started.append(stream)
+            except Exception as e:
+                self.logger.warning(f"{stream.__class__.__name__} unavailable, using REST: {str(e)}")
+                stream.stop()
+        return started
+
     def _is_data_stale(self) -> bool:
         """Проверка актуальности данных"""
         if not self.last_data_update:
@@ -183,6 +200,8 @@ class TradingBot:
             logging.critical(f"Critical error: {str(e)}", exc_info=True)
             time.sleep(ERROR_RETRY_DELAY)
         finally:
+            for stream in self.streams:
+                stream.stop()
             logging.info("Trading bot stopped")
 
 if __name__ == "__main__":
@@ -36,7 +36,12 @@ def setup_handlers(application):
 
 def main():
   try:
-    application = ApplicationBuilder().token(TELEGRAM_BOT_TOKEN).build()
+    application = (
+      ApplicationBuilder()
+      .token(TELEGRAM_BOT_TOKEN)
+      .post_shutdown(info_handlers.close_info_clients)
+      .build()
+    )
     setup_handlers(application)
     logging.info("Starting telegram bot")
     application.run_polling()
@@ -7,7 +7,7 @@ from telegram.ext import ContextTypes, CommandHandler
 from decimal import Decimal
 from typing import Optional
 
-from src.core.api.binance_client.info_fetcher import BinanceInfoFetcher
+from src.core.api.binance_client.info_fetcher import BinanceInfoFetcher, get_info_fetcher
 from src.core.api.tradingview_client.analysis_collector import AnalysisCollector
 from src.telegram_bot.services.formatters import format_balance, format_analysis, format_trade_history
 from src.core.settings.telegram_config import TELEGRAM_ADMINS
@@ -16,19 +16,12 @@ from src.core.settings.config import (
   SYMBOLS,
   MIN_BALANCE_TO_SHOW,
   MAX_HISTORY_LIMIT,
-  DEFAULT_HISTORY_LIMIT,
-  BINANCE_API_KEY,
-  BINANCE_SECRET_KEY,
-  TESTNET
+  DEFAULT_HISTORY_LIMIT
 )
 
 logger = logging.getLogger(__name__)
 
-info_fetcher = BinanceInfoFetcher(
-    api_key=BINANCE_API_KEY,
-    api_secret=BINANCE_SECRET_KEY,
-    testnet=TESTNET
-)
+info_fetcher = get_info_fetcher()
 analysis_collector = AnalysisCollector(storage_path=TW_ANALYSIS)
 
 
@@ -45,13 +38,6 @@ async def show_balance(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     return
 
   try:
-    # Инициализация клиента с авторизацией
-    info_fetcher = BinanceInfoFetcher(
-      api_key=BINANCE_API_KEY,
-      api_secret=BINANCE_SECRET_KEY,
-      testnet=TESTNET
-    )
-
     balance_list = []
     total_usd = Decimal(0)
     processed_assets = set()
@@ -175,7 +161,10 @@ async def show_analysis(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     await update.message.reply_text("🔥 Критическая ошибка при загрузке анализа")
 
 
-from src.core.api.binance_client.trading_history_fetcher import BinanceTradingHistoryFetcher
+from src.core.api.binance_client.trading_history_fetcher import AsyncBinanceTradingHistoryFetcher
+
+# Один AsyncClient на процесс бота: ping, время сервера и exchangeInfo запрашиваются один раз
+history_fetcher = AsyncBinanceTradingHistoryFetcher()
 
 
 async def show_history(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -187,8 +176,8 @@ async def show_history(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     limit = int(args[0]) if args else DEFAULT_HISTORY_LIMIT
     limit = min(max(limit, 1), MAX_HISTORY_LIMIT)
 
-    history_fetcher = BinanceTradingHistoryFetcher()
-    trades = history_fetcher.get_all_trades_history(limit=limit)  # Используем новый метод
+    # Асинхронный клиент не блокирует event loop бота на время запросов
+    trades = await history_fetcher.fetch_all_trades_history(limit=limit)
 
     if not trades:
       await update.message.reply_text("📭 История торгов пуста")
@@ -204,6 +193,11 @@ async def show_history(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     await update.message.reply_text("⚠️ Ошибка при получении истории")
 
 
+async def close_info_clients(application) -> None:
+  """Закрытие соединения общего загрузчика истории при остановке бота"""
+  await history_fetcher.close()
+
+
 def get_info_handlers():
   return [
     CommandHandler("balance", show_balance),
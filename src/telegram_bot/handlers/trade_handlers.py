@@ -11,9 +11,9 @@ from telegram.ext import (
 )
 from decimal import Decimal
 from src.core.settings.telegram_config import TELEGRAM_ADMINS
-from src.core.api.binance_client.transactions_executor import TransactionsExecutor, OrderExecutionError
-from src.core.api.binance_client.info_fetcher import BinanceInfoFetcher
-from src.core.settings.config import SYMBOLS, BINANCE_API_KEY, BINANCE_SECRET_KEY, TESTNET
+from src.core.api.binance_client.transactions_executor import get_transactions_executor, OrderExecutionError
+from src.core.api.binance_client.info_fetcher import get_info_fetcher
+from src.core.settings.config import SYMBOLS
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +22,8 @@ SELECT_SYMBOL, ENTER_QUANTITY, CONFIRM_TRADE = range(3)
 
 class TradeHandlers:
   def __init__(self):
-    self.executor = TransactionsExecutor()
-    self.info_fetcher = BinanceInfoFetcher(
-      api_key=BINANCE_API_KEY,
-      api_secret=BINANCE_SECRET_KEY,
-      testnet=TESTNET
-    )
+    self.executor = get_transactions_executor()
+    self.info_fetcher = get_info_fetcher()
 
   async def check_admin(self, update: Update) -> bool:
     user = update.effective_user
@@ -236,19 +232,13 @@ class TradeHandlers:
   def _has_balance_for_symbol(self, symbol: str, action: str) -> bool:
     asset_to_check = None
     try:
-      if symbol not in self.executor.symbols_info:
-        self.executor._get_symbol_filters(symbol)
-
-      symbol_details = self.executor.symbols_info.get(symbol)
-      if not symbol_details:
-        logger.warning(f"Не удалось получить детали символа {symbol} для проверки баланса.")
-        return False
+      spec = self.executor._get_symbol_spec(symbol)
 
       action_lower = action.lower()
       if action_lower == "buy":
-        asset_to_check = symbol_details.get('quote_asset')
+        asset_to_check = spec.quote_asset
       elif action_lower == "sell":
-        asset_to_check = symbol_details.get('base_asset')
+        asset_to_check = spec.base_asset
       else:
         logger.warning(f"Неизвестное действие '{action}' для проверки баланса по символу {symbol}.")
         return False
@@ -80,29 +80,34 @@ def test_calculate_allocation_invalid_structure(allocation_strategy, valid_symbo
 
 def test_calculate_buy_below_threshold(allocation_strategy, valid_symbol_info):
   allocation_strategy.info_fetcher.get_symbol_info.return_value = valid_symbol_info
-  result = allocation_strategy._calculate_buy(
+  result = allocation_strategy.calculate_allocation(
     Decimal(str(BUY_THRESHOLD)) - Decimal('0.1'),
-    valid_symbol_info
+    "BUY"
   )
   assert result is None
+  # Порог проверяется до запроса symbol_info
+  allocation_strategy.info_fetcher.get_symbol_info.assert_not_called()
 
 
 def test_calculate_sell_above_threshold(allocation_strategy, valid_symbol_info):
   allocation_strategy.info_fetcher.get_symbol_info.return_value = valid_symbol_info
-  result = allocation_strategy._calculate_sell(
+  result = allocation_strategy.calculate_allocation(
     Decimal(str(SELL_THRESHOLD)) + Decimal('0.1'),
-    valid_symbol_info
+    "SELL"
   )
   assert result is None
+  allocation_strategy.info_fetcher.get_symbol_info.assert_not_called()
 
 
 def test_calculate_sell_success(allocation_strategy, valid_symbol_info):
   allocation_strategy.info_fetcher.get_symbol_info.return_value = valid_symbol_info
-  allocation_strategy.info_fetcher.get_asset_balance.return_value = {'free': Decimal('1.5')}
-  allocation_strategy.info_fetcher.get_current_price.return_value = Decimal('50000')
+  allocation_strategy.info_fetcher.get_price_and_balance.return_value = {
+    'price': Decimal('50000'), 'free': Decimal('1.5')
+  }
 
   result = allocation_strategy._calculate_sell(Decimal('-0.8'), valid_symbol_info)
 
+  allocation_strategy.info_fetcher.get_price_and_balance.assert_called_once_with('BTCUSDT', 'BTC')
   assert result is not None
   assert result['action'] == 'SELL'
   assert result['quantity'] == pytest.approx(0.954) # Based on SUT logic for score -0.8 and SELL_THRESHOLD -0.45
@@ -111,8 +116,9 @@ def test_calculate_sell_success(allocation_strategy, valid_symbol_info):
 
 def test_calculate_sell_insufficient_balance(allocation_strategy, valid_symbol_info):
   allocation_strategy.info_fetcher.get_symbol_info.return_value = valid_symbol_info
-  allocation_strategy.info_fetcher.get_asset_balance.return_value = {'free': Decimal('0')}
-  allocation_strategy.info_fetcher.get_current_price.return_value = Decimal('50000')
+  allocation_strategy.info_fetcher.get_price_and_balance.return_value = {
+    'price': Decimal('50000'), 'free': Decimal('0')
+  }
   result = allocation_strategy._calculate_sell(Decimal('-0.8'), valid_symbol_info)
   assert result is None
 
@@ -141,4 +147,184 @@ def test_calculation_errors_logged(allocation_strategy, valid_symbol_info):
       assert result is None
       mock_logger.assert_called()
       assert any("Unexpected error in allocation calculation" in call_args[0][0] for call_args in mock_logger.call_args_list)
-      assert any("Test buy error" in call_args[0][0] for call_args in mock_logger.call_args_list)
\ No newline at end of file
+      assert any("Test buy error" in call_args[0][0] for call_args in mock_logger.call_args_list)
+
+def test_validation_cached_per_symbol_info(allocation_strategy, valid_symbol_info):
+  with patch.object(allocation_strategy, '_validate_symbol_info', wraps=allocation_strategy._validate_symbol_info) as spy:
+    assert allocation_strategy._is_valid_symbol_info(valid_symbol_info) is True
+    assert allocation_strategy._is_valid_symbol_info(valid_symbol_info) is True
+    assert spy.call_count == 1
+
+    # Новый объект (например, после refresh() в info_fetcher) проверяется заново
+    broken = {**valid_symbol_info, 'filters': {'NOTIONAL': valid_symbol_info['filters']['NOTIONAL']}}
+    assert allocation_strategy._is_valid_symbol_info(broken) is False
+    assert spy.call_count == 2
+
+    # Невалидный результат не запоминается
+    assert allocation_strategy._is_valid_symbol_info(broken) is False
+    assert spy.call_count == 3
+
+
+def test_validate_symbol_info_legacy_min_notional(allocation_strategy, valid_symbol_info):
+  valid_symbol_info['filters']['MIN_NOTIONAL'] = valid_symbol_info['filters'].pop('NOTIONAL')
+  assert allocation_strategy._validate_symbol_info(valid_symbol_info) is True
+
+  del valid_symbol_info['filters']['MIN_NOTIONAL']
+  assert allocation_strategy._validate_symbol_info(valid_symbol_info) is False
+
+
+def test_validate_symbol_info_missing_step_size(allocation_strategy, valid_symbol_info):
+  del valid_symbol_info['filters']['LOT_SIZE']['stepSize']
+  assert allocation_strategy._validate_symbol_info(valid_symbol_info) is False
+
+
+def test_buy_below_threshold_skips_symbol_info(allocation_strategy, valid_symbol_info, monkeypatch):
+  from src.core.data_logic.decision_processor import allocation_strategy as module
+  score = Decimal(str(BUY_THRESHOLD)) + Decimal('0.1')
+  monkeypatch.setattr(module, '_BUY_THRESHOLD_DEC', score + Decimal('1'))
+  allocation_strategy.info_fetcher.get_symbol_info.return_value = valid_symbol_info
+  assert allocation_strategy.calculate_allocation(score, "BUY") is None
+  allocation_strategy.info_fetcher.get_symbol_info.assert_not_called()
+
+
+def test_symbol_spec_built_once_per_symbol_info(allocation_strategy, valid_symbol_info):
+  from src.core.data_logic.decision_processor import allocation_strategy as module
+  with patch.object(module, 'build_symbol_spec', wraps=module.build_symbol_spec) as spy:
+    spec = allocation_strategy._get_symbol_spec(valid_symbol_info)
+    assert allocation_strategy._get_symbol_spec(valid_symbol_info) is spec
+    assert spy.call_count == 1
+    assert spec.step_size == Decimal('0.001')
+    assert spec.min_notional == Decimal('10')
+    assert spec.base_asset == 'BTC'
+
+    # Новый объект symbol_info (обновление exchangeInfo) разбирается заново
+    allocation_strategy._get_symbol_spec(dict(valid_symbol_info))
+    assert spy.call_count == 2
+
+
+@pytest.mark.parametrize("step_size, expected", [
+  (Decimal('0.00100000'), 0.954),  # stepSize в формате Binance с хвостовыми нулями
+  (Decimal('0.5'), 0.5),           # шаг не вида 10**k
+])
+def test_calculate_sell_rounds_to_step(allocation_strategy, valid_symbol_info, step_size, expected):
+  valid_symbol_info['filters']['LOT_SIZE']['stepSize'] = step_size
+  allocation_strategy.info_fetcher.get_price_and_balance.return_value = {
+    'price': Decimal('50000'), 'free': Decimal('1.5')
+  }
+
+  result = allocation_strategy._calculate_sell(Decimal('-0.8'), valid_symbol_info)
+
+  assert result['quantity'] == pytest.approx(expected)
+
+
+def test_calculate_buy_uses_single_snapshot(allocation_strategy, valid_symbol_info):
+  allocation_strategy.info_fetcher.get_price_and_balance.return_value = {
+    'price': Decimal('50000'), 'free': Decimal('1000')
+  }
+
+  result = allocation_strategy._calculate_buy(Decimal(str(BUY_THRESHOLD)), valid_symbol_info)
+
+  allocation_strategy.info_fetcher.get_price_and_balance.assert_called_once_with('BTCUSDT', 'USDT')
+  allocation_strategy.info_fetcher.get_current_price.assert_not_called()
+  allocation_strategy.info_fetcher.get_asset_balance.assert_not_called()
+  assert result['action'] == 'BUY'
+  assert result['current_price'] == 50000.0
+  assert result['available_before_buy'] == 1000.0
+
+
+def test_symbol_spec_keeps_decimal_values(allocation_strategy, valid_symbol_info):
+  spec = allocation_strategy._get_symbol_spec(valid_symbol_info)
+  # Значения, уже приведённые info_fetcher к Decimal, не пересоздаются
+  assert spec.min_qty is valid_symbol_info['filters']['LOT_SIZE']['minQty']
+  assert spec.min_notional is valid_symbol_info['filters']['NOTIONAL']['minNotional']
+
+
+def test_symbol_spec_parses_raw_strings(allocation_strategy, valid_symbol_info):
+  valid_symbol_info['filters']['LOT_SIZE']['minQty'] = '0.00100000'
+  valid_symbol_info['filters']['NOTIONAL']['minNotional'] = 10
+  spec = allocation_strategy._get_symbol_spec(valid_symbol_info)
+  assert spec.min_qty == Decimal('0.001')
+  assert spec.min_notional == Decimal('10')
+
+
+@pytest.mark.parametrize("score, expected_qty", [
+  (Decimal('-0.46'), 0.15),   # Сила ниже 10% - продаём минимальную долю
+  (Decimal('-0.8'), 0.954),
+])
+def test_calculate_sell_strength_clamped(allocation_strategy, valid_symbol_info, score, expected_qty):
+  allocation_strategy.info_fetcher.get_price_and_balance.return_value = {
+    'price': Decimal('50000'), 'free': Decimal('1.5')
+  }
+  result = allocation_strategy._calculate_sell(score, valid_symbol_info)
+  assert result['quantity'] == pytest.approx(expected_qty)
+
+
+def test_calculate_buy_factor_capped(allocation_strategy, valid_symbol_info):
+  allocation_strategy.info_fetcher.get_price_and_balance.return_value = {
+    'price': Decimal('100'), 'free': Decimal('1000')
+  }
+  # score сильнее 2 * BUY_THRESHOLD даёт не больше ALLOCATION_MAX_PERCENT от баланса
+  result = allocation_strategy._calculate_buy(Decimal(str(BUY_THRESHOLD)) * 5, valid_symbol_info)
+  assert result['calculated_notional'] == pytest.approx(float(Decimal('1000') * ALLOCATION_MAX_PERCENT / 100))
+
+
+def test_invalid_structure_dumps_only_at_debug(allocation_strategy, valid_symbol_info, caplog):
+  from src.core.data_logic.decision_processor import allocation_strategy as module
+  del valid_symbol_info['filters']['LOT_SIZE']
+  allocation_strategy.info_fetcher.get_symbol_info.return_value = valid_symbol_info
+  score = Decimal(str(BUY_THRESHOLD)) + Decimal('0.1')
+
+  with patch.object(module, '_dump_symbol_info', wraps=module._dump_symbol_info) as dump:
+    caplog.set_level('INFO', logger='AllocationStrategy')
+    assert allocation_strategy.calculate_allocation(score, "BUY") is None
+    dump.assert_not_called()
+
+    caplog.set_level('DEBUG', logger='AllocationStrategy')
+    assert allocation_strategy.calculate_allocation(score, "BUY") is None
+    dump.assert_called_once_with(valid_symbol_info)
+  assert '"minNotional": "10"' in caplog.text
+
+
+def test_instances_share_module_logger(allocation_strategy):
+  from src.core.data_logic.decision_processor import allocation_strategy as module
+  other = AllocationStrategy(symbol="ETHUSDT", info_fetcher=Mock(), position_manager=Mock())
+  assert allocation_strategy.logger is other.logger is module.logger
+  assert module.logger.name == 'AllocationStrategy'
+
+
+def test_min_order_size_raises_small_allocation(allocation_strategy, valid_symbol_info, monkeypatch):
+  from src.core.data_logic.decision_processor import allocation_strategy as module
+  assert isinstance(module._MIN_ORDER_SIZE_DEC, Decimal)
+  allocation_strategy.info_fetcher.get_price_and_balance.return_value = {
+    'price': Decimal('100'), 'free': Decimal('100')
+  }
+  # 30% от 100 USDT при минимальном score = 15 USDT < 20 -> аллокация поднимается до MIN_ORDER_SIZE
+  monkeypatch.setattr(module, '_MIN_ORDER_SIZE_DEC', Decimal('20'))
+  result = allocation_strategy._calculate_buy(Decimal(str(BUY_THRESHOLD)), valid_symbol_info)
+  assert result['calculated_notional'] == pytest.approx(20.0)
+
+
+@pytest.mark.parametrize("score, expected_qty", [
+  (Decimal(str(SELL_THRESHOLD)), 0.375),  # Ровно на пороге - 25%
+  (Decimal('-1.0'), 1.5),                 # Обычный SELL - всё
+  (Decimal('-2.5'), 1.5),                 # STRONG_SELL - всё
+])
+def test_calculate_sell_strength_bands(allocation_strategy, valid_symbol_info, score, expected_qty):
+  allocation_strategy.info_fetcher.get_price_and_balance.return_value = {
+    'price': Decimal('50000'), 'free': Decimal('1.5')
+  }
+  result = allocation_strategy._calculate_sell(score, valid_symbol_info)
+  assert result['quantity'] == pytest.approx(expected_qty)
+
+
+def test_calculate_sell_degenerate_threshold_sells_all(allocation_strategy, valid_symbol_info, monkeypatch):
+  from src.core.data_logic.decision_processor import allocation_strategy as module
+  allocation_strategy.info_fetcher.get_price_and_balance.return_value = {
+    'price': Decimal('50000'), 'free': Decimal('1.5')
+  }
+  assert module._SELL_RANGE_DEGENERATE is False
+  monkeypatch.setattr(module, '_ABS_SELL_TH', Decimal('0.99995'))
+  monkeypatch.setattr(module, '_SELL_RANGE', Decimal('0.00005'))
+  monkeypatch.setattr(module, '_SELL_RANGE_DEGENERATE', True)
+  result = allocation_strategy._calculate_sell(Decimal('-0.99999'), valid_symbol_info)
+  assert result['quantity'] == pytest.approx(1.5)
@@ -112,4 +112,27 @@ def test_get_history_invalid_json_raises_error(collector, tmp_path):
 
   # Проверяем, что возникает ошибка JSONDecodeError при чтении невалидной строки
   with pytest.raises(json.JSONDecodeError):
-    collector.get_history(symbol)
\ No newline at end of file
+    collector.get_history(symbol)
+
+def test_get_latest_for_symbol_without_trailing_newline(collector, tmp_path):
+  (tmp_path / 'TEST1.jsonl').write_text(json.dumps({'id': 1}) + '\n' + json.dumps({'id': 2}))
+
+  assert collector.get_latest_for_symbol('TEST1') == {'id': 2}
+  assert collector.get_history('TEST1', limit=5) == [{'id': 1}, {'id': 2}]
+
+
+def test_get_history_skips_blank_lines(collector, tmp_path):
+  (tmp_path / 'TEST1.jsonl').write_text(json.dumps({'id': 1}) + '\n\n' + json.dumps({'id': 2}) + '\n\n')
+
+  assert collector.get_latest_for_symbol('TEST1') == {'id': 2}
+  assert collector.get_history('TEST1', limit=2) == [{'id': 1}, {'id': 2}]
+  assert collector.get_history('TEST1', limit=0) == []
+
+
+def test_get_all_latest_prefers_saver_index(collector, tmp_path, mock_symbols):
+  (tmp_path / '_latest.json').write_text(json.dumps({'TEST1': {'test': 'indexed'}}))
+  (tmp_path / 'TEST1.jsonl').write_text(json.dumps({'test': 'from_file'}) + '\n')
+  (tmp_path / 'TEST2.jsonl').write_text(json.dumps({'test': 'data2'}) + '\n')
+
+  result = collector.get_all_latest()
+  assert result == {'TEST1': {'test': 'indexed'}, 'TEST2': {'test': 'data2'}}
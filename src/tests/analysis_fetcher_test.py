@@ -1,9 +1,11 @@
 # tests/core/api/tradingview_client/test_analysis_fetcher.py
 import pytest
+import threading
 from unittest.mock import Mock
 import logging
 from tradingview_ta import TA_Handler
-from src.core.api.tradingview_client.analysis_fetcher import TradingViewFetcher
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from src.core.api.tradingview_client.analysis_fetcher import TradingViewFetcher, _is_retryable
 
 
 @pytest.fixture
@@ -57,14 +59,108 @@ def test_fetch_single_default_recommendation(fetcher, mock_ta_handler, mock_conf
   assert result["score"] == 0
 
 
-def test_fetch_all_data_partial_failure(fetcher, mock_ta_handler, mock_config, caplog):
+def test_fetch_single_normalizes_lowercase_recommendation(mock_ta_handler, mock_config):
+  fetcher = TradingViewFetcher(rate_limit_delay=0)
   mock_instance = Mock()
-  mock_instance.get_analysis.side_effect = Exception("Error")
+  mock_instance.get_analysis.return_value.summary = {"RECOMMENDATION": "buy"}
   mock_ta_handler.return_value = mock_instance
 
+  result = fetcher._fetch_single("BTCUSD", "1H")
+
+  assert result["recommendation"] == "BUY"
+  assert result["score"] == 1
+
+
+@pytest.fixture
+def mock_multiple_analysis(mocker):
+  return mocker.patch('src.core.api.tradingview_client.analysis_fetcher.get_multiple_analysis')
+
+
+def analysis_with(recommendation):
+  analysis = Mock()
+  analysis.summary = {"RECOMMENDATION": recommendation}
+  return analysis
+
+
+def test_fetch_all_data_partial_failure(fetcher, mock_multiple_analysis, mock_config, caplog, mocker):
+  mocker.patch('src.core.api.tradingview_client.analysis_fetcher.time.sleep')
+  mock_multiple_analysis.side_effect = Exception("Error")
+
   result = fetcher.fetch_all_data()
 
   assert 'BTCUSD' not in result
   assert 'ETHUSD' not in result
   assert "No data for BTCUSD" in caplog.text
-  assert "No data for ETHUSD" in caplog.text
\ No newline at end of file
+  assert "No data for ETHUSD" in caplog.text
+
+
+def test_fetch_all_data_one_request_per_timeframe(fetcher, mock_multiple_analysis, mock_config):
+  # Оба таймфрейма должны запрашиваться одновременно, иначе barrier не пропустит
+  barrier = threading.Barrier(2, timeout=5)
+
+  def multiple_analysis(screener, interval, symbols):
+    barrier.wait()
+    return {
+      "BINANCE:BTCUSD": analysis_with("BUY" if interval == '1H' else "STRONG_BUY"),
+      "BINANCE:ETHUSD": None
+    }
+
+  mock_multiple_analysis.side_effect = multiple_analysis
+
+  result = fetcher.fetch_all_data()
+
+  assert mock_multiple_analysis.call_count == 2
+  mock_multiple_analysis.assert_any_call(screener="crypto", interval='1H', symbols=['BINANCE:BTCUSD', 'BINANCE:ETHUSD'])
+  assert list(result) == ['BTCUSD']
+  assert list(result['BTCUSD']) == ['1H', '4H']
+  assert result['BTCUSD']['1H']['score'] == 1
+  assert result['BTCUSD']['4H']['score'] == 2
+
+
+def test_rate_limiter_paces_requests():
+  fetcher = TradingViewFetcher(rate_limit_delay=2.0, max_workers=4)
+
+  assert fetcher.rate_limiter.limit == 4
+  assert fetcher.rate_limiter.rate == pytest.approx(0.5)
+  assert TradingViewFetcher(rate_limit_delay=0).rate_limiter is None
+
+
+@pytest.mark.parametrize("error, retryable", [
+  (RequestsConnectionError("reset"), True),
+  (TimeoutError(), True),
+  (Exception("Can't access TradingView's API. HTTP status code: 429. Check for invalid symbol"), True),
+  (Exception("Can't access TradingView's API. HTTP status code: 503. Check for invalid symbol"), True),
+  (Exception("Can't access TradingView's API. HTTP status code: 400. Check for invalid symbol"), False),
+  (Exception("Exchange or symbol not found."), False),
+  (KeyError("data"), False),
+])
+def test_is_retryable(error, retryable):
+  assert _is_retryable(error) is retryable
+
+
+def test_fetch_single_retries_network_errors_with_backoff(fetcher, mock_ta_handler, mock_config, mocker):
+  sleep = mocker.patch('src.core.api.tradingview_client.analysis_fetcher.time.sleep')
+  mock_instance = Mock()
+  ok = Mock()
+  ok.summary = {"RECOMMENDATION": "BUY"}
+  mock_instance.get_analysis.side_effect = [RequestsConnectionError("reset"), TimeoutError(), ok]
+  mock_ta_handler.return_value = mock_instance
+
+  result = fetcher._fetch_single("BTCUSD", "1H")
+
+  assert result["score"] == 1
+  delays = [c.args[0] for c in sleep.call_args_list]
+  assert len(delays) == 2
+  assert 1 <= delays[0] <= 1.5
+  assert 2 <= delays[1] <= 2.5
+
+
+def test_fetch_single_fails_fast_on_permanent_error(fetcher, mock_ta_handler, mock_config, mocker):
+  sleep = mocker.patch('src.core.api.tradingview_client.analysis_fetcher.time.sleep')
+  mock_instance = Mock()
+  mock_instance.get_analysis.side_effect = Exception("Exchange or symbol not found.")
+  mock_ta_handler.return_value = mock_instance
+
+  assert fetcher._fetch_single("BTCUSD", "1H") is None
+  assert mock_instance.get_analysis.call_count == 1
+  sleep.assert_not_called()
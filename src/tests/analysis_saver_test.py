@@ -5,7 +5,13 @@ from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch, mock_open
 import pytest
-from src.core.api.tradingview_client.analysis_saver import AnalysisSaver, DecimalEncoder
+from src.core.api.tradingview_client.analysis_saver import (
+  AnalysisSaver,
+  DecimalEncoder,
+  LATEST_FILENAME,
+  _dump_line,
+  read_latest
+)
 
 
 class TestDecimalEncoder:
@@ -20,6 +26,12 @@ class TestDecimalEncoder:
     assert result == '{"value": "test", "num": 123}'
 
 
+def test_dump_line_serializes_decimals():
+  line = _dump_line({"value": Decimal("10.5"), "name": "test"})
+  assert line.endswith(b"\n")
+  assert json.loads(line) == {"value": 10.5, "name": "test"}
+
+
 class TestAnalysisSaver:
   @pytest.fixture
   def storage_path(self, tmp_path):
@@ -106,6 +118,45 @@ class TestAnalysisSaver:
     saver.batch_save(all_data)
 
     assert mock_save.call_count == 2
-    calls = [mocker.call(saver, "BTCUSD", all_data["BTCUSD"]),
-             mocker.call(saver, "ETHUSD", all_data["ETHUSD"])]
-    mock_save.assert_has_calls(calls, any_order=True)
\ No newline at end of file
+    calls = [mocker.call(saver, "BTCUSD", all_data["BTCUSD"], mocker.ANY),
+             mocker.call(saver, "ETHUSD", all_data["ETHUSD"], mocker.ANY)]
+    mock_save.assert_has_calls(calls, any_order=True)
+
+  def test_batch_save_shares_one_timestamp(self, saver, storage_path):
+    saver.batch_save({
+      "BTCUSD": {"1H": {"score": Decimal(5.5), "recommendation": "BUY"}},
+      "ETHUSD": {"4H": {"score": Decimal(6.0), "recommendation": "SELL"}}
+    })
+
+    latest = read_latest(storage_path)
+    assert latest["BTCUSD"]["timestamp"] == latest["ETHUSD"]["timestamp"]
+
+  def test_latest_index_tracks_last_entry_per_symbol(self, saver, storage_path):
+    saver.save_symbol_data("BTCUSD", {"1H": {"score": Decimal(1), "recommendation": "BUY"}})
+    saver.save_symbol_data("BTCUSD", {"1H": {"score": Decimal(2), "recommendation": "STRONG_BUY"}})
+
+    latest = read_latest(storage_path)
+    assert list(latest) == ["BTCUSD"]
+    assert latest["BTCUSD"]["timeframes"]["1H"]["score"] == 2.0
+
+  def test_batch_save_writes_latest_index_once(self, saver, storage_path, mocker):
+    write_latest = mocker.spy(AnalysisSaver, "_write_latest")
+    saver.batch_save({
+      "BTCUSD": {"1H": {"score": Decimal(5.5), "recommendation": "BUY"}},
+      "ETHUSD": {"4H": {"score": Decimal(6.0), "recommendation": "SELL"}}
+    })
+
+    assert write_latest.call_count == 1
+    assert set(read_latest(storage_path)) == {"BTCUSD", "ETHUSD"}
+
+  def test_latest_index_survives_restart(self, saver, storage_path):
+    saver.save_symbol_data("BTCUSD", {"1H": {"score": Decimal(1), "recommendation": "BUY"}})
+
+    restarted = AnalysisSaver(storage_path)
+    restarted.save_symbol_data("ETHUSD", {"1H": {"score": Decimal(1), "recommendation": "BUY"}})
+    assert set(read_latest(storage_path)) == {"BTCUSD", "ETHUSD"}
+
+  def test_read_latest_ignores_corrupt_index(self, storage_path):
+    storage_path.mkdir(parents=True)
+    (storage_path / LATEST_FILENAME).write_text("{broken")
+    assert read_latest(storage_path) == {}
@@ -0,0 +1,91 @@
+# tests/core/api/binance_client/test_balance_book.py
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock
+from binance import Client
+from src.core.api.binance_client.balance_book import BalanceBook, get_balance_book
+
+
+@pytest.fixture
+def mock_client():
+  client = MagicMock(spec=Client)
+  client.get_account.return_value = {
+    'balances': [
+      {'asset': 'BTC', 'free': '1.5', 'locked': '0.5'},
+      {'asset': 'USDT', 'free': '10000', 'locked': '0'}
+    ]
+  }
+  return client
+
+
+def test_get_indexes_balances_by_asset(mock_client):
+  book = BalanceBook(mock_client, ttl=60)
+  assert book.get('BTC') == {'free': Decimal('1.5'), 'locked': Decimal('0.5')}
+  assert book.get('USDT')['free'] == Decimal('10000')
+  assert book.get('ETH') is None
+  mock_client.get_account.assert_called_once()
+
+
+def test_get_refreshes_after_ttl(mock_client):
+  book = BalanceBook(mock_client, ttl=0)
+  book.get('BTC')
+  book.get('BTC')
+  assert mock_client.get_account.call_count == 2
+
+
+def test_invalidate_forces_refresh(mock_client):
+  book = BalanceBook(mock_client, ttl=60)
+  book.get('BTC')
+  book.invalidate()
+  book.get('BTC')
+  assert mock_client.get_account.call_count == 2
+
+
+def test_apply_updates_overrides_assets(mock_client):
+  book = BalanceBook(mock_client, ttl=60)
+  book.get('BTC')
+  book.apply_updates([{'a': 'BTC', 'f': '0.25', 'l': '0.00'}, {'a': 'ETH', 'f': '3', 'l': '1'}])
+  assert book.get('BTC') == {'free': Decimal('0.25'), 'locked': Decimal('0.00')}
+  assert book.get('ETH')['locked'] == Decimal('1')
+  assert book.get('USDT')['free'] == Decimal('10000')
+  mock_client.get_account.assert_called_once()
+
+
+def test_live_mode_uses_live_ttl(mock_client):
+  book = BalanceBook(mock_client, ttl=0, live_ttl=60)
+  book.set_live(True)
+  book.get('BTC')
+  book.get('BTC')
+  assert mock_client.get_account.call_count == 1
+
+  book.set_live(False)
+  book.get('BTC')
+  assert mock_client.get_account.call_count == 2
+
+
+def test_live_mode_still_refreshes_after_live_ttl(mock_client, mocker):
+  clock = mocker.patch('src.core.api.binance_client.balance_book.time.monotonic', return_value=100.0)
+  book = BalanceBook(mock_client, ttl=0, live_ttl=5)
+  book.set_live(True)
+  book.get('BTC')
+
+  # Событий из потока нет (сокет мог молча зависнуть) - снимок всё равно обновляется
+  clock.return_value = 106.0
+  book.get('BTC')
+  assert mock_client.get_account.call_count == 2
+
+
+def test_is_fresh_follows_active_ttl(mock_client):
+  book = BalanceBook(mock_client, ttl=-1, live_ttl=60)
+  assert book.is_fresh() is False
+  book.get('BTC')
+  assert book.is_fresh() is False  # Вне режима live снимок сразу устаревает
+
+  book.set_live(True)
+  book.get('BTC')
+  assert book.is_fresh() is True
+
+
+def test_get_balance_book_shared_per_client(mock_client):
+  assert get_balance_book(mock_client) is get_balance_book(mock_client)
+  assert get_balance_book(MagicMock(spec=Client)) is not get_balance_book(mock_client)
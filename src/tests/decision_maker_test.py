@@ -25,14 +25,17 @@ def mock_position_manager():
 
 
 @pytest.fixture
-def decision_maker(mock_info_fetcher, mock_position_manager):
-  dm = DecisionMaker(
+def decision_maker(mock_info_fetcher, mock_position_manager, monkeypatch):
+  # Настоящий исполнитель создал бы клиент Binance (ping при создании) - тесты не ходят в сеть
+  monkeypatch.setattr(
+    'src.core.data_logic.decision_processor.decision_maker.get_transactions_executor',
+    lambda: Mock(spec=TransactionsExecutor)
+  )
+  return DecisionMaker(
     symbol="BTCUSDT",
     info_fetcher=mock_info_fetcher,
     position_manager=mock_position_manager
   )
-  dm.executor = Mock(spec=TransactionsExecutor)
-  return dm
 
 
 @pytest.fixture
@@ -106,7 +109,9 @@ def test_process_signal_successful_flow(
     symbol="BTCUSDT",
     side="BUY",
     quantity=50.0,
-    order_type="MARKET"
+    order_type="MARKET",
+    current_price=None,
+    available_balance=None
   )
   mock_position_manager.create_position.assert_called_once_with(
     entry_price=Decimal('50000.0'),
@@ -144,7 +149,8 @@ def test_execute_order_success(mock_executor, decision_maker):
   result = decision_maker._execute_order("BUY", Decimal('100'))
   assert result == {"status": "FILLED", "avg_price": "50000.0", "success": True}
   mock_executor.execute_order.assert_called_once_with(
-      symbol="BTCUSDT", side="BUY", quantity=100.0, order_type="MARKET"
+      symbol="BTCUSDT", side="BUY", quantity=100.0, order_type="MARKET",
+      current_price=None, available_balance=None
   )
 
 
@@ -189,4 +195,135 @@ def test_update_position_sell_no_active_positions(mock_position_manager, decisio
 
   decision_maker._update_position("SELL", Decimal('50'), Decimal('50000.0'))
   mock_position_manager.update_position.assert_not_called()
-  assert "Tried to SELL 50 of BTCUSDT, but no active positions found." in caplog.text
\ No newline at end of file
+  assert "Tried to SELL 50 of BTCUSDT, but no active positions found." in caplog.text
+
+
+def test_update_position_sell_picks_smallest_fitting_position(mock_position_manager, decision_maker):
+  mock_position_manager.get_active_positions.return_value = [
+    {'id': 1, 'quantity': Decimal('100'), 'position_type': 'LONG'},
+    {'id': 2, 'quantity': Decimal('10'), 'position_type': 'LONG'},
+    {'id': 3, 'quantity': Decimal('40'), 'position_type': 'LONG'}
+  ]
+
+  decision_maker._update_position("SELL", Decimal('30'), Decimal('51000.0'))
+  mock_position_manager.update_position.assert_called_once_with(
+    3, {'quantity': Decimal('10')}
+  )
+
+
+def test_update_position_sell_spreads_over_several_positions(mock_position_manager, decision_maker, caplog):
+  mock_position_manager.get_active_positions.return_value = [
+    {'id': 1, 'quantity': Decimal('20'), 'position_type': 'LONG'},
+    {'id': 2, 'quantity': Decimal('30'), 'position_type': 'LONG'}
+  ]
+
+  decision_maker._update_position("SELL", Decimal('35'), Decimal('51000.0'))
+  mock_position_manager.close_position.assert_called_once_with(1)
+  mock_position_manager.update_position.assert_called_once_with(
+    2, {'quantity': Decimal('15')}
+  )
+  assert "Could not fully apply SELL" not in caplog.text
+
+
+def test_update_position_sell_reports_unmatched_remainder(mock_position_manager, decision_maker, caplog):
+  decision_maker._update_position("SELL", Decimal('120'), Decimal('51000.0'))
+  mock_position_manager.close_position.assert_called_once_with(1)
+  mock_position_manager.update_position.assert_not_called()
+  assert "Could not fully apply SELL of 120 BTCUSDT to existing positions: 20 unmatched." in caplog.text
+
+def test_process_signal_buy_reuses_allocation_snapshot(
+  decision_maker, mock_strategy, mock_risk_engine, mock_executor
+):
+  mock_strategy.calculate_allocation.return_value = {
+    "action": "BUY",
+    "quantity": 0.002,
+    "current_price": 50000.0,
+    "available_before_buy": 1000.0
+  }
+  mock_risk_engine.validate_quantity.return_value = Decimal('0.002')
+  mock_executor.execute_order.return_value = {"success": True, "avg_price": "50000.0"}
+
+  assert decision_maker.process_signal(Decimal('1.2'), "BUY") is True
+  mock_executor.execute_order.assert_called_once_with(
+    symbol="BTCUSDT",
+    side="BUY",
+    quantity=0.002,
+    order_type="MARKET",
+    current_price=50000.0,
+    available_balance=1000.0
+  )
+
+
+@pytest.fixture
+def successful_buy(mock_strategy, mock_risk_engine, mock_executor):
+  mock_strategy.calculate_allocation.return_value = {
+    "action": "BUY",
+    "quantity": 0.002,
+    "current_price": 50000.0,
+    "available_before_buy": 1000.0
+  }
+  mock_risk_engine.validate_quantity.return_value = Decimal('0.002')
+  mock_executor.execute_order.return_value = {"success": True, "avg_price": "50000.0"}
+  return mock_executor
+
+
+def test_process_signal_skips_duplicate_within_window(decision_maker, successful_buy, caplog):
+  caplog.set_level(logging.DEBUG)
+  assert decision_maker.process_signal(Decimal('1.2'), "BUY") is True
+  assert decision_maker.process_signal(Decimal('1.20001'), "BUY") is False
+
+  successful_buy.execute_order.assert_called_once()
+  assert "Duplicate BUY signal for BTCUSDT" in caplog.text
+
+
+def test_process_signal_different_score_is_not_duplicate(decision_maker, successful_buy):
+  assert decision_maker.process_signal(Decimal('1.2'), "BUY") is True
+  assert decision_maker.process_signal(Decimal('1.3'), "BUY") is True
+  assert successful_buy.execute_order.call_count == 2
+
+
+def test_process_signal_failed_signal_is_retried(decision_maker, successful_buy):
+  successful_buy.execute_order.return_value = {"success": False}
+  assert decision_maker.process_signal(Decimal('1.2'), "BUY") is False
+  assert decision_maker.process_signal(Decimal('1.2'), "BUY") is False
+  assert successful_buy.execute_order.call_count == 2
+
+
+def test_process_signal_duplicate_after_window(decision_maker, successful_buy, monkeypatch):
+  import src.core.data_logic.decision_processor.decision_maker as module
+  clock = iter([100.0, 100.0 + module.SIGNAL_DEDUP_WINDOW])
+  monkeypatch.setattr(module.time, "monotonic", lambda: next(clock))
+
+  assert decision_maker.process_signal(Decimal('1.2'), "BUY") is True
+  assert decision_maker.process_signal(Decimal('1.2'), "BUY") is True
+  assert successful_buy.execute_order.call_count == 2
+
+
+def test_process_signal_dedup_keys_are_bounded(decision_maker, successful_buy, monkeypatch):
+  import src.core.data_logic.decision_processor.decision_maker as module
+  monkeypatch.setattr(module, "SIGNAL_DEDUP_MAX_KEYS", 2)
+
+  for score in ("1.1", "1.2", "1.3"):
+    decision_maker.process_signal(Decimal(score), "BUY")
+
+  assert list(decision_maker._recent_signals) == [("BUY", Decimal('1.2000')), ("BUY", Decimal('1.3000'))]
+
+
+@pytest.mark.parametrize("score", [None, "abc", Decimal('sNaN')])
+def test_process_signal_bad_score_is_not_raised(decision_maker, mock_strategy, score, caplog):
+  mock_strategy.calculate_allocation.side_effect = TypeError("bad score")
+
+  assert decision_maker.process_signal(score, "BUY") is False
+  assert "Decision process failed for BTCUSDT: bad score" in caplog.text
+  assert not decision_maker._recent_signals
+
+
+def test_process_signal_duplicate_skipped_while_first_in_flight(decision_maker, successful_buy):
+  def reenter(*args, **kwargs):
+    # Тот же сигнал приходит, пока первый ордер еще исполняется
+    assert decision_maker.process_signal(Decimal('1.2'), "BUY") is False
+    return {"success": True, "avg_price": "50000.0"}
+
+  successful_buy.execute_order.side_effect = reenter
+  assert decision_maker.process_signal(Decimal('1.2'), "BUY") is True
+  successful_buy.execute_order.assert_called_once()
@@ -1,17 +1,41 @@
 # tests/core/api/binance_client/test_info_fetcher.py
+import os
 import pytest
 from decimal import Decimal
 from unittest.mock import MagicMock
 from binance import Client, exceptions
 import logging
-from src.core.api.binance_client.info_fetcher import BinanceInfoFetcher
+from src.core.api.binance_client import info_fetcher as info_fetcher_module
+from src.core.api.binance_client.info_fetcher import BinanceInfoFetcher, get_info_fetcher
 import pytest_mock
 
+EXCHANGE_INFO = {
+    'symbols': [
+        {
+            'symbol': 'BTCUSDT',
+            'baseAsset': 'BTC',
+            'quoteAsset': 'USDT',
+            'filters': [
+                {'filterType': 'LOT_SIZE', 'minQty': '0.001', 'stepSize': '0.001'},
+                {'filterType': 'PRICE_FILTER', 'tickSize': '0.01'},
+                {'filterType': 'NOTIONAL', 'minNotional': '10.0', 'applyToMarket': True}
+            ]
+        }
+    ]
+}
+
+@pytest.fixture(autouse=True)
+def clear_exchange_info_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(info_fetcher_module, '_SYMBOLS_CACHE_DIR', tmp_path)
+    info_fetcher_module._EXCHANGE_INFO_CACHE.clear()
+    yield
+    info_fetcher_module._EXCHANGE_INFO_CACHE.clear()
+
 @pytest.fixture
 def mock_binance_client(mocker: pytest_mock.MockerFixture):
     mock_client = mocker.MagicMock(spec=Client)
     mocker.patch(
-        'src.core.api.binance_client.info_fetcher.Client',
+        'src.core.api.binance_client.info_fetcher.get_rest_client',
         return_value=mock_client
     )
     return mock_client
@@ -50,6 +74,75 @@ def test_load_symbols_info_success(mock_binance_client, binance_info_fetcher, ca
     assert 'BTCUSDT' in binance_info_fetcher.symbols_info
     assert 'Loaded info for 1 symbols' in caplog.text
 
+def test_exchange_info_cached_between_instances(mock_binance_client):
+    mock_binance_client.get_exchange_info.return_value = EXCHANGE_INFO
+    first = BinanceInfoFetcher('key', 'secret', testnet=True)
+    second = BinanceInfoFetcher('key', 'secret', testnet=True)
+    mock_binance_client.get_exchange_info.assert_called_once()
+    assert second.get_symbol_info('BTCUSDT') == first.get_symbol_info('BTCUSDT')
+
+def test_refresh_reloads_exchange_info(mock_binance_client):
+    mock_binance_client.get_exchange_info.return_value = EXCHANGE_INFO
+    fetcher = BinanceInfoFetcher('key', 'secret', testnet=True)
+    fetcher.refresh()
+    assert mock_binance_client.get_exchange_info.call_count == 2
+    assert 'BTCUSDT' in fetcher.symbols_info
+
+def test_refresh_invalidates_client_exchange_info(mock_binance_client):
+    mock_binance_client.get_exchange_info.return_value = EXCHANGE_INFO
+    mock_binance_client.invalidate_exchange_info = MagicMock()
+    fetcher = BinanceInfoFetcher('key', 'secret', testnet=True)
+    fetcher.refresh()
+    mock_binance_client.invalidate_exchange_info.assert_called_once_with()
+
+def test_symbols_info_persisted_to_disk(mock_binance_client, tmp_path):
+    mock_binance_client.get_exchange_info.return_value = EXCHANGE_INFO
+    first = BinanceInfoFetcher('key', 'secret', testnet=True)
+    assert (tmp_path / 'symbols_info_testnet.json').exists()
+
+    # Имитация перезапуска процесса: память пуста, остаётся только файл
+    info_fetcher_module._EXCHANGE_INFO_CACHE.clear()
+    second = BinanceInfoFetcher('key', 'secret', testnet=True)
+    mock_binance_client.get_exchange_info.assert_called_once()
+    assert second.get_symbol_info('BTCUSDT') == first.get_symbol_info('BTCUSDT')
+    assert second.get_symbol_info('BTCUSDT')['filters']['NOTIONAL']['minNotional'] == Decimal('10.0')
+    assert isinstance(second.get_symbol_info('BTCUSDT')['filters']['LOT_SIZE']['stepSize'], Decimal)
+
+def test_stale_disk_cache_ignored(mock_binance_client, tmp_path):
+    mock_binance_client.get_exchange_info.return_value = EXCHANGE_INFO
+    BinanceInfoFetcher('key', 'secret', testnet=True)
+    cache_file = tmp_path / 'symbols_info_testnet.json'
+    stale = cache_file.stat().st_mtime - info_fetcher_module.SYMBOLS_INFO_DISK_TTL - 1
+    os.utime(cache_file, (stale, stale))
+
+    info_fetcher_module._EXCHANGE_INFO_CACHE.clear()
+    BinanceInfoFetcher('key', 'secret', testnet=True)
+    assert mock_binance_client.get_exchange_info.call_count == 2
+
+def test_corrupted_disk_cache_ignored(mock_binance_client, tmp_path):
+    (tmp_path / 'symbols_info_testnet.json').write_bytes(b'not json')
+    mock_binance_client.get_exchange_info.return_value = EXCHANGE_INFO
+    fetcher = BinanceInfoFetcher('key', 'secret', testnet=True)
+    mock_binance_client.get_exchange_info.assert_called_once()
+    assert 'BTCUSDT' in fetcher.symbols_info
+
+def test_disk_cache_with_missing_fields_ignored(mock_binance_client, tmp_path):
+    (tmp_path / 'symbols_info_testnet.json').write_text('{"BTCUSDT": {"filters": {}}}')
+    mock_binance_client.get_exchange_info.return_value = EXCHANGE_INFO
+    fetcher = BinanceInfoFetcher('key', 'secret', testnet=True)
+    mock_binance_client.get_exchange_info.assert_called_once()
+    assert isinstance(fetcher.symbols_info['BTCUSDT']['filters']['LOT_SIZE']['stepSize'], Decimal)
+
+def test_get_info_fetcher_is_shared(mock_binance_client):
+    mock_binance_client.get_exchange_info.return_value = EXCHANGE_INFO
+    get_info_fetcher.cache_clear()
+    try:
+        fetcher = get_info_fetcher('key', 'secret', True)
+        assert get_info_fetcher('key', 'secret', True) is fetcher
+        assert get_info_fetcher('key', 'secret', False) is not fetcher
+    finally:
+        get_info_fetcher.cache_clear()
+
 def test_process_symbol_success(binance_info_fetcher):
     raw_info = {
         'symbol': 'BTCUSDT',
@@ -77,6 +170,61 @@ def test_process_symbol_missing_filters(binance_info_fetcher):
     processed = binance_info_fetcher._process_symbol(raw_info)
     assert processed['filters']['LOT_SIZE']['minQty'] == Decimal('0.001')
 
+def test_process_symbol_legacy_min_notional(binance_info_fetcher):
+    raw_info = {
+        'symbol': 'BTCUSDT',
+        'baseAsset': 'BTC',
+        'quoteAsset': 'USDT',
+        'filters': [
+            {'filterType': 'PERCENT_PRICE', 'multiplierUp': '5'},
+            {'filterType': 'MIN_NOTIONAL', 'minNotional': '7.5', 'applyMinToMarket': True},
+            {'filterType': 'LOT_SIZE', 'minQty': '0.01', 'stepSize': '0.01'},
+            {'filterType': 'PRICE_FILTER', 'tickSize': '0.1'}
+        ]
+    }
+    processed = binance_info_fetcher._process_symbol(raw_info)
+    assert processed['filters']['NOTIONAL']['minNotional'] == Decimal('7.5')
+    assert processed['filters']['NOTIONAL']['applyToMarket'] is True
+    assert processed['filters']['LOT_SIZE']['stepSize'] == Decimal('0.01')
+    assert processed['filters']['PRICE_FILTER']['tickSize'] == Decimal('0.1')
+
+def test_process_symbol_min_notional_only_ignores_new_flag_name(binance_info_fetcher):
+    raw_info = {
+        'symbol': 'BTCUSDT',
+        'baseAsset': 'BTC',
+        'quoteAsset': 'USDT',
+        'filters': [
+            {'filterType': 'LOT_SIZE', 'minQty': '0.01', 'stepSize': '0.01'},
+            {'filterType': 'PRICE_FILTER', 'tickSize': '0.1'},
+            {'filterType': 'MIN_NOTIONAL', 'minNotional': '7.5', 'applyToMarket': True}
+        ]
+    }
+    processed = binance_info_fetcher._process_symbol(raw_info)
+    assert processed['filters']['NOTIONAL']['minNotional'] == Decimal('7.5')
+    assert processed['filters']['NOTIONAL']['applyToMarket'] is False
+
+def test_process_symbol_prefers_notional_over_min_notional(binance_info_fetcher):
+    raw_info = {
+        'symbol': 'BTCUSDT',
+        'baseAsset': 'BTC',
+        'quoteAsset': 'USDT',
+        'filters': [
+            {'filterType': 'LOT_SIZE', 'minQty': '0.01', 'stepSize': '0.01'},
+            {'filterType': 'PRICE_FILTER', 'tickSize': '0.1'},
+            {'filterType': 'MIN_NOTIONAL', 'minNotional': '7.5', 'applyMinToMarket': False},
+            {'filterType': 'NOTIONAL', 'minNotional': '10.0', 'applyToMarket': True}
+        ]
+    }
+    processed = binance_info_fetcher._process_symbol(raw_info)
+    assert processed['filters']['NOTIONAL']['minNotional'] == Decimal('10.0')
+    assert processed['filters']['NOTIONAL']['applyToMarket'] is True
+
+    # Тот же результат при обратном порядке фильтров
+    raw_info['filters'][2], raw_info['filters'][3] = raw_info['filters'][3], raw_info['filters'][2]
+    processed = binance_info_fetcher._process_symbol(raw_info)
+    assert processed['filters']['NOTIONAL']['minNotional'] == Decimal('10.0')
+    assert processed['filters']['NOTIONAL']['applyToMarket'] is True
+
 def test_process_symbol_key_error(binance_info_fetcher, caplog):
     raw_info = {
         'symbol': 'BTCUSDT',
@@ -91,10 +239,32 @@ def test_get_symbol_info(binance_info_fetcher):
     assert binance_info_fetcher.get_symbol_info('BTCUSDT') == 'test_info'
     assert binance_info_fetcher.get_symbol_info('UNKNOWN') is None
 
+def test_get_symbol_spec(mock_binance_client):
+    mock_binance_client.get_exchange_info.return_value = EXCHANGE_INFO
+    fetcher = BinanceInfoFetcher('key', 'secret', testnet=True)
+    spec = fetcher.get_symbol_spec('BTCUSDT')
+    assert spec.base_asset == 'BTC'
+    assert spec.quote_asset == 'USDT'
+    assert spec.min_qty == Decimal('0.001')
+    assert spec.tick_size == Decimal('0.01')
+    assert spec.min_notional == Decimal('10.0')
+    assert spec.apply_to_market is True
+    assert fetcher.get_symbol_spec('BTCUSDT') is spec
+    assert fetcher.get_symbol_spec('UNKNOWN') is None
+
 def test_get_current_price_success(mock_binance_client, binance_info_fetcher):
-    mock_binance_client.get_symbol_ticker.return_value = {'price': '50000.0'}
+    mock_binance_client.get_symbol_ticker.return_value = [
+        {'symbol': 'BTCUSDT', 'price': '50000.0'},
+        {'symbol': 'ETHUSDT', 'price': '3000.0'}
+    ]
     price = binance_info_fetcher.get_current_price('BTCUSDT')
     assert price == Decimal('50000.0')
+    assert binance_info_fetcher.get_current_price('ETHUSDT') == Decimal('3000.0')
+    mock_binance_client.get_symbol_ticker.assert_called_once_with()
+
+def test_get_current_price_unknown_symbol(mock_binance_client, binance_info_fetcher):
+    mock_binance_client.get_symbol_ticker.return_value = [{'symbol': 'BTCUSDT', 'price': '50000.0'}]
+    assert binance_info_fetcher.get_current_price('UNKNOWN') is None
 
 def test_get_asset_balance_found(mock_binance_client, binance_info_fetcher):
     mock_binance_client.get_account.return_value = {
@@ -110,11 +280,14 @@ def test_get_asset_balance_not_found(mock_binance_client, binance_info_fetcher):
     mock_binance_client.get_account.return_value = {'balances': []}
     assert binance_info_fetcher.get_asset_balance('BTC') is None
 
-def test_get_min_notional_fallback(binance_info_fetcher, caplog):
-    caplog.set_level(logging.INFO)
-    result = binance_info_fetcher._get_min_notional({}, 'BTCUSDT')
-    assert result == Decimal('5')
-    assert 'Using default MIN_NOTIONAL=5 for BTCUSDT' in caplog.text
+def test_get_price_and_balance(mock_binance_client, binance_info_fetcher):
+    mock_binance_client.get_symbol_ticker.return_value = [{'symbol': 'BTCUSDT', 'price': '50000.0'}]
+    mock_binance_client.get_account.return_value = {
+        'balances': [{'asset': 'USDT', 'free': '100.0', 'locked': '0'}]
+    }
+    snapshot = binance_info_fetcher.get_price_and_balance('BTCUSDT', 'USDT')
+    assert snapshot == {'price': Decimal('50000.0'), 'free': Decimal('100.0')}
+    assert binance_info_fetcher.get_price_and_balance('BTCUSDT', 'BNB')['free'] is None
 
 def test_get_exchange_info(mock_binance_client, binance_info_fetcher):
     mock_binance_client.get_exchange_info.return_value = {'timezone': 'UTC'}
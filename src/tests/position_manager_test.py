@@ -171,12 +171,24 @@ def test_add_profit_level_duplicate(position_manager):
 
 def test_sync_with_exchange_zero_balance(position_manager, mock_info_fetcher):
   mock_info_fetcher.get_symbol_info.return_value = {"base_asset": "BTC"}
-  position_manager.client.get_asset_balance.return_value = {"free": "0"}
+  mock_info_fetcher.get_asset_balance.return_value = {"free": Decimal("0"), "locked": Decimal("0")}
 
   position_manager.sync_with_exchange()
+  mock_info_fetcher.get_asset_balance.assert_called_once_with("BTC")
   assert len(position_manager.get_active_positions()) == 0
 
 
+def test_sync_with_exchange_creates_position_from_cached_balance(position_manager, mock_info_fetcher):
+  mock_info_fetcher.get_symbol_info.return_value = {"base_asset": "BTC"}
+  mock_info_fetcher.get_asset_balance.return_value = {"free": Decimal("0.5"), "locked": Decimal("0")}
+  position_manager._get_avg_price = Mock(return_value=Decimal("40000"))
+
+  position_manager.sync_with_exchange()
+  positions = position_manager.get_active_positions()
+  assert len(positions) == 1
+  assert positions[0]["quantity"] == Decimal("0.5")
+
+
 def test_sync_with_exchange_invalid_symbol_info(position_manager, mock_info_fetcher):
   mock_info_fetcher.get_symbol_info.return_value = None
 
@@ -0,0 +1,83 @@
+# tests/core/api/binance_client/test_price_book.py
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock
+from binance import Client
+from src.core.api.binance_client.price_book import PriceBook, get_price_book
+
+
+@pytest.fixture
+def mock_client():
+  client = MagicMock(spec=Client)
+  client.get_symbol_ticker.return_value = [
+    {'symbol': 'BTCUSDT', 'price': '50000.0'},
+    {'symbol': 'ETHUSDT', 'price': '3000.5'}
+  ]
+  return client
+
+
+def test_get_uses_single_bulk_request(mock_client):
+  book = PriceBook(mock_client, ttl=60)
+  assert book.get('BTCUSDT') == Decimal('50000.0')
+  assert book.get('ETHUSDT') == Decimal('3000.5')
+  assert book.get('UNKNOWN') is None
+  mock_client.get_symbol_ticker.assert_called_once_with()
+
+
+def test_get_refreshes_after_ttl(mock_client):
+  book = PriceBook(mock_client, ttl=0)
+  book.get('BTCUSDT')
+  book.get('BTCUSDT')
+  assert mock_client.get_symbol_ticker.call_count == 2
+
+
+def test_invalidate_forces_refresh(mock_client):
+  book = PriceBook(mock_client, ttl=60)
+  book.get('BTCUSDT')
+  book.invalidate()
+  book.get('BTCUSDT')
+  assert mock_client.get_symbol_ticker.call_count == 2
+
+
+def test_api_error_propagates(mock_client):
+  mock_client.get_symbol_ticker.side_effect = Exception('Network down')
+  book = PriceBook(mock_client, ttl=60)
+  with pytest.raises(Exception, match='Network down'):
+    book.get('BTCUSDT')
+
+
+def test_live_quote_takes_priority(mock_client):
+  book = PriceBook(mock_client, ttl=60, live_max_age=60)
+  book.apply_quote('BTCUSDT', Decimal('50100.5'))
+  assert book.get('BTCUSDT') == Decimal('50100.5')
+  mock_client.get_symbol_ticker.assert_not_called()
+  assert book.get('ETHUSDT') == Decimal('3000.5')
+
+
+def test_stale_live_quote_falls_back_to_rest(mock_client):
+  book = PriceBook(mock_client, ttl=60, live_max_age=-1)
+  book.apply_quote('BTCUSDT', Decimal('1'))
+  assert book.get('BTCUSDT') == Decimal('50000.0')
+
+
+def test_clear_live_drops_quotes(mock_client):
+  book = PriceBook(mock_client, ttl=60, live_max_age=60)
+  book.apply_quote('BTCUSDT', Decimal('1'))
+  book.clear_live()
+  assert book.get('BTCUSDT') == Decimal('50000.0')
+
+
+def test_is_fresh_tracks_snapshot_and_live_quotes(mock_client):
+  book = PriceBook(mock_client, ttl=60, live_max_age=60)
+  assert book.is_fresh('BTCUSDT') is False
+  book.apply_quote('SOLUSDT', Decimal('150'))
+  assert book.is_fresh('SOLUSDT') is True
+
+  book.get('BTCUSDT')
+  assert book.is_fresh('BTCUSDT') is True
+  book.invalidate()
+  assert book.is_fresh('BTCUSDT') is False
+
+
+def test_get_price_book_shared_per_client(mock_client):
+  assert get_price_book(mock_client) is get_price_book(mock_client)
@@ -0,0 +1,59 @@
+# tests/core/api/binance_client/test_price_stream.py
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock
+from binance import Client
+from src.core.api.binance_client.price_stream import PriceStream
+
+
+@pytest.fixture
+def mock_client():
+  client = MagicMock(spec=Client)
+  client.testnet = True
+  return client
+
+
+@pytest.fixture
+def price_book():
+  return MagicMock()
+
+
+@pytest.fixture
+def manager_class(mocker):
+  return mocker.patch('src.core.api.binance_client.price_stream.ThreadedWebsocketManager')
+
+
+def test_start_subscribes_book_tickers(mock_client, price_book, manager_class):
+  stream = PriceStream(mock_client, ['BTCUSDT', 'ETHUSDT'], price_book)
+  stream.start()
+
+  manager_class.assert_called_once_with(testnet=True)
+  manager_class.return_value.start_multiplex_socket.assert_called_once_with(
+    callback=stream._handle_message,
+    streams=['btcusdt@bookTicker', 'ethusdt@bookTicker']
+  )
+
+
+def test_stop_clears_live_prices(mock_client, price_book, manager_class):
+  stream = PriceStream(mock_client, ['BTCUSDT'], price_book)
+  stream.start()
+  stream.stop()
+
+  manager_class.return_value.stop.assert_called_once()
+  price_book.clear_live.assert_called_once()
+
+
+def test_book_ticker_updates_mid_price(mock_client, price_book):
+  stream = PriceStream(mock_client, ['BTCUSDT'], price_book)
+  stream._handle_message({
+    'stream': 'btcusdt@bookTicker',
+    'data': {'u': 1, 's': 'BTCUSDT', 'b': '50000.00', 'B': '1', 'a': '50001.00', 'A': '2'}
+  })
+  price_book.apply_quote.assert_called_once_with('BTCUSDT', Decimal('50000.5'))
+
+
+def test_stream_error_falls_back_to_rest(mock_client, price_book):
+  stream = PriceStream(mock_client, ['BTCUSDT'], price_book)
+  stream._handle_message({'e': 'error', 'm': 'connection lost'})
+  price_book.clear_live.assert_called_once()
+  price_book.apply_quote.assert_not_called()
@@ -0,0 +1,59 @@
+# tests/core/api/binance_client/test_rate_limiter.py
+import pytest
+from src.core.api.binance_client import rate_limiter as rate_limiter_module
+from src.core.api.binance_client.rate_limiter import RequestWeightLimiter
+
+
+class FakeClock:
+  def __init__(self):
+    self.now = 1000.0
+    self.sleeps = []
+
+  def monotonic(self):
+    return self.now
+
+  def sleep(self, seconds):
+    self.sleeps.append(seconds)
+    self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+  fake = FakeClock()
+  monkeypatch.setattr(rate_limiter_module.time, 'monotonic', fake.monotonic)
+  monkeypatch.setattr(rate_limiter_module.time, 'sleep', fake.sleep)
+  return fake
+
+
+def test_acquire_within_budget_does_not_sleep(clock):
+  limiter = RequestWeightLimiter(limit=60, window=60.0)
+  for _ in range(3):
+    limiter.acquire(20)
+  assert clock.sleeps == []
+
+
+def test_acquire_waits_for_refill(clock):
+  limiter = RequestWeightLimiter(limit=60, window=60.0)
+  limiter.acquire(60)
+  limiter.acquire(10)
+  assert clock.sleeps == [pytest.approx(10.0)]
+
+
+def test_update_used_weight_drains_bucket(clock):
+  limiter = RequestWeightLimiter(limit=60, window=60.0)
+  limiter.update_used_weight(55)
+  limiter.acquire(10)
+  assert clock.sleeps == [pytest.approx(5.0)]
+
+
+def test_block_for_pauses_requests(clock):
+  limiter = RequestWeightLimiter(limit=60, window=60.0)
+  limiter.block_for(30.0)
+  limiter.acquire(1)
+  assert clock.sleeps == [pytest.approx(30.0)]
+
+
+def test_weight_above_limit_is_capped(clock):
+  limiter = RequestWeightLimiter(limit=10, window=10.0)
+  limiter.acquire(50)
+  assert clock.sleeps == []
@@ -0,0 +1,106 @@
+# tests/core/api/binance_client/test_rest_client.py
+import pytest
+from unittest.mock import MagicMock
+from binance import Client
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from src.core.api.binance_client.rest_client import BinanceRestClient, endpoint_weight, get_rest_client
+from src.core.settings.config import HTTP_POOL_MAXSIZE
+
+
+def make_response(status_code=200, content=b''):
+  response = MagicMock()
+  response.status_code = status_code
+  response.content = content
+  response.text = content.decode()
+  return response
+
+
+def test_handle_response_parses_json():
+  response = make_response(content=b'{"symbol": "BTCUSDT", "price": "50000.0"}')
+  assert BinanceRestClient._handle_response(response) == {'symbol': 'BTCUSDT', 'price': '50000.0'}
+
+
+def test_handle_response_empty_body():
+  assert BinanceRestClient._handle_response(make_response(content=b'')) == {}
+
+
+def test_handle_response_invalid_json():
+  with pytest.raises(BinanceRequestException):
+    BinanceRestClient._handle_response(make_response(content=b'<html>'))
+
+
+def test_handle_response_api_error():
+  response = make_response(status_code=400, content=b'{"code": -1121, "msg": "Invalid symbol."}')
+  with pytest.raises(BinanceAPIException):
+    BinanceRestClient._handle_response(response)
+
+
+@pytest.fixture
+def rest_client():
+  client = BinanceRestClient('key', 'secret', ping=False)
+  client.weight_limiter = MagicMock()
+  return client
+
+
+def test_endpoint_weight():
+  assert endpoint_weight('https://api.binance.com/api/v3/exchangeInfo') == 20
+  assert endpoint_weight('https://testnet.binance.vision/api/v3/order') == 1
+  assert endpoint_weight('https://api.binance.com/api/v3/ping') == 1
+
+
+def test_request_acquires_endpoint_weight(rest_client, mocker):
+  mocker.patch.object(Client, '_request', return_value={'balances': []})
+  result = rest_client._request('get', 'https://api.binance.com/api/v3/account', True)
+  assert result == {'balances': []}
+  rest_client.weight_limiter.acquire.assert_called_once_with(20)
+
+
+def test_session_tracks_used_weight(rest_client):
+  assert rest_client._track_weight in rest_client.session.hooks['response']
+  response = make_response(content=b'{}')
+  response.headers = {'x-mbx-used-weight-1m': '1500'}
+  rest_client._track_weight(response)
+  rest_client.weight_limiter.update_used_weight.assert_called_once_with(1500)
+  rest_client.weight_limiter.block_for.assert_not_called()
+
+
+def test_rate_limited_response_blocks_limiter(rest_client):
+  response = make_response(status_code=429, content=b'{}')
+  response.headers = {'Retry-After': '7'}
+  rest_client._track_weight(response)
+  rest_client.weight_limiter.block_for.assert_called_once_with(7.0)
+
+
+def test_session_uses_sized_pool(rest_client):
+  adapter = rest_client.session.get_adapter('https://api.binance.com/api/v3/ping')
+  assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+
+
+def test_exchange_info_is_cached(rest_client, mocker):
+  download = mocker.patch.object(Client, 'get_exchange_info', return_value={'symbols': [{'symbol': 'BTCUSDT'}]})
+
+  assert rest_client.get_exchange_info() is rest_client.get_exchange_info()
+  assert rest_client.get_symbol_info('btcusdt') == {'symbol': 'BTCUSDT'}
+  download.assert_called_once_with()
+
+  rest_client.invalidate_exchange_info()
+  rest_client.get_exchange_info()
+  assert download.call_count == 2
+
+
+def test_empty_exchange_info_is_not_cached(rest_client, mocker):
+  download = mocker.patch.object(Client, 'get_exchange_info', return_value={'symbols': []})
+  rest_client.get_exchange_info()
+  rest_client.get_exchange_info()
+  assert download.call_count == 2
+
+
+def test_get_rest_client_is_shared(mocker):
+  mocker.patch.object(BinanceRestClient, 'ping')
+  get_rest_client.cache_clear()
+  try:
+    client = get_rest_client('key', 'secret', True)
+    assert get_rest_client('key', 'secret', True) is client
+    assert get_rest_client('other', 'secret', True) is not client
+  finally:
+    get_rest_client.cache_clear()
@@ -0,0 +1,82 @@
+# tests/core/api/binance_client/test_symbol_spec.py
+import random
+from decimal import Decimal, ROUND_DOWN
+from src.core.api.binance_client.symbol_spec import SymbolSpec, build_symbol_spec, floor_to_step, is_step_multiple
+
+
+def test_build_symbol_spec_from_raw_filters():
+  spec = build_symbol_spec('BTCUSDT', 'BTC', 'USDT', {
+    'LOT_SIZE': {'minQty': '0.00100000', 'stepSize': '0.00100000'},
+    'PRICE_FILTER': {'tickSize': '0.01000000'},
+    'NOTIONAL': {'minNotional': '10.00000000', 'applyToMarket': False}
+  })
+  assert isinstance(spec, SymbolSpec)
+  assert spec.min_qty == Decimal('0.001')
+  assert spec.step_size.as_tuple().exponent == -3
+  assert spec.tick_size.as_tuple().exponent == -2
+  assert spec.min_notional == Decimal('10')
+  assert spec.apply_to_market is False
+  assert spec.min_qty_float == 0.001
+  assert spec.min_notional_float == 10.0
+
+
+def test_build_symbol_spec_legacy_min_notional():
+  spec = build_symbol_spec('ETHBTC', 'ETH', 'BTC', {
+    'MIN_NOTIONAL': {'minNotional': '0.0001', 'applyMinToMarket': False}
+  })
+  assert spec.min_notional == Decimal('0.0001')
+  assert spec.apply_to_market is False
+
+
+def test_build_symbol_spec_defaults():
+  spec = build_symbol_spec('BTCUSDT', 'BTC', 'USDT', {})
+  assert spec.min_qty == Decimal('0.001')
+  assert spec.step_size == Decimal('0.001')
+  assert spec.tick_size == Decimal('0.01')
+  assert spec.min_notional == Decimal('5.0')
+  assert spec.apply_to_market is True
+
+
+def test_build_symbol_spec_scaled_units():
+  spec = build_symbol_spec('BTCUSDT', 'BTC', 'USDT', {
+    'LOT_SIZE': {'minQty': '0.00001000', 'stepSize': '0.00001000'},
+    'PRICE_FILTER': {'tickSize': '10.00000000'}
+  })
+  assert (spec.qty_scale, spec.step_units) == (100000, 1)
+  assert (spec.price_scale, spec.tick_units) == (1, 10)
+
+
+def test_build_symbol_spec_reuses_parsed_steps():
+  filters = {'LOT_SIZE': {'minQty': '0.001', 'stepSize': '0.00100000'}}
+  first = build_symbol_spec('BTCUSDT', 'BTC', 'USDT', filters)
+  second = build_symbol_spec('ETHUSDT', 'ETH', 'USDT', filters)
+  assert first.step_size is second.step_size
+  assert (first.qty_scale, first.step_units) == (1000, 1)
+
+
+def test_floor_to_step_matches_decimal_quantize():
+  rng = random.Random(42)
+  for step_str in ('0.00000001', '0.00001', '0.001', '0.01', '1', '10'):
+    spec = build_symbol_spec('X', 'A', 'B', {'LOT_SIZE': {'stepSize': step_str}})
+    values = [0.29, 1.23, 0.1 + 0.2, 2.675, 123.456789, 50000.129]
+    values += [round(rng.uniform(0, 1000), rng.randint(0, 10)) for _ in range(2000)]
+    for value in values:
+      expected = float(Decimal(str(value)).quantize(spec.step_size, ROUND_DOWN))
+      assert floor_to_step(value, spec.qty_scale, spec.step_units) == expected, (value, step_str)
+
+
+def test_is_step_multiple_matches_decimal_modulo():
+  rng = random.Random(7)
+  for tick_str in ('0.00000001', '0.00001', '0.01', '0.5', '1', '10'):
+    spec = build_symbol_spec('X', 'A', 'B', {'PRICE_FILTER': {'tickSize': tick_str}})
+    values = [50000.12, 50000.125, 2.5, 30.0, 0.00000123]
+    values += [round(rng.uniform(0, 100000), rng.randint(0, 9)) for _ in range(2000)]
+    for value in values:
+      expected = Decimal(str(value)) % spec.tick_size == 0
+      assert is_step_multiple(value, spec.price_scale, spec.tick_units) == expected, (value, tick_str)
+
+
+def test_is_step_multiple_tolerates_float_noise():
+  spec = build_symbol_spec('X', 'A', 'B', {'PRICE_FILTER': {'tickSize': '0.1'}})
+  assert is_step_multiple(0.1 + 0.2, spec.price_scale, spec.tick_units)
+  assert not is_step_multiple(0.35, spec.price_scale, spec.tick_units)
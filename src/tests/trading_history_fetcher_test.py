@@ -1,11 +1,13 @@
 # tests/core/api/binance_client/test_trading_history_fetcher.py
+import asyncio
 import pytest
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, AsyncMock, call
 from binance import Client, exceptions
 from datetime import datetime, timezone
 import logging
 from src.core.api.binance_client.trading_history_fetcher import (
   BinanceTradingHistoryFetcher,
+  AsyncBinanceTradingHistoryFetcher,
   BinanceHistoryError
 )
 from src.core.settings.config import SYMBOLS, MAX_HISTORY_LIMIT
@@ -15,7 +17,7 @@ from src.core.settings.config import SYMBOLS, MAX_HISTORY_LIMIT
 def mock_client(mocker):
   mock = MagicMock(spec=Client)
   mocker.patch(
-    'src.core.api.binance_client.trading_history_fetcher.Client',
+    'src.core.api.binance_client.trading_history_fetcher.get_rest_client',
     return_value=mock
   )
   return mock
@@ -24,7 +26,9 @@ def mock_client(mocker):
 @pytest.fixture
 def history_fetcher(mock_client):
   fetcher = BinanceTradingHistoryFetcher()
-  mock_client.get_symbol_info.return_value = {'symbol': 'MOCKED'}
+  mock_client.get_exchange_info.return_value = {
+    'symbols': [{'symbol': symbol} for symbol in SYMBOLS]
+  }
   return fetcher
 
 
@@ -88,9 +92,12 @@ def test_get_all_trades_history_success(mock_client, history_fetcher):
   assert len(result) == 2
   assert result[0]['symbol'] == 'ETHUSDT'
   assert result[1]['symbol'] == 'BTCUSDT'
-  assert mock_client.get_my_trades.call_args_list == [
-    call(symbol=symbol, limit=2) for symbol in SYMBOLS
-  ]
+  # Запросы выполняются параллельно, поэтому порядок вызовов не фиксирован
+  assert mock_client.get_my_trades.call_count == len(SYMBOLS)
+  mock_client.get_my_trades.assert_has_calls(
+    [call(symbol=symbol, limit=2) for symbol in SYMBOLS],
+    any_order=True
+  )
 
 
 def test_validate_params_valid(history_fetcher):
@@ -107,6 +114,19 @@ def test_validate_params_invalid_limit(history_fetcher):
     history_fetcher._validate_params('BTCUSDT', 0)
 
 
+def test_validate_params_loads_exchange_symbols_once(mock_client, history_fetcher):
+  history_fetcher._validate_params('BTCUSDT', 10)
+  history_fetcher._validate_params('ETHUSDT', 10)
+  mock_client.get_exchange_info.assert_called_once()
+  mock_client.get_symbol_info.assert_not_called()
+
+
+def test_validate_params_symbol_not_on_exchange(mock_client, history_fetcher):
+  mock_client.get_exchange_info.return_value = {'symbols': [{'symbol': 'BTCUSDT'}]}
+  with pytest.raises(ValueError, match="Invalid symbol: ETHUSDT"):
+    history_fetcher._validate_params('ETHUSDT', 10)
+
+
 def test_process_trades_success(history_fetcher):
   # Arrange
   raw_trades = [create_mock_trade('BTCUSDT', 1630000000000)]
@@ -119,6 +139,15 @@ def test_process_trades_success(history_fetcher):
   assert result[0]['time'].year == 2021
 
 
+def test_process_trades_time_is_utc_aware(history_fetcher):
+  raw_trades = [create_mock_trade('BTCUSDT', 1630000000123)]
+
+  result = history_fetcher._process_trades(raw_trades)
+
+  assert result[0]['time'] == datetime(2021, 8, 26, 17, 46, 40, 123000, tzinfo=timezone.utc)
+  assert result[0]['time'].tzinfo is timezone.utc
+
+
 def test_process_trades_missing_key(history_fetcher, caplog):
   # Arrange
   invalid_trade = {'id': 1, 'price': '50000'}
@@ -158,4 +187,63 @@ def test_custom_exception_handling(mock_client, history_fetcher):
 def test_max_limit_config(history_fetcher):
   # Act & Assert
   with pytest.raises(ValueError):
-    history_fetcher.get_all_trades_history(limit=MAX_HISTORY_LIMIT + 100)
\ No newline at end of file
+    history_fetcher.get_all_trades_history(limit=MAX_HISTORY_LIMIT + 100)
+
+
+@pytest.fixture
+def mock_async_client(mocker):
+  client = MagicMock()
+  client.get_exchange_info = AsyncMock(return_value={
+    'symbols': [{'symbol': symbol} for symbol in SYMBOLS]
+  })
+  client.get_my_trades = AsyncMock(return_value=[])
+  client.close_connection = AsyncMock()
+  mocker.patch(
+    'src.core.api.binance_client.trading_history_fetcher.AsyncClient.create',
+    AsyncMock(return_value=client)
+  )
+  mocker.patch('src.core.api.binance_client.trading_history_fetcher.aiohttp.TCPConnector')
+  return client
+
+
+def test_async_get_all_trades_history(mock_async_client):
+  async def fake_trades(symbol, limit):
+    if symbol == 'ETHUSDT':
+      raise Exception('Test error')
+    return [create_mock_trade(symbol, 1630000000000 + SYMBOLS.index(symbol) * 1000)]
+
+  mock_async_client.get_my_trades.side_effect = fake_trades
+
+  result = AsyncBinanceTradingHistoryFetcher().get_all_trades_history(limit=3)
+
+  assert [trade['symbol'] for trade in result] == ['ADAUSDT', 'SOLUSDT', 'BNBUSDT']
+  assert mock_async_client.get_my_trades.await_count == len(SYMBOLS)
+  mock_async_client.get_exchange_info.assert_awaited_once()
+  mock_async_client.close_connection.assert_awaited_once()
+
+
+def test_async_get_trade_history_invalid_symbol(mock_async_client):
+  with pytest.raises(BinanceHistoryError):
+    AsyncBinanceTradingHistoryFetcher().get_trade_history('INVALID', limit=10)
+  mock_async_client.get_my_trades.assert_not_called()
+  mock_async_client.close_connection.assert_awaited_once()
+
+
+def test_async_client_reused_between_fetches(mock_async_client):
+  from src.core.api.binance_client import trading_history_fetcher as module
+  fetcher = AsyncBinanceTradingHistoryFetcher()
+
+  async def two_commands():
+    await fetcher.fetch_all_trades_history(limit=3)
+    await fetcher.fetch_all_trades_history(limit=3)
+    await fetcher.close()
+
+  asyncio.run(two_commands())
+  module.AsyncClient.create.assert_awaited_once()
+  mock_async_client.get_exchange_info.assert_awaited_once()
+  mock_async_client.close_connection.assert_awaited_once()
+
+
+def test_async_validation_before_client_fails_loudly():
+  with pytest.raises(RuntimeError, match="not loaded yet"):
+    AsyncBinanceTradingHistoryFetcher()._validate_params(SYMBOLS[0], 10)
@@ -5,19 +5,23 @@ from decimal import Decimal
 from binance import Client, exceptions
 import logging
 import json
+from src.core.settings.config import SAFETY_MARGIN, INVALID_SYMBOL_TTL
+from src.core.api.binance_client.symbol_spec import build_symbol_spec
 from src.core.api.binance_client.transactions_executor import (
   TransactionsExecutor,
   OrderExecutionError,
   OrderCancelError,
   InsufficientFundsError,
   InvalidSymbolError,
-  InvalidOrderParameters
+  InvalidOrderParameters,
+  get_transactions_executor,
+  _dump_response
 )
 
 
 @pytest.fixture
 def mock_client_class(mocker):
-  client_class_mock = mocker.patch('src.core.api.binance_client.transactions_executor.Client')
+  client_class_mock = mocker.patch('src.core.api.binance_client.transactions_executor.get_rest_client')
   instance_mock = MagicMock(spec=Client)
   client_class_mock.return_value = instance_mock
   return instance_mock
@@ -28,6 +32,19 @@ def executor(mock_client_class):
   ex.logger = MagicMock(spec=logging.Logger)
   return ex
 
+def test_executor_uses_injected_client(mock_client_class):
+  injected = MagicMock(spec=Client)
+  ex = TransactionsExecutor(client=injected)
+  assert ex.client is injected
+
+def test_get_transactions_executor_is_shared(mock_client_class):
+  get_transactions_executor.cache_clear()
+  try:
+    assert get_transactions_executor() is get_transactions_executor()
+    assert get_transactions_executor().client is mock_client_class
+  finally:
+    get_transactions_executor.cache_clear()
+
 def set_default_filters_and_price(ex_instance, min_qty_str='0.001', min_notional_str='5.0', current_price_val=50000.0, apply_to_market_val=True):
     ex_instance._get_symbol_filters = MagicMock(return_value={
         'filters': {
@@ -64,6 +81,57 @@ def test_get_symbol_filters_cache(executor, mock_client_class):
   assert 'LOT_SIZE' in result1['filters']
 
 
+def test_get_symbol_filters_bulk_preload(executor, mock_client_class):
+  mock_client_class.get_exchange_info.return_value = {
+    'symbols': [
+      {'symbol': 'BTCUSDT', 'baseAsset': 'BTC', 'quoteAsset': 'USDT',
+       'filters': [{'filterType': 'LOT_SIZE', 'minQty': '0.001', 'stepSize': '0.001'}]},
+      {'symbol': 'ETHUSDT', 'baseAsset': 'ETH', 'quoteAsset': 'USDT',
+       'filters': [{'filterType': 'LOT_SIZE', 'minQty': '0.01', 'stepSize': '0.01'}]}
+    ]
+  }
+
+  assert executor._get_symbol_filters('BTCUSDT')['base_asset'] == 'BTC'
+  assert executor._get_symbol_filters('ETHUSDT')['filters']['LOT_SIZE']['stepSize'] == '0.01'
+  with pytest.raises(InvalidSymbolError):
+    executor._get_symbol_filters('UNKNOWN')
+
+  mock_client_class.get_exchange_info.assert_called_once_with()
+  mock_client_class.get_symbol_info.assert_not_called()
+
+
+def test_symbol_cache_keeps_only_used_filters(executor, mock_client_class):
+  mock_client_class.get_exchange_info.return_value = {
+    'symbols': [
+      {'symbol': 'BTCUSDT', 'baseAsset': 'BTC', 'quoteAsset': 'USDT',
+       'filters': [
+         {'filterType': 'LOT_SIZE', 'minQty': '0.001', 'stepSize': '0.001'},
+         {'filterType': 'ICEBERG_PARTS', 'limit': 10},
+         {'filterType': 'MAX_NUM_ORDERS', 'maxNumOrders': 200}
+       ]}
+    ]
+  }
+
+  filters = executor._get_symbol_filters('BTCUSDT')['filters']
+  assert set(filters) == {'LOT_SIZE'}
+
+
+def test_invalid_symbol_is_cached_until_ttl(executor, mock_client_class, mocker):
+  mock_client_class.get_exchange_info.side_effect = exceptions.BinanceRequestException('down')
+  mock_client_class.get_symbol_info.return_value = None
+  clock = mocker.patch('src.core.api.binance_client.transactions_executor.time.monotonic', return_value=100.0)
+
+  for _ in range(3):
+    with pytest.raises(InvalidSymbolError):
+      executor._get_symbol_filters('UNKNOWN')
+  mock_client_class.get_symbol_info.assert_called_once_with('UNKNOWN')
+
+  clock.return_value = 100.0 + INVALID_SYMBOL_TTL
+  with pytest.raises(InvalidSymbolError):
+    executor._get_symbol_filters('UNKNOWN')
+  assert mock_client_class.get_symbol_info.call_count == 2
+
+
 def test_format_quantity(executor, mock_client_class):
   executor._get_symbol_filters = MagicMock(return_value={
     'filters': {'LOT_SIZE': {'stepSize': '0.01'}},
@@ -73,6 +141,32 @@ def test_format_quantity(executor, mock_client_class):
   assert formatted == 1.23
 
 
+def test_format_quantity_caches_step(executor, mock_client_class):
+  executor._get_symbol_filters = MagicMock(return_value={
+    'filters': {'LOT_SIZE': {'stepSize': '0.01000000'}, 'PRICE_FILTER': {'tickSize': '0.10000000'}},
+    'base_asset': 'BTC', 'quote_asset': 'USDT'
+  })
+  assert executor._format_quantity('BTCUSDT', 1.234567) == 1.23
+  assert executor._format_quantity('BTCUSDT', 2.345678) == 2.34
+  assert executor._format_price('BTCUSDT', 50000.129) == 50000.1
+  executor._get_symbol_filters.assert_called_once_with('BTCUSDT')
+
+
+def test_format_and_validate_with_explicit_spec(executor, mock_client_class):
+  spec = build_symbol_spec('BTCUSDT', 'BTC', 'USDT', {
+    'LOT_SIZE': {'minQty': '0.01', 'stepSize': '0.01'},
+    'PRICE_FILTER': {'tickSize': '0.1'}
+  })
+  executor._get_symbol_filters = MagicMock()
+
+  assert executor._format_quantity('BTCUSDT', 1.239, spec) == 1.23
+  assert executor._format_price('BTCUSDT', 100.19, spec) == 100.1
+  executor._validate_order_parameters(
+    'BTCUSDT', Client.SIDE_BUY, 1.23, Client.ORDER_TYPE_LIMIT, price=100.1, spec=spec
+  )
+  executor._get_symbol_filters.assert_not_called()
+
+
 def test_execute_order_success(executor, mock_client_class):
   set_default_filters_and_price(executor)
   mock_client_instance = mock_client_class
@@ -97,6 +191,163 @@ def test_execute_order_success(executor, mock_client_class):
   mock_client_instance.create_order.assert_called_once()
 
 
+def test_execute_market_buy_fetches_price_once(executor, mock_client_class):
+  set_default_filters_and_price(executor)
+  mock_client_class.create_order.return_value = {
+    'orderId': 1,
+    'status': 'FILLED',
+    'fills': [{'qty': '0.01', 'price': '50000', 'commission': '0', 'commissionAsset': 'BNB'}]
+  }
+
+  executor.execute_order('BTCUSDT', Client.SIDE_BUY, 0.01)
+
+  executor.get_current_price.assert_called_once_with('BTCUSDT')
+  executor.get_available_balance.assert_called_once_with('USDT')
+
+
+@pytest.mark.parametrize("price_fresh, balance_fresh, concurrent", [
+  (False, False, True),
+  (True, False, False),
+  (False, True, False),
+])
+def test_execute_market_order_prefetches_only_when_both_books_stale(
+  executor, mock_client_class, mocker, price_fresh, balance_fresh, concurrent
+):
+  set_default_filters_and_price(executor)
+  mocker.patch.object(executor._price_book, 'is_fresh', return_value=price_fresh)
+  mocker.patch.object(executor._balance_book, 'is_fresh', return_value=balance_fresh)
+  submit = mocker.spy(executor._prefetch_pool, 'submit')
+  mock_client_class.create_order.return_value = {
+    'orderId': 1,
+    'status': 'FILLED',
+    'fills': [{'qty': '0.01', 'price': '50000', 'commission': '0', 'commissionAsset': 'BNB'}]
+  }
+
+  executor.execute_order('BTCUSDT', Client.SIDE_BUY, 0.01)
+
+  assert submit.called is concurrent
+  executor.get_current_price.assert_called_once_with('BTCUSDT')
+  executor.get_available_balance.assert_called_once_with('USDT')
+
+
+def test_execute_order_skips_response_dump_above_debug(executor, mock_client_class, mocker):
+  set_default_filters_and_price(executor)
+  executor.logger = logging.getLogger('TransactionsExecutorQuiet')
+  executor.logger.setLevel(logging.INFO)
+  dumps = mocker.patch('src.core.api.binance_client.transactions_executor._dump_response')
+  mock_client_class.create_order.return_value = {
+    'orderId': 1,
+    'status': 'FILLED',
+    'fills': [{'qty': '0.01', 'price': '50000', 'commission': '0', 'commissionAsset': 'BNB'}]
+  }
+
+  executor.execute_order('BTCUSDT', Client.SIDE_BUY, 0.01)
+
+  dumps.assert_not_called()
+
+
+def test_execute_order_keeps_raw_response_only_for_debug(executor, mock_client_class):
+  set_default_filters_and_price(executor)
+  response = {
+    'orderId': 1,
+    'status': 'FILLED',
+    'fills': [{'qty': '0.01', 'price': '50000', 'commission': '0', 'commissionAsset': 'BNB'}]
+  }
+  mock_client_class.create_order.return_value = response
+
+  executor.logger = logging.getLogger('TransactionsExecutorRawQuiet')
+  executor.logger.setLevel(logging.INFO)
+  assert executor.execute_order('BTCUSDT', Client.SIDE_BUY, 0.01)['raw_response'] is None
+
+  executor.logger.setLevel(logging.DEBUG)
+  assert executor.execute_order('BTCUSDT', Client.SIDE_BUY, 0.01)['raw_response'] is response
+
+
+def test_execute_order_aggregates_fills(executor, mock_client_class):
+  set_default_filters_and_price(executor)
+  mock_client_class.create_order.return_value = {
+    'orderId': 7,
+    'status': 'FILLED',
+    'fills': [
+      {'qty': '0.100', 'price': '50000.00', 'commission': '0.0001', 'commissionAsset': 'BNB'},
+      {'qty': '0.200', 'price': '50300.00', 'commission': '0.0002', 'commissionAsset': 'BNB'}
+    ]
+  }
+
+  result = executor.execute_order('BTCUSDT', Client.SIDE_BUY, 0.3)
+
+  assert result['executed_qty'] == 0.3
+  assert result['avg_price'] == 50200.0
+  assert result['commission'] == pytest.approx(0.0003)
+  assert result['commission_asset'] == 'BNB'
+
+
+def test_execute_orders_keeps_input_order(executor, mock_client_class):
+  def fake_get_spec(symbol):
+    if symbol == 'BADUSDT':
+      raise InvalidSymbolError("Invalid symbol: BADUSDT")
+    return build_symbol_spec(symbol, symbol[:-4], 'USDT', {})
+
+  def fake_execute(symbol, side, quantity, **kwargs):
+    if symbol == 'BADUSDT':
+      raise InvalidSymbolError("Invalid symbol: BADUSDT")
+    return {'symbol': symbol, 'side': side, 'executed_qty': quantity, 'success': True}
+
+  executor._get_symbol_spec = MagicMock(side_effect=fake_get_spec)
+  executor.get_current_price = MagicMock(return_value=100.0)
+  executor.get_available_balance = MagicMock(return_value=1000.0)
+  executor.execute_order = MagicMock(side_effect=fake_execute)
+  results = executor.execute_orders([
+    {'symbol': 'BTCUSDT', 'side': Client.SIDE_BUY, 'quantity': 0.1},
+    {'symbol': 'BADUSDT', 'side': Client.SIDE_SELL, 'quantity': 1.0},
+    {'symbol': 'ETHUSDT', 'side': Client.SIDE_SELL, 'quantity': 2.0}
+  ])
+
+  assert [r['symbol'] for r in results] == ['BTCUSDT', 'BADUSDT', 'ETHUSDT']
+  assert results[0]['success'] is True
+  assert results[1]['success'] is False
+  assert 'Invalid symbol: BADUSDT' in results[1]['error']
+  assert results[2]['executed_qty'] == 2.0
+  assert executor.execute_orders([]) == []
+
+
+def test_execute_orders_shares_snapshot_and_reserves_funds(executor, mock_client_class):
+  executor._get_symbol_spec = MagicMock(side_effect=lambda symbol: build_symbol_spec(symbol, 'BTC', 'USDT', {}))
+  executor.get_current_price = MagicMock(return_value=100.0)
+  executor.get_available_balance = MagicMock(return_value=1000.0)
+  executor.execute_order = MagicMock(return_value={'success': True})
+
+  executor.execute_orders([
+    {'symbol': 'BTCUSDT', 'side': Client.SIDE_BUY, 'quantity': 4.0},
+    {'symbol': 'BTCUSDT', 'side': Client.SIDE_BUY, 'quantity': 4.0},
+    {'symbol': 'BTCUSDT', 'side': Client.SIDE_BUY, 'quantity': 1.0, 'order_type': Client.ORDER_TYPE_LIMIT, 'price': 90.0}
+  ])
+
+  executor.get_current_price.assert_called_once_with('BTCUSDT')
+  executor.get_available_balance.assert_called_once_with('USDT')
+  balances = [c.kwargs['available_balance'] for c in executor.execute_order.call_args_list]
+  assert sorted(balances, reverse=True) == pytest.approx([1000.0, 1000.0 - 4 * 100 * SAFETY_MARGIN, 1000.0 - 8 * 100 * SAFETY_MARGIN])
+
+
+def test_dump_response_matches_json():
+  response = {'orderId': 1, 'status': 'FILLED', 'fills': [{'qty': '0.01', 'price': '50000'}]}
+
+  assert json.loads(_dump_response(response)) == response
+  assert json.loads(_dump_response(response, indent=True)) == response
+  assert '\n  "orderId"' in _dump_response(response, indent=True)
+
+
+def test_execute_order_balance_checks_use_safety_margin(executor, mock_client_class):
+  set_default_filters_and_price(executor, current_price_val=100.0)
+
+  # 1.0 * 100 * SAFETY_MARGIN не покрывается балансом 100
+  with pytest.raises(InsufficientFundsError):
+    executor.execute_order('BTCUSDT', Client.SIDE_BUY, 1.0, available_balance=100.0)
+  with pytest.raises(InsufficientFundsError):
+    executor.execute_order('BTCUSDT', Client.SIDE_SELL, 1.0, available_balance=0.999)
+  mock_client_class.create_order.assert_not_called()
+
+
 def test_cancel_order_success(executor, mock_client_class):
   mock_client_instance = mock_client_class
   mock_client_instance.cancel_order.return_value = {'status': 'CANCELED'}
@@ -120,9 +371,11 @@ def test_get_available_balance(executor, mock_client_class):
 
 def test_get_current_price(executor, mock_client_class):
   mock_client_instance = mock_client_class
-  mock_client_instance.get_symbol_ticker.return_value = {'price': '50000.0'}
+  mock_client_instance.get_symbol_ticker.return_value = [{'symbol': 'BTCUSDT', 'price': '50000.0'}]
   price = executor.get_current_price('BTCUSDT')
   assert price == 50000.0
+  assert executor.get_current_price('UNKNOWN') == 0.0
+  mock_client_instance.get_symbol_ticker.assert_called_once_with()
 
 
 def test_invalid_symbol_error(executor, mock_client_class):
@@ -132,6 +385,22 @@ def test_invalid_symbol_error(executor, mock_client_class):
     executor._get_symbol_filters('INVALID')
 
 
+def test_execute_order_keeps_typed_errors(executor, mock_client_class):
+  mock_client_class.get_exchange_info.return_value = {'symbols': [
+    {'symbol': 'BTCUSDT', 'baseAsset': 'BTC', 'quoteAsset': 'USDT', 'filters': []}
+  ]}
+  with pytest.raises(InvalidSymbolError):
+    executor.execute_order('UNKNOWN', Client.SIDE_BUY, 1.0)
+  mock_client_class.create_order.assert_not_called()
+
+
+def test_validation_does_not_mask_unexpected_errors(executor, mock_client_class):
+  set_default_filters_and_price(executor)
+  executor.get_current_price.side_effect = RuntimeError('boom')
+  with pytest.raises(RuntimeError, match='boom'):
+    executor._validate_order_parameters('BTCUSDT', Client.SIDE_BUY, 1.0, Client.ORDER_TYPE_MARKET)
+
+
 def test_market_order_without_price(executor, mock_client_class):
   set_default_filters_and_price(executor)
   try:
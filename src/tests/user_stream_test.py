@@ -0,0 +1,58 @@
+# tests/core/api/binance_client/test_user_stream.py
+import pytest
+from unittest.mock import MagicMock
+from binance import Client
+from src.core.api.binance_client.user_stream import UserDataStream
+
+
+@pytest.fixture
+def mock_client():
+  client = MagicMock(spec=Client)
+  client.API_KEY = 'key'
+  client.API_SECRET = 'secret'
+  client.testnet = True
+  return client
+
+
+@pytest.fixture
+def balance_book():
+  return MagicMock()
+
+
+@pytest.fixture
+def manager_class(mocker):
+  return mocker.patch('src.core.api.binance_client.user_stream.ThreadedWebsocketManager')
+
+
+def test_start_subscribes_and_enables_live_mode(mock_client, balance_book, manager_class):
+  stream = UserDataStream(mock_client, balance_book)
+  stream.start()
+
+  manager_class.assert_called_once_with(api_key='key', api_secret='secret', testnet=True)
+  manager = manager_class.return_value
+  manager.start.assert_called_once()
+  manager.start_user_socket.assert_called_once_with(callback=stream._handle_message)
+  balance_book.set_live.assert_called_once_with(True)
+
+
+def test_stop_disables_live_mode(mock_client, balance_book, manager_class):
+  stream = UserDataStream(mock_client, balance_book)
+  stream.start()
+  stream.stop()
+
+  manager_class.return_value.stop.assert_called_once()
+  balance_book.set_live.assert_called_with(False)
+
+
+def test_account_position_updates_balances(mock_client, balance_book):
+  stream = UserDataStream(mock_client, balance_book)
+  balances = [{'a': 'USDT', 'f': '950.0', 'l': '0.0'}]
+  stream._handle_message({'e': 'outboundAccountPosition', 'E': 1, 'u': 1, 'B': balances})
+  balance_book.apply_updates.assert_called_once_with(balances)
+
+
+def test_stream_error_falls_back_to_rest(mock_client, balance_book):
+  stream = UserDataStream(mock_client, balance_book)
+  stream._handle_message({'e': 'error', 'm': 'connection lost'})
+  balance_book.set_live.assert_called_once_with(False)
+  balance_book.apply_updates.assert_not_called()